@@ -25,6 +25,7 @@ The intent here is to make the ``Beam`` class as generic as possible for use
 with multiple design codes.
 """
 
+import hashlib
 import itertools
 from typing import List, Union, Tuple
 
@@ -32,6 +33,7 @@ import numpy as np
 
 from beamdesign.element import Element
 from beamdesign.const import LoadComponents
+from beamdesign.loadcase import get_components
 from beamdesign.utility.exceptions import (
     ElementError,
     ElementCaseError,
@@ -42,6 +44,10 @@ from beamdesign.utility.exceptions import (
 )
 from beamdesign.sections.section import Section
 
+# the tolerance, in local positions, within which a position is treated as being at a
+# stored load position.
+STATION_TOLERANCE = 1e-9
+
 
 class Beam:
     """
@@ -49,6 +55,11 @@ class Beam:
     wrapper object around at least 1x ``Element`` object which corresponds to
     (for example) an FEA beam element. This allows a ``Beam`` object to correspond to
     multiple FEA elements (as will often be the case in a real design scenario).
+
+    The list of elements that make up a ``Beam`` cannot be changed once it is created.
+    Quantities derived from the elements (such as their start & end positions) are
+    cached, and the cache is discarded whenever ``Beam.version`` changes (i.e. when the
+    length or section of any of the elements is changed).
     """
 
     def __init__(self, *, elements: Union[Element, List[Element]]):
@@ -73,7 +84,121 @@ class Beam:
 
         self._check_elements(elements=elements)
 
-        self._elements = elements
+        self._elements = tuple(elements)
+
+        self._cache = {}
+        self._cache_version = None
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that changes every time any of the ``Element`` objects that make up
+        the ``Beam`` are modified. As each ``Element.version`` only ever increases, this
+        is the sum of the ``Element`` versions.
+
+        :return: The version of the ``Beam``.
+        """
+
+        return sum(e.version for e in self._elements)
+
+    @property
+    def section_version(self) -> int:
+        """
+        A counter that changes every time the length or section of any of the
+        ``Element`` objects that make up the ``Beam`` are modified, but not when only
+        their loads are modified. See ``Element.section_version``.
+
+        :return: The section version of the ``Beam``.
+        """
+
+        return sum(e.section_version for e in self._elements)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        A stable hash of the contents of the ``Beam``: the length & section of each
+        ``Element`` (including the section's material properties) and the content of
+        every ``LoadCase``. Unlike ``version``, identical ``Beam`` objects have identical
+        hashes, even in different processes or sessions, so this can be used to reuse
+        results calculated for an identical ``Beam``.
+
+        The hash of the lengths & loads is cached until the ``Beam`` is modified. The
+        sections are hashed every time (see ``section_hash``), as ``Section`` objects
+        can be modified without the ``Beam`` being notified.
+
+        :return: The hash, as a hex string.
+        """
+
+        def build():
+
+            h = hashlib.blake2b(digest_size=16)
+
+            for e in self._elements:
+
+                length = None if e.length is None else float(e.length)
+
+                h.update(repr(length).encode())
+
+                for l in sorted(e.loads, key=repr):
+                    h.update(repr(l).encode())
+                    h.update(e.loads[l].content_hash.encode())
+
+            return h.hexdigest()
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(self._cached("content_hash", build).encode())
+        h.update(self.section_hash.encode())
+
+        return h.hexdigest()
+
+    @property
+    def section_hash(self) -> str:
+        """
+        A stable hash of the section of each ``Element`` (see
+        ``Section.content_hash``). This is recalculated every time it is accessed, as
+        ``Section`` objects can be modified without the ``Beam`` being notified. Each
+        ``Section`` object is only hashed once.
+
+        :return: The hash, as a hex string.
+        """
+
+        h = hashlib.blake2b(digest_size=16)
+        hashes = {}
+
+        for e in self._elements:
+
+            section = e.section
+
+            if id(section) not in hashes:
+                hashes[id(section)] = (
+                    repr(None) if section is None else section.content_hash
+                )
+
+            h.update(hashes[id(section)].encode())
+
+        return h.hexdigest()
+
+    def _cached(self, key, function):
+        """
+        Helper method to get a cached value, recalculating it with the provided
+        function if it has not yet been calculated or if the ``Beam`` has been modified
+        since it was calculated.
+
+        :param key: The key to store the value under.
+        :param function: A function with no arguments that calculates the value.
+        :return: The cached value.
+        """
+
+        version = self.version
+
+        if self._cache_version != version:
+            self._cache = {}
+            self._cache_version = version
+
+        if key not in self._cache:
+            self._cache[key] = function()
+
+        return self._cache[key]
 
     def _check_elements(self, *, elements: List[Element]):
         """
@@ -124,11 +249,12 @@ class Beam:
             )
 
     @property
-    def elements(self) -> List[Element]:
+    def elements(self) -> Tuple[Element, ...]:
         """
         Return the elements that make up the ``Beam``.
 
-        :return: Returns the elements that make up the ``Beam``.
+        :return: Returns the elements that make up the ``Beam``, as a tuple so that they
+            cannot be replaced.
         """
 
         return self._elements
@@ -141,7 +267,7 @@ class Beam:
         :return: Returns the length of the ``Beam`` object.
         """
 
-        return sum([e.length for e in self.elements])
+        return self._cached("length", lambda: sum([e.length for e in self.elements]))
 
     @property
     def no_elements(self) -> int:
@@ -200,18 +326,30 @@ class Beam:
         :return: The element starting & ending points.
         """
 
+        starts_ends = self._cached("element_ends", self._element_ends)
+
+        return [list(start_end) for start_end in starts_ends]
+
+    def _element_ends(self) -> List[Tuple[float, float]]:
+        """
+        Helper method to calculate the ``Element`` starting & ending points for
+        ``Beam.element_ends``.
+
+        :return: The element starting & ending points.
+        """
+
         starts_ends = []
 
         for i, e in enumerate(self.elements):
 
             if i == 0:
-                starts_ends += [[0.0, e.length]]
+                starts_ends += [(0.0, e.length)]
 
             else:
 
                 prev_end = starts_ends[i - 1][1]
 
-                starts_ends += [[prev_end, prev_end + e.length]]
+                starts_ends += [(prev_end, prev_end + e.length)]
 
         return starts_ends
 
@@ -233,7 +371,7 @@ class Beam:
         :return: Returns a List of the start & end postions [start, end]
         """
 
-        return self.element_ends[element]
+        return list(self._cached("element_ends", self._element_ends)[element])
 
     def in_elements(self, *, position: float) -> List[int]:
         """
@@ -253,9 +391,7 @@ class Beam:
 
         ret_list = []
 
-        for i in range(0, len(self.elements)):
-
-            start_end = self.get_element_start_end(element=i)
+        for i, start_end in enumerate(self.element_ends):
 
             if position >= start_end[0] and position <= start_end[1]:
                 ret_list += [i]
@@ -550,6 +686,209 @@ class Beam:
 
         return position_list, element_list, local_position_list
 
+    def station_positions(self, *, load_cases: List[int] = None) -> np.ndarray:
+        """
+        Returns the unique *real* positions along the ``Beam`` at which loads are
+        stored in any of the given load cases, as well as all ``Element`` starts & ends.
+        Between these positions all loads vary linearly.
+
+        :param load_cases: The load cases to consider. If ``None``, all load cases are
+            considered.
+        :return: A sorted numpy array of unique positions between 0.0 and
+            ``Beam.length``.
+        """
+
+        positions = []
+
+        for (start, end), e in zip(self.element_ends, self.elements):
+
+            local = e.station_positions(load_cases=load_cases)
+
+            positions += [start + local * (end - start)]
+
+        positions = np.unique(np.concatenate(positions))
+
+        # floating point errors can push the final position a fraction past the end of
+        # the beam.
+        return np.clip(positions, 0.0, self.length)
+
+    def load_envelope(
+        self, *, load_cases: List[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the maximum & minimum of each load component anywhere along the
+        ``Beam``, in any of the given load cases. As loads vary linearly between the
+        stored load positions these are found directly from the stored loads, without
+        interpolation.
+
+        The envelope is cached until the ``Beam`` is modified.
+
+        :param load_cases: The load cases to consider. If ``None``, all load cases are
+            considered.
+        :return: A tuple of arrays of the maximum & minimum of each component, in the
+            order [VX, VY, N, MX, MY, T]:
+
+            (
+                np.array([VX_max, VY_max, N_max, MX_max, MY_max, T_max]),
+                np.array([VX_min, VY_min, N_min, MX_min, MY_min, T_min]),
+            )
+        """
+
+        if load_cases is None:
+            load_cases = self.load_cases
+
+        def build():
+
+            # empty load cases have zero load.
+            loads = [np.zeros((1, 6))]
+
+            for e in self.elements:
+                for l in load_cases:
+
+                    load = e.loads[l].loads
+
+                    if load is not None:
+                        loads += [load[:, 1:]]
+
+            loads = np.concatenate(loads, axis=0)
+
+            return np.max(loads, axis=0), np.min(loads, axis=0)
+
+        return self._cached(("load_envelope", tuple(load_cases)), build)
+
+    def assessment_positions(
+        self, *, min_positions: int, load_cases: List[int] = None
+    ) -> np.ndarray:
+        """
+        Returns a grid of positions along the ``Beam`` at which to assess all the given
+        load cases. This is the union of ``min_positions`` equally spaced positions,
+        all ``Element`` starts & ends and the load positions of every given load case,
+        so that the discontinuities in every load case are included.
+
+        The grid is cached, so it is only built once for each combination of
+        ``min_positions`` and ``load_cases``, until the ``Beam`` is modified.
+
+        :param min_positions: The minimum no. of equally spaced positions.
+        :param load_cases: The load cases to consider. If ``None``, all load cases are
+            considered.
+        :return: A sorted numpy array of unique positions between 0.0 and
+            ``Beam.length``.
+        """
+
+        if load_cases is None:
+            load_cases = self.load_cases
+
+        def build():
+
+            positions = np.union1d(
+                np.linspace(0.0, self.length, min_positions),
+                self.station_positions(load_cases=load_cases),
+            )
+            positions.flags.writeable = False
+
+            return positions
+
+        return self._cached(
+            ("assessment_positions", min_positions, tuple(load_cases)), build
+        )
+
+    def get_loads_multi_case(
+        self,
+        *,
+        position: Union[List[float], float, np.ndarray],
+        load_cases: List[int] = None,
+        component: Union[int, str, LoadComponents, List[LoadComponents]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        A vectorised method to get the loads in a ``Beam`` in multiple load cases at
+        once.
+
+        Rows are returned for each ``Element`` that a position falls into, in the same
+        way as ``Beam.list_positions``. Where any of the load cases has multiple stored
+        loads at a position (i.e. a load discontinuity) the position is repeated so
+        that every load case can return all its loads in an identically shaped array.
+        The first row at a position in a given ``Element`` is always the load
+        approaching from the start of the ``Element`` and the last row is always the
+        load leaving towards the end of the ``Element``.
+
+        :param position: The positions at which to return the loads, as *real*
+            positions between 0.0 and ``Beam.length``. Duplicates are ignored and the
+            positions are sorted.
+        :param load_cases: The load cases to get the loads in. If ``None``, all load
+            cases are returned.
+        :param component: The component/s of load to return. If ``None``, all
+            components are returned.
+        :return: A tuple of numpy arrays:
+
+            (
+                [beam_position_0, ..., beam_position_n],
+                [element_0, ..., element_n],
+                loads,
+            )
+
+            where ``loads`` has the shape (no. load cases, no. positions,
+            no. components).
+        """
+
+        if load_cases is None:
+            load_cases = self.load_cases
+
+        position = np.unique(np.asarray(position, dtype=float).reshape(-1))
+
+        if np.any(position < 0) or np.any(position > self.length):
+            raise PositionNotInBeamError(
+                f"Expected position to be > 0 or < the length of the beam. "
+                + f"Provided positions were{position}, beam length is"
+                + f" {self.length}."
+            )
+
+        components = [c.value - 1 for c in get_components(component)]
+
+        position_list = []
+        element_list = []
+        load_list = []
+
+        for i, ((start, end), e) in enumerate(zip(self.element_ends, self.elements)):
+
+            in_element = position[(position >= start) & (position <= end)]
+
+            if in_element.shape[0] == 0:
+                continue
+
+            if e.length == 0:
+                # a zero length element has all of its stations at the one position.
+                local = e.station_positions(load_cases=load_cases)
+                real = np.full(local.shape, in_element[0])
+            else:
+                local = np.clip((in_element - start) / e.length, 0.0, 1.0)
+
+                # converting real positions back to local positions introduces
+                # rounding errors (i.e. 0.2 * 1.5 / 1.5 != 0.2). Snap positions onto
+                # any stored load position within a tolerance so that the loads either
+                # side of a discontinuity are returned rather than interpolated over.
+                local = _snap_positions(
+                    position=local,
+                    stations=e.station_positions(load_cases=load_cases),
+                )
+                local, unique = np.unique(local, return_index=True)
+                real = in_element[unique]
+
+            index, loads = e.get_loads_multi_case(position=local, load_cases=load_cases)
+
+            position_list += [real[index]]
+            element_list += [np.full(index.shape, i)]
+            load_list += [loads[..., components]]
+
+        positions = np.concatenate(position_list)
+        elements = np.concatenate(element_list)
+        loads = np.concatenate(load_list, axis=1)
+
+        # elements are processed in order, so a stable sort keeps the rows at any
+        # element boundaries in element order.
+        order = np.argsort(positions, kind="stable")
+
+        return positions[order], elements[order], loads[:, order, :]
+
     def get_section(
         self,
         position: Union[List[float], float],
@@ -583,6 +922,96 @@ class Beam:
 
         return (position, elements)
 
+    @property
+    def section_runs(self) -> List[Tuple[float, float, Section]]:
+        """
+        Returns the sections along the ``Beam`` as runs of adjacent ``Element`` objects
+        that share the same ``Section`` object. Most beams have only 1-3 runs, so
+        calculations that depend only on the section can be done once per run rather
+        than once per position.
+
+        Return is a list of the form:
+
+        [(start_0, end_0, section_0)
+         (start_1, end_1, section_1)
+         ...
+         (start_n, end_n, section_n)
+         ]
+
+        :return: The section runs along the ``Beam``.
+        """
+
+        return list(self._cached("section_runs", self._section_runs)[0])
+
+    @property
+    def element_section_runs(self) -> np.ndarray:
+        """
+        The index of the section run (see ``Beam.section_runs``) that each ``Element``
+        belongs to.
+
+        :return: An array of the run index of each ``Element``.
+        """
+
+        return self._cached("section_runs", self._section_runs)[1].copy()
+
+    def _section_runs(self) -> Tuple[List[Tuple[float, float, Section]], np.ndarray]:
+        """
+        Helper method to calculate the section runs for ``Beam.section_runs``.
+
+        :return: A tuple of the section runs and an array of the run that each
+            ``Element`` belongs to.
+        """
+
+        runs = []
+        element_runs = []
+
+        for (start, end), e in zip(self.element_ends, self.elements):
+
+            if runs and runs[-1][2] is e.section:
+                runs[-1] = (runs[-1][0], end, e.section)
+            else:
+                runs += [(start, end, e.section)]
+
+            element_runs += [len(runs) - 1]
+
+        return runs, np.array(element_runs, dtype=int)
+
+    def get_section_runs(
+        self,
+        position: Union[List[float], float] = None,
+        min_positions: int = None,
+        load_case: int = None,
+    ) -> Tuple[List[float], np.ndarray, List[Tuple[float, float, Section]]]:
+        """
+        A run-length version of ``Beam.get_section``. Returns the section runs along the
+        ``Beam`` (see ``Beam.section_runs``) and the index of the run at each position,
+        such that ``get_section`` is equivalent to:
+
+            [runs[r][2] for r in run_index]
+
+        :param position: A provided position or positions to check.
+        :param min_positions: The minimum no. of positions to return.
+        :param load_case: The load case to consider if using min_positions. Can be
+            ``None``, in which case only the start & ends of elements are returned.
+        :return: Returns a tuple of positions, run indices and runs:
+
+            (
+                [pos_1, ..., pos_n]
+                [run_1, ..., run_n]
+                [(start_0, end_0, section_0), ..., (start_m, end_m, section_m)]
+            )
+        """
+
+        position, element_ids, _ = self.list_positions(
+            position=position, min_positions=min_positions, load_case=load_case
+        )
+
+        runs, element_runs = self._cached("section_runs", self._section_runs)
+
+        run_index = element_runs[np.asarray(element_ids, dtype=int)]
+
+        return (position, run_index, list(runs))
+
     @classmethod
     def empty_beam(cls, length: float = 0, section: Section = None) -> "Beam":
         """
@@ -606,3 +1035,30 @@ class Beam:
             + f"no. load cases={self.no_load_cases}"
             + f")"
         )
+
+
+def _snap_positions(
+    *, position: np.ndarray, stations: np.ndarray, tolerance: float = None
+) -> np.ndarray:
+    """
+    Helper function to snap local positions onto the nearest station position, where
+    they are within a tolerance of it.
+
+    :param position: A sorted numpy array of local positions.
+    :param stations: A sorted numpy array of at least 2 unique station positions.
+    :param tolerance: The tolerance within which positions are snapped. If ``None``,
+        ``STATION_TOLERANCE`` is used.
+    :return: The snapped positions.
+    """
+
+    if tolerance is None:
+        tolerance = STATION_TOLERANCE
+
+    index = np.clip(np.searchsorted(stations, position), 1, stations.shape[0] - 1)
+
+    left = stations[index - 1]
+    right = stations[index]
+
+    nearest = np.where(position - left <= right - position, left, right)
+
+    return np.where(np.abs(nearest - position) <= tolerance, nearest, position)
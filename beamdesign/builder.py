@@ -0,0 +1,280 @@
+"""
+Contains functions for building ``Beam`` objects in bulk from the output of an FEA
+model.
+
+FEA models are generally described by element connectivity (the nodes at either end of
+each element) rather than by ordered lists of elements. The functions in this module
+convert connectivity and whole-model load arrays into ``Beam`` objects, ordering the
+elements in each member end to end and reversing any elements that point the wrong way.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+from beamdesign.sections.section import Section
+from beamdesign.utility.exceptions import BeamAssemblyError
+
+
+def assemble_beams(
+    *,
+    node_i: Sequence[int],
+    node_j: Sequence[int],
+    tags: Sequence[Any],
+    lengths: Sequence[float],
+    loads: np.ndarray,
+    load_cases: List[int] = None,
+    sections: Union[Section, Sequence[Section]] = None,
+    reversal_factors: Sequence[float] = None,
+) -> Dict[Any, Beam]:
+    """
+    Assembles ``Beam`` objects from element connectivity.
+
+    All elements with the same member tag are assembled into a single ``Beam``. The
+    elements in each member must form a single, unbranched chain. The direction of each
+    ``Beam`` follows the direction of the first element of the member (in the order
+    provided), and any elements pointing in the opposite direction are reversed.
+
+    :param node_i: The node at the start of each element.
+    :param node_j: The node at the end of each element.
+    :param tags: The member tag of each element.
+    :param lengths: The length of each element.
+    :param loads: The loads on every element in every load case, as a numpy array of
+        shape (no. load cases, no. elements, no. stations, 7). The last axis takes the
+        same format as the loads in a ``LoadCase``:
+
+        [pos, vx, vy, N, mx, my, T]
+
+        where pos is the local position along the element between 0.0 and 1.0.
+    :param load_cases: The IDs to give the load cases. If ``None``, the load cases are
+        numbered 0, 1, ..., n.
+    :param sections: The section of each element, or a single section to use for all
+        elements.
+    :param reversal_factors: Factors applied to the 6x load components of any element
+        that is reversed. Sign conventions for internal actions vary between FEA
+        programs, so by default no factors are applied and only the load positions are
+        reversed.
+    :return: A dictionary of ``Beam`` objects, keyed by member tag.
+    """
+
+    node_i = np.asarray(node_i)
+    node_j = np.asarray(node_j)
+    tags = np.asarray(tags)
+    lengths = np.asarray(lengths, dtype=float)
+    loads = np.asarray(loads, dtype=float)
+
+    no_elements = node_i.shape[0]
+
+    if not (node_j.shape[0] == tags.shape[0] == lengths.shape[0] == no_elements):
+        raise BeamAssemblyError(
+            f"Expected node_i, node_j, tags and lengths to have the same length. "
+            + f"Lengths were {node_i.shape[0]}, {node_j.shape[0]}, {tags.shape[0]} "
+            + f"and {lengths.shape[0]}."
+        )
+
+    if loads.ndim != 4 or loads.shape[1] != no_elements or loads.shape[3] != 7:
+        raise BeamAssemblyError(
+            f"Expected loads to be an array of shape "
+            + f"(no. load cases, {no_elements}, no. stations, 7). "
+            + f"Shape was {loads.shape}."
+        )
+
+    if load_cases is None:
+        load_cases = list(range(loads.shape[0]))
+
+    if len(load_cases) != loads.shape[0]:
+        raise BeamAssemblyError(
+            f"Expected {loads.shape[0]} load case IDs, got {len(load_cases)}."
+        )
+
+    if sections is None or isinstance(sections, Section):
+        sections = [sections] * no_elements
+
+    members = chain_elements(node_i=node_i, node_j=node_j, tags=tags)
+
+    is_reversed = np.zeros(no_elements, dtype=bool)
+
+    for order, reverse in members.values():
+        is_reversed[order] = reverse
+
+    loads = reverse_loads(
+        loads=loads, reverse=is_reversed, reversal_factors=reversal_factors
+    )
+
+    beams = {}
+
+    for tag, (order, reverse) in members.items():
+
+        elements = [
+            Element(
+                loads={
+                    case: LoadCase(loads=loads[c, e])
+                    for c, case in enumerate(load_cases)
+                },
+                length=lengths[e],
+                section=sections[e],
+            )
+            for e in order
+        ]
+
+        beams[tag] = Beam(elements=elements)
+
+    return beams
+
+
+def chain_elements(
+    *, node_i: Sequence[int], node_j: Sequence[int], tags: Sequence[Any]
+) -> Dict[Any, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Orders the elements of each member end to end, in a single pass over the
+    connectivity.
+
+    :param node_i: The node at the start of each element.
+    :param node_j: The node at the end of each element.
+    :param tags: The member tag of each element.
+    :return: A dictionary keyed by member tag, of tuples:
+
+        (
+            the element indices in order along the member,
+            a boolean array indicating if each of these elements is reversed,
+        )
+    """
+
+    node_i = np.asarray(node_i)
+    node_j = np.asarray(node_j)
+    tags = np.asarray(tags)
+
+    # group the elements by member tag, keeping the original order within each member.
+    unique_tags, inverse = np.unique(tags, return_inverse=True)
+    grouped = np.argsort(inverse, kind="stable")
+    bounds = np.searchsorted(inverse[grouped], np.arange(unique_tags.shape[0] + 1))
+
+    members = {}
+
+    for t, tag in enumerate(unique_tags):
+
+        elements = grouped[bounds[t] : bounds[t + 1]].tolist()
+
+        members[tag.item()] = _chain_member(
+            tag=tag, elements=elements, node_i=node_i, node_j=node_j
+        )
+
+    return members
+
+
+def _chain_member(
+    *, tag, elements: List[int], node_i: np.ndarray, node_j: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper function for ``chain_elements`` that orders the elements of a single member.
+
+    :param tag: The member tag (used for error reporting).
+    :param elements: The indices of the elements in the member, in input order.
+    :param node_i: The node at the start of every element in the model.
+    :param node_j: The node at the end of every element in the model.
+    :return: A tuple of the ordered element indices and whether they are reversed.
+    """
+
+    connections = {}
+
+    for e in elements:
+        connections.setdefault(node_i[e].item(), []).append(e)
+        connections.setdefault(node_j[e].item(), []).append(e)
+
+    ends = []
+
+    for node, connected in connections.items():
+
+        if len(connected) > 2:
+            raise BeamAssemblyError(
+                f"Member {tag} branches at node {node}. Members must form a single "
+                + f"chain of elements."
+            )
+
+        if len(connected) == 1:
+            ends += [node]
+
+    if len(ends) != 2:
+        raise BeamAssemblyError(
+            f"Member {tag} does not form a single open chain of elements. "
+            + f"It has {len(ends)} free ends."
+        )
+
+    node = ends[0]
+    previous = None
+
+    order = []
+    reverse = []
+
+    while True:
+
+        following = [e for e in connections[node] if e != previous]
+
+        if len(following) == 0:
+            break
+
+        e = following[0]
+
+        forwards = node_i[e].item() == node
+
+        order += [e]
+        reverse += [not forwards]
+
+        node = node_j[e].item() if forwards else node_i[e].item()
+        previous = e
+
+    if len(order) != len(elements):
+        raise BeamAssemblyError(
+            f"Member {tag} is not connected. Only {len(order)} of its "
+            + f"{len(elements)} elements form a chain."
+        )
+
+    order = np.array(order, dtype=int)
+    reverse = np.array(reverse, dtype=bool)
+
+    # keep the first element of the member (in input order) facing forwards.
+    if reverse[order == elements[0]][0]:
+        order = order[::-1]
+        reverse = ~reverse[::-1]
+
+    return order, reverse
+
+
+def reverse_loads(
+    *,
+    loads: np.ndarray,
+    reverse: np.ndarray,
+    reversal_factors: Sequence[float] = None,
+) -> np.ndarray:
+    """
+    Reverses the direction of the loads on the elements flagged in ``reverse``, by
+    reversing the order of the stations and mapping each local position p to 1.0 - p.
+
+    Reversing the order of the stations also reverses the order of rows at any load
+    discontinuities, so the value approaching from the new start of the element remains
+    first.
+
+    :param loads: The loads on every element in every load case, as a numpy array of
+        shape (no. load cases, no. elements, no. stations, 7).
+    :param reverse: A boolean array of shape (no. elements, ) flagging the elements to
+        reverse.
+    :param reversal_factors: Factors applied to the 6x load components of any element
+        that is reversed. If ``None``, no factors are applied.
+    :return: A new array of loads, of the same shape as ``loads``.
+    """
+
+    loads = np.array(loads, dtype=float)
+    reverse = np.asarray(reverse, dtype=bool)
+
+    flipped = loads[:, reverse, ::-1, :]
+    flipped[..., 0] = 1.0 - flipped[..., 0]
+
+    if reversal_factors is not None:
+        flipped[..., 1:] *= np.asarray(reversal_factors, dtype=float)
+
+    loads[:, reverse] = flipped
+
+    return loads
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module calculates the capacity of a section under combined actions to as4100
+Section 8.
+
+Unlike the other as4100 modules the functions in this module are written with numpy
+so that they broadcast. This allows the interaction of all load cases at all positions
+to be evaluated in a single array expression, as combined actions require every load
+component at once.
+
+Units are assumed to be based on SI units:
+
+Length: m,
+Time: s
+Mass: kg
+Force: N.
+
+Important derived units:
+Moment: Nm
+Stress: Pa
+
+Note that this contradicts current Australian Practice which uses kN, MPa etc.
+However conversion is simple in most cases because the formulas are written
+in consistent systems of units.
+"""
+
+from typing import Union
+
+import numpy as np
+
+# section capacity methods
+
+# region
+
+
+def s8_3_φN(
+    *,
+    N: Union[np.ndarray, float],
+    φN_t: Union[np.ndarray, float],
+    φN_s: Union[np.ndarray, float],
+) -> np.ndarray:
+    """
+    Selects the axial capacity to use in the combined actions checks of as4100 S8.3:
+    the tension capacity where the axial load is tensile, and the compression section
+    capacity where the axial load is compressive.
+
+    :param N: The axial load in N. Tension is positive.
+    :param φN_t: The design tension capacity in N.
+    :param φN_s: The design compression section capacity in N.
+    :return: The axial capacity in N, broadcast to the shape of the inputs.
+    """
+
+    return np.where(np.asarray(N) >= 0.0, φN_t, φN_s)
+
+
+def s8_3_4_interaction(
+    *,
+    N: Union[np.ndarray, float],
+    M_x: Union[np.ndarray, float],
+    M_y: Union[np.ndarray, float],
+    φN: Union[np.ndarray, float],
+    φM_sx: Union[np.ndarray, float],
+    φM_sy: Union[np.ndarray, float],
+) -> np.ndarray:
+    """
+    Calculates the combined actions interaction ratio of a section under axial load
+    and biaxial bending, to the linear interaction equation of as4100 S8.3.4:
+
+    N / φN + M_x / φM_sx + M_y / φM_sy <= 1.0
+
+    This equation applies to any section. As it is linear in the applied loads, the
+    ratio is also the utilisation (the factor by which the loads must be increased
+    for the section to fail).
+
+    :param N: The axial load in N.
+    :param M_x: The moment about the x axis in Nm.
+    :param M_y: The moment about the y axis in Nm.
+    :param φN: The design axial capacity in N (see ``s8_3_φN``).
+    :param φM_sx: The design section moment capacity about the x axis in Nm.
+    :param φM_sy: The design section moment capacity about the y axis in Nm.
+    :return: The interaction ratio, broadcast to the shape of the inputs.
+    """
+
+    return np.abs(N) / φN + np.abs(M_x) / φM_sx + np.abs(M_y) / φM_sy
+
+
+# endregion
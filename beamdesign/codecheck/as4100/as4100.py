@@ -4,7 +4,9 @@ themselves. Specific equations from the code have been split off into other file
 minimise the size of this file.
 """
 
-from typing import List, Union, Dict, Tuple
+import copy
+import functools
+from typing import Any, List, Union, Dict, Tuple
 from pathlib import Path
 
 import numpy as np
@@ -12,36 +14,67 @@ import toml
 
 from beamdesign.beam import Beam
 from beamdesign.codecheck.codecheck import CodeCheck
+from beamdesign.codecheck.kernel import (
+    CheckKernel,
+    iterative_utilisation,
+    ratio_utilisation,
+)
+from beamdesign.codecheck.utilisation import Utilisation
 from beamdesign.sections.section import Section
+from beamdesign.codecheck.as4100 import S5, S5_Shear, S6, S8
 from beamdesign.codecheck.as4100.as4100_sect_props import AS4100Section
-from beamdesign.utility.exceptions import SectionOnlyError
-from beamdesign.utility.solvers import secant
+from beamdesign.materials.material import Material
+from beamdesign.utility.exceptions import (
+    CodeCheckError,
+    PositionNotInBeamError,
+    SectionOnlyError,
+)
 from beamdesign.const import LoadComponents
 
+# the parsed default value files, keyed by file path, as tuples of (mtime, values). These
+# are shared by all AS4100 objects in the process so each file is only parsed once.
+_DEFAULTS_CACHE: Dict[str, Tuple[int, Dict[str, any]]] = {}
+
+# named profiles of default values registered with AS4100.register_profile.
+_PROFILES: Dict[str, Dict[str, any]] = {}
+
 
 class AS4100(CodeCheck):
     def __init__(
-        self, *, φ_steel: float, αu: float, kt: float, beam: Beam = None, section=None
+        self,
+        *,
+        φ_steel: float,
+        αu: float,
+        kt: float,
+        beam: Beam = None,
+        section=None,
+        restraints: Union[List[float], float] = None,
+        k_ex: float = 1.0,
+        k_ey: float = 1.0,
     ):
         """
 
         :param beam:
         :param section:
         :param kwargs:
+        :param restraints: The positions of any intermediate restraints against member
+            buckling along the beam. The start & end of the beam are always treated as
+            restraints. The same restraints are used for both axes.
+        :param k_ex: The effective length factor about the x axis, to as4100 S6.3.2.
+        :param k_ey: The effective length factor about the y axis, to as4100 S6.3.2.
         """
 
         super().__init__(beam=beam, section=section)
 
-        as4100_sects = []
-
-        for s in self.sections:
-            as4100_sects += [AS4100Section.AS4100_sect_factory(section=s)]
-
-        self._as4100_sections = as4100_sects
-
         self.φ_steel = φ_steel
         self.αu = αu
         self.kt = kt
+        self.restraints = restraints
+        self.k_ex = k_ex
+        self.k_ey = k_ey
+
+        # build the AS4100Sections now so that any invalid sections raise errors early.
+        self.as4100_sections
 
     @property
     def sections(self) -> List[Section]:
@@ -56,104 +89,898 @@ class AS4100(CodeCheck):
         that self.sections[n] is the basis for self.as4100_sections[n].
         """
 
-        return self._as4100_sections
+        return self._cached(
+            "as4100_sections",
+            lambda: [
+                AS4100Section.AS4100_sect_factory(section=s) for s in self.sections
+            ],
+        )
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+
+        restraints = (
+            None
+            if self.restraints is None
+            else np.atleast_1d(np.asarray(self.restraints, dtype=float)).tolist()
+        )
+
+        return {
+            **super().parameters,
+            "φ_steel": self.φ_steel,
+            "αu": self.αu,
+            "kt": self.kt,
+            "restraints": restraints,
+            "k_ex": self.k_ex,
+            "k_ey": self.k_ey,
+        }
+
+    def _cache_state(self) -> tuple:
+        """
+        The state that cached values depend on. In addition to the sections and lengths
+        of the ``Beam`` elements, the AS4100 capacities depend on φ_steel, αu, kt, the
+        restraints and the effective length factors.
+        """
+
+        restraints = (
+            None
+            if self.restraints is None
+            else tuple(np.atleast_1d(np.asarray(self.restraints, dtype=float)))
+        )
+
+        return super()._cache_state() + (
+            self.φ_steel,
+            self.αu,
+            self.kt,
+            restraints,
+            self.k_ex,
+            self.k_ey,
+        )
+
+    def _element_capacities(self) -> Dict[str, np.ndarray]:
+        """
+        Helper method to calculate the section capacities (tension, compression, shear &
+        moment) of every element.
+        Capacities are only calculated once for each run of elements with the same
+        section.
+
+        :return: A dictionary of arrays of the capacity of each element, with keys
+            "Nty", "Ntu", "φNt", "Ns", "φNs", "Vvx", "Vvy", "φVvx", "φVvy", "Msx",
+            "Msy", "φMsx" & "φMsy".
+        """
+
+        first_elements, element_runs = self._section_runs()
+        sections = [self.as4100_sections[e] for e in first_elements]
+
+        Nty = np.array([self.s7_2_Nty(Ag=s.Ag, fy=s.min_fy) for s in sections])
+        Ntu = np.array(
+            [
+                self.s7_2_Ntu(An=s.An, fu=s.min_fu, kt=self.kt, αu=self.αu)
+                for s in sections
+            ]
+        )
+
+        Ns = np.array(
+            [
+                S6.s6_2_N_s(A_e=S6.s6_2_A_e(A_n=s.An, k_f=s.kf), f_y=s.min_fy)
+                for s in sections
+            ]
+        )
+        Vvx = np.array([self.s5_11_Vv(section=s, axis="x") for s in sections])
+        Vvy = np.array([self.s5_11_Vv(section=s, axis="y") for s in sections])
+
+        Msx = np.array([S5.s5_2_M_s(f_y=s.min_fy, Z_e=s.Zex) for s in sections])
+        Msy = np.array([S5.s5_2_M_s(f_y=s.min_fy, Z_e=s.Zey) for s in sections])
+
+        return {
+            "Nty": Nty[element_runs],
+            "Ntu": Ntu[element_runs],
+            "φNt": self.φ_steel * np.minimum(Nty, Ntu)[element_runs],
+            "Ns": Ns[element_runs],
+            "φNs": self.φ_steel * Ns[element_runs],
+            "Vvx": Vvx[element_runs],
+            "Vvy": Vvy[element_runs],
+            "φVvx": self.φ_steel * Vvx[element_runs],
+            "φVvy": self.φ_steel * Vvy[element_runs],
+            "Msx": Msx[element_runs],
+            "Msy": Msy[element_runs],
+            "φMsx": self.φ_steel * Msx[element_runs],
+            "φMsy": self.φ_steel * Msy[element_runs],
+        }
+
+    @staticmethod
+    def s5_11_Vv(*, section: AS4100Section, axis: str) -> float:
+        """
+        Calculates the shear capacity of a section to as4100 S5.11, for shear in the
+        given direction. This is the shear yield capacity of S5.11.4, reduced for any
+        non-uniform shear distribution (S5.11.3) and for shear buckling of any slender
+        web (S5.11.5).
+
+        :param section: The AS4100Section to calculate the capacity of.
+        :param axis: The direction of the shear, "x" or "y".
+        :return: The shear capacity Vv, excluding φ.
+        """
+
+        if section.section.is_circle and section.section.is_hollow:
+            V_w = S5_Shear.s5_11_4_V_w_CHS(A_e=section.An, f_y=section.min_fy)
+        else:
+            A_w = section.Awx if axis == "x" else section.Awy
+
+            V_w = section.α_vma * S5_Shear.s5_11_4_V_w_Generic(
+                A_w=A_w, f_y=section.min_fy
+            )
+
+        web = section.web(axis=axis)
+
+        if web is None:
+            return V_w
+
+        d_p, t_w = web
+
+        # α_v may be > 1.0, but the capacity is limited to the shear yield capacity.
+        α_v = S5_Shear.s5_11_5_α_v(d_p=d_p, t_w=t_w, f_y=section.min_fy)
+
+        return min(α_v, 1.0) * V_w
+
+    def _segment_restraints(self) -> np.ndarray:
+        """
+        Helper method to get the restraints that split the beam into segments for
+        member buckling checks, including the start & end of the beam.
+
+        :return: A sorted numpy array of unique restraint positions.
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"Member checks do not apply to Section based CodeCheck objects."
+            )
+
+        restraints = [] if self.restraints is None else self.restraints
+        restraints = np.asarray(restraints, dtype=float).reshape(-1)
+
+        if np.any(restraints < 0) or np.any(restraints > self.beam.length):
+            raise PositionNotInBeamError(
+                f"Expected restraints to be > 0 or < the length of the beam. "
+                + f"Provided restraints were {restraints}, beam length is"
+                + f" {self.beam.length}."
+            )
+
+        return np.unique(np.concatenate((restraints, [0.0, self.beam.length])))
+
+    def _segment_compression_capacities(self) -> np.ndarray:
+        """
+        Helper method to calculate the member compression capacity φNc of every element
+        in every segment between restraints. Capacities are only calculated once for
+        each combination of segment and run of elements with the same section.
+
+        :return: An array of shape (no. segments, no. elements). Elements that are not
+            part of a segment are given an infinite capacity in that segment.
+        """
+
+        restraints = self._segment_restraints()
+        seg_start = restraints[:-1, np.newaxis]
+        seg_end = restraints[1:, np.newaxis]
+
+        ends = np.array(self.beam.element_ends)
+        start = ends[np.newaxis, :, 0]
+        end = ends[np.newaxis, :, 1]
+
+        # elements overlapping each segment, plus any zero length elements within it.
+        overlap = (start < seg_end) & (end > seg_start)
+        overlap |= (start == end) & (start >= seg_start) & (start <= seg_end)
+
+        first_elements, element_runs = self._section_runs()
+
+        capacity = np.full(overlap.shape, np.inf)
+        run_capacity = {}
+
+        for segment, element in zip(*np.nonzero(overlap)):
+
+            key = (segment, element_runs[element])
+
+            if key not in run_capacity:
+                section = self.as4100_sections[first_elements[key[1]]]
+                length = restraints[segment + 1] - restraints[segment]
+
+                results = self.s6_1_1_Nc(section=section, length=length)
+                run_capacity[key] = results["φN_c"]
+
+            capacity[segment, element] = run_capacity[key]
+
+        return capacity
+
+    def s6_1_1_Nc(self, *, section: AS4100Section, length: float) -> Dict[str, any]:
+        """
+        Calculates the member compression capacity of a section over a given segment
+        length to as4100 S6, using the effective length factors and φ_steel of the
+        as4100 object.
+
+        Flexural-torsional buckling is not part of as4100 S6 and is not checked.
+
+        :param section: The AS4100Section to calculate the capacity of.
+        :param length: The length of the segment between restraints.
+        :return: The dictionary of results from ``S6.s6_1_1_Nc``.
+        """
+
+        return S6.s6_1_1_Nc(
+            A_n=section.An,
+            k_f=section.kf,
+            l=length,
+            k_ex=self.k_ex,
+            k_ey=self.k_ey,
+            k_ez=1.0,
+            r_x=section.rx,
+            r_y=section.ry,
+            # the torsional properties are only used for flexural-torsional buckling,
+            # which is not calculated.
+            x_o=0.0,
+            y_o=0.0,
+            J=0.0,
+            I_w=0.0,
+            f_y=section.min_fy,
+            E=section.E,
+            G=0.0,
+            α_b=section.αb,
+            φ=self.φ_steel,
+            calc_torsion=False,
+        )
+
+    def _elements_at(self, *, position: Union[List[float], float]) -> np.ndarray:
+        """
+        Helper method to find the elements at any of the given positions. Where a
+        position is on the boundary between elements, all elements at the boundary are
+        included.
+
+        :param position: The position or positions to check.
+        :return: A boolean array of shape (no. elements, ) that is ``True`` for any
+            element that contains at least one of the positions.
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"get_section does not apply to Section based CodeCheck objects."
+            )
+
+        position = np.atleast_1d(np.asarray(position, dtype=float))
+
+        if np.any(position < 0) or np.any(position > self.beam.length):
+            raise PositionNotInBeamError(
+                f"Expected position to be > 0 or < the length of the beam. "
+                + f"Provided positions were{position}, beam length is"
+                + f" {self.beam.length}."
+            )
+
+        ends = self._cached("element_ends", lambda: np.array(self.beam.element_ends))
+
+        # elements with start <= position <= end
+        first = np.searchsorted(ends[:, 1], position, side="left")
+        stop = np.searchsorted(ends[:, 0], position, side="right")
+
+        coverage = np.zeros(ends.shape[0] + 1, dtype=int)
+        np.add.at(coverage, first, 1)
+        np.add.at(coverage, stop, -1)
+
+        return np.cumsum(coverage[:-1]) > 0
+
+    def _min_capacity(
+        self, *, capacity: str, position: Union[List[float], float] = None
+    ) -> float:
+        """
+        Helper method to get the minimum cached capacity of the elements at the given
+        positions.
+
+        :param capacity: The capacity to get, as per the keys of
+            ``_element_capacities``.
+        :param position: The position or positions to check. If ``None``, all elements
+            are checked.
+        :return: The minimum capacity.
+        """
+
+        capacities = self._cached("capacities", self._element_capacities)[capacity]
+
+        if position is not None:
+            capacities = capacities[self._elements_at(position=position)]
+
+        return float(np.min(capacities))
+
+    @property
+    def tension_capacity_load_dependent(self) -> bool:
+        """
+        The AS4100 tension capacity is independent of the applied load, so the tension
+        utilisation is calculated directly as load / capacity.
+        """
+
+        return False
 
     def tension_capacity(self, *, position: Union[List[float], float] = None):
 
         return self.φNt(position=position)
 
+    def tension_utilisation_bound(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> float:
+        """
+        Get a cheap upper bound on the tension utilisation, as the maximum tension
+        anywhere in the beam divided by the minimum tension capacity anywhere in the
+        beam.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the tension utilisation.
+        """
+
+        max_loads, min_loads = self._load_envelope(load_case=load_case)
+
+        tension = max(max_loads[LoadComponents.N.value - 1], 0.0)
+
+        return tension / self.tension_capacity()
+
+    def compression_utilisation_bound(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> float:
+        """
+        Get a cheap upper bound on the compression utilisation, as the maximum
+        compression anywhere in the beam divided by the minimum member compression
+        capacity of any segment.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the compression utilisation.
+        """
+
+        max_loads, min_loads = self._load_envelope(load_case=load_case)
+
+        compression = max(-min_loads[LoadComponents.N.value - 1], 0.0)
+
+        return compression / self.compression_capacity()
+
+    def shear_utilisation_bound(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> float:
+        """
+        Get a cheap upper bound on the shear utilisation, as the maximum shear
+        anywhere in the beam divided by the minimum shear capacity in the same
+        direction, for the worst direction.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the shear utilisation.
+        """
+
+        demand = self._absolute_envelope(load_case=load_case)
+
+        return max(
+            demand[LoadComponents.VX] / self.shear_capacity(axis="x"),
+            demand[LoadComponents.VY] / self.shear_capacity(axis="y"),
+        )
+
+    def section_moment_utilisation_bound(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> float:
+        """
+        Get a cheap upper bound on the section moment utilisation, as the maximum
+        moment anywhere in the beam divided by the minimum section moment capacity about
+        the same axis, for the worst axis.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the section moment utilisation.
+        """
+
+        demand = self._absolute_envelope(load_case=load_case)
+
+        return max(
+            demand[LoadComponents.MX] / self.section_moment_capacity(axis="x"),
+            demand[LoadComponents.MY] / self.section_moment_capacity(axis="y"),
+        )
+
+    def combined_section_utilisation_bound(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> float:
+        """
+        Get a cheap upper bound on the combined actions section utilisation, by
+        applying the interaction equation of as4100 S8.3.4 to the worst axial load and
+        moments anywhere in the beam and the minimum capacities anywhere in the beam.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the combined actions section utilisation.
+        """
+
+        max_loads, min_loads = self._load_envelope(load_case=load_case)
+        demand = self._absolute_envelope(load_case=load_case)
+
+        # the axial load is either tension or compression at any one position, so the
+        # worst of the two axial terms bounds the axial term of the interaction.
+        tension = max(max_loads[LoadComponents.N.value - 1], 0.0)
+        compression = max(-min_loads[LoadComponents.N.value - 1], 0.0)
+
+        axial = max(
+            tension / self._min_capacity(capacity="φNt"),
+            compression / self._min_capacity(capacity="φNs"),
+        )
+
+        return (
+            axial
+            + demand[LoadComponents.MX] / self._min_capacity(capacity="φMsx")
+            + demand[LoadComponents.MY] / self._min_capacity(capacity="φMsy")
+        )
+
+    def utilisation_bound(self, *, load_case: Union[int, List[int]] = None) -> float:
+        """
+        Get a cheap upper bound on the utilisation of the member in any of the checks
+        implemented: tension, compression, shear, section moment and combined actions.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the utilisation.
+        """
+
+        return max(
+            self.tension_utilisation_bound(load_case=load_case),
+            self.compression_utilisation_bound(load_case=load_case),
+            self.shear_utilisation_bound(load_case=load_case),
+            self.section_moment_utilisation_bound(load_case=load_case),
+            self.combined_section_utilisation_bound(load_case=load_case),
+        )
+
+    def _load_envelope(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper method to get the load envelope of the beam for the utilisation bounds.
+        See ``Beam.load_envelope``.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: A tuple of arrays of the maximum & minimum of each load component.
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"Utilisation bounds require a load envelope, which is not available "
+                + f"on Section based CodeCheck objects."
+            )
+
+        if isinstance(load_case, int):
+            # convert into List now for consistency later.
+            load_case = [load_case]
+
+        return self.beam.load_envelope(load_cases=load_case)
+
+    def _absolute_envelope(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> Dict[LoadComponents, float]:
+        """
+        Helper method to get the maximum magnitude of each load component anywhere in
+        the beam.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: A dictionary of the maximum magnitude of each load component.
+        """
+
+        max_loads, min_loads = self._load_envelope(load_case=load_case)
+
+        magnitude = np.maximum(np.abs(max_loads), np.abs(min_loads))
+
+        return {c: float(magnitude[c.value - 1]) for c in LoadComponents}
+
     def tension_utilisation(
         self,
         *,
         load_case: Union[int, List[int]] = None,
         position: Union[List[float], float] = None,
+    ) -> Utilisation:
+
+        return self.kernel_utilisation(
+            kernel=self.tension_kernel, load_case=load_case, position=position
+        )
+
+    def tension_utilisation_matrix(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the tension utilisation in every load case at every position, in a
+        single pass. See ``CodeCheck.kernel_utilisation_matrix``.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions and element starts & ends in the load cases
+            considered.
+        :return: A tuple of the positions and the utilisation:
+
+            (
+                np.array([pos_0, ..., pos_n]),
+                np.array(
+                    [
+                        [util_case_0_pos_0, ..., util_case_0_pos_n],
+                        ...
+                        [util_case_m_pos_0, ..., util_case_m_pos_n],
+                    ]
+                )
+            )
+        """
+
+        return self.kernel_utilisation_matrix(
+            kernel=self.tension_kernel, load_case=load_case, position=position
+        )
+
+    @property
+    def tension_kernel(self) -> CheckKernel:
+        """
+        The ``CheckKernel`` for the tension check. Compression is treated as 0 tension,
+        and the capacity of each element is φNt.
+        """
+
+        return CheckKernel(
+            name="tension",
+            component=LoadComponents.N,
+            demand=lambda loads: np.maximum(loads[..., 0], 0.0),
+            capacity=lambda: self._cached("capacities", self._element_capacities)[
+                "φNt"
+            ],
+            utilisation=(
+                functools.partial(
+                    iterative_utilisation, instrumentation=self.instrumentation
+                )
+                if self.tension_capacity_load_dependent
+                else ratio_utilisation
+            ),
+            convex=not self.tension_capacity_load_dependent,
+        )
+
+    def compression_capacity(
+        self, *, position: Union[List[float], float] = None
     ) -> float:
+        """
+        Get the limiting member compression capacity φNc of the as4100 object.
 
-        if load_case is not None:
-            if isinstance(load_case, int):
-                # convert into List now for consistency later.
-                load_case = [load_case]
+        :param position: The position or positions to calculate the capacity at. If
+            ``None``, the minimum capacity of the entire beam is returned.
+        :return: The minimum compression capacity at the given positions.
+        """
 
-        load = load_case
+        kernel = self.compression_kernel
+        capacity = self._cached(("capacity",) + kernel.cache_key, kernel.capacity)
 
-        if position is not None:
-            if isinstance(position, float):
-                # convert position into List now for consistency later.
-                position = [position]
+        if position is None:
+            return float(np.min(capacity))
+
+        position = np.atleast_1d(np.asarray(position, dtype=float))
+        restraints = kernel.restraints
+
+        # positions at a restraint are in the segments either side of it.
+        after = np.searchsorted(restraints, position, side="right") - 1
+        before = np.searchsorted(restraints, position, side="left") - 1
+        segments = np.clip(np.union1d(after, before), 0, restraints.shape[0] - 2)
+
+        elements = self._elements_at(position=position)
+
+        return float(np.min(capacity[np.ix_(segments, elements)]))
+
+    def compression_utilisation(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Utilisation:
+        """
+        Get the utilisation of the member in compression, to as4100 S6.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions, element starts & ends and restraints.
+        :return: The utilisation of the member in compression, as a ``Utilisation``
+            object.
+        """
+
+        return self.kernel_utilisation(
+            kernel=self.compression_kernel, load_case=load_case, position=position
+        )
+
+    def compression_utilisation_matrix(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the compression utilisation in every load case at every position, in
+        a single pass. See ``CodeCheck.kernel_utilisation_matrix``.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions, element starts & ends and restraints.
+        :return: A tuple of the positions and the utilisation, as per
+            ``tension_utilisation_matrix``.
+        """
+
+        return self.kernel_utilisation_matrix(
+            kernel=self.compression_kernel, load_case=load_case, position=position
+        )
+
+    @property
+    def compression_kernel(self) -> CheckKernel:
+        """
+        The ``CheckKernel`` for the compression check. Tension is treated as 0
+        compression, and the capacity of each element is the member capacity φNc of the
+        segment it is in.
+        """
+
+        return CheckKernel(
+            name="compression",
+            component=LoadComponents.N,
+            demand=lambda loads: np.maximum(-loads[..., 0], 0.0),
+            capacity=self._segment_compression_capacities,
+            restraints=self._segment_restraints(),
+            convex=True,
+        )
+
+    def shear_capacity(
+        self, *, position: Union[List[float], float] = None, axis: str = None
+    ) -> float:
+        """
+        Get the limiting shear capacity φVv of the as4100 object.
+
+        :param position: The position or positions to calculate the capacity at. If
+            ``None``, the minimum capacity of the entire object is returned.
+        :param axis: The direction of the shear, "x" or "y". If ``None``, the minimum
+            capacity in either direction is returned.
+        :return: The minimum shear capacity at the given positions.
+        """
+
+        if axis is None:
+            return min(
+                self.shear_capacity(position=position, axis="x"),
+                self.shear_capacity(position=position, axis="y"),
+            )
+
+        return self._min_capacity(
+            capacity=self._axis_capacity_key(capacity="φVv", axis=axis),
+            position=position,
+        )
+
+    def shear_utilisation(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+        axis: str = None,
+    ) -> Utilisation:
+        """
+        Get the utilisation of the member in shear, to as4100 S5.11.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions and element starts & ends.
+        :param axis: The direction of the shear, "x" (VX) or "y" (VY). If ``None``, the
+            utilisation is the maximum of the utilisation in either direction.
+        :return: The utilisation of the member in shear, as a ``Utilisation`` object.
+        """
+
+        if axis is not None:
+            return self.kernel_utilisation(
+                kernel=self.shear_kernel(axis=axis),
+                load_case=load_case,
+                position=position,
+            )
+
+        return self.kernel_utilisation_max(
+            kernels=[self.shear_kernel(axis="x"), self.shear_kernel(axis="y")],
+            load_case=load_case,
+            position=position,
+        )
 
-        pos = position
+    def shear_kernel(self, *, axis: str) -> CheckKernel:
+        """
+        Get the ``CheckKernel`` for the shear check in a given direction. The demand is
+        the magnitude of the shear, and the capacity of each element is φVv.
 
-        ret_loads = []
-        ret_pos = []
-        ret_util = []
+        :param axis: The direction of the shear, "x" (VX) or "y" (VY).
+        :return: The ``CheckKernel``.
+        """
 
-        if load is None:
-            # if load is None, we need to go over all the load cases.
-            load = self.beam.load_cases
+        component = LoadComponents.VX if axis == "x" else LoadComponents.VY
 
-        for l in load:
+        return self._axis_kernel(
+            name="shear", capacity="φVv", axis=axis, component=component
+        )
 
-            if pos is None:
-                pos = self.beam.list_positions(
-                    min_positions=self.assessment_points, load_case=l
-                )[0]
+    def section_moment_capacity(
+        self, *, position: Union[List[float], float] = None, axis: str = None
+    ) -> float:
+        """
+        Get the limiting section moment capacity φMs of the as4100 object, to as4100
+        S5.2.
+
+        :param position: The position or positions to calculate the capacity at. If
+            ``None``, the minimum capacity of the entire object is returned.
+        :param axis: The axis of bending, "x" or "y". If ``None``, the minimum capacity
+            about either axis is returned.
+        :return: The minimum section moment capacity at the given positions.
+        """
 
-            for p in pos:
-                # go through every position and get the capacity & load
+        if axis is None:
+            return min(
+                self.section_moment_capacity(position=position, axis="x"),
+                self.section_moment_capacity(position=position, axis="y"),
+            )
 
-                t_cap = self.tension_capacity(position=p)
+        return self._min_capacity(
+            capacity=self._axis_capacity_key(capacity="φMs", axis=axis),
+            position=position,
+        )
 
-                def cap_func(load):
-                    return t_cap
+    def section_moment_utilisation(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+        axis: str = None,
+    ) -> Utilisation:
+        """
+        Get the utilisation of the section in bending, to as4100 S5.2. This is the
+        utilisation for bending about each axis separately; combined actions are not
+        considered.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions and element starts & ends.
+        :param axis: The axis of bending, "x" (MX) or "y" (MY). If ``None``, the
+            utilisation is the maximum of the utilisation about either axis.
+        :return: The utilisation of the section in bending, as a ``Utilisation`` object.
+        """
 
-                # next get the tension load at the position to be checked.
-                tension = self.get_tension(load_case=l, position=p)[..., 1]
+        if axis is not None:
+            return self.kernel_utilisation(
+                kernel=self.section_moment_kernel(axis=axis),
+                load_case=load_case,
+                position=position,
+            )
 
-                for t in tension:
-                    # handle the case where multiple loads are at a given position.
+        return self.kernel_utilisation_max(
+            kernels=[
+                self.section_moment_kernel(axis="x"),
+                self.section_moment_kernel(axis="y"),
+            ],
+            load_case=load_case,
+            position=position,
+        )
 
-                    if t <= 0.0:
-                        """
-                        handle compression or empty cases - can simply state
-                        utilisation is 0.0.
-                        
-                        Note that in the case of t==0 then there is no root to the
-                        utility function defined below and it cannot be solved.
-                        """
-                        x = 0.0
-                    else:
+    def section_moment_kernel(self, *, axis: str) -> CheckKernel:
+        """
+        Get the ``CheckKernel`` for the section moment check about a given axis. The
+        demand is the magnitude of the moment, and the capacity of each element is φMs.
 
-                        def util_func(x, load, capacity_func):
+        :param axis: The axis of bending, "x" (MX) or "y" (MY).
+        :return: The ``CheckKernel``.
+        """
 
-                            return (x * load) / capacity_func(x * load) - 1.0
+        component = LoadComponents.MX if axis == "x" else LoadComponents.MY
 
-                        x, i, b = secant(
-                            util_func,
-                            t,
-                            cap_func,
-                            x_low=-100_000,
-                            x_high=100_000,
-                            fallback=False,
-                        )
+        return self._axis_kernel(
+            name="section_moment", capacity="φMs", axis=axis, component=component
+        )
 
-                        if x != 0.0:
-                            x = 1 / x
+    def combined_section_utilisation(
+        self,
+        *,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Utilisation:
+        """
+        Get the utilisation of the section under combined axial load & biaxial bending,
+        to as4100 S8.3.4. See ``S8.s8_3_4_interaction``.
+
+        The axial capacity is φNt where the axial load is tensile and the compression
+        section capacity φNs where it is compressive. Member buckling (as4100 S8.4) is
+        not considered.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            utilisation is calculated at ``assessment_points`` equally spaced positions,
+            plus all load positions and element starts & ends.
+        :return: The utilisation of the section under combined actions, as a
+            ``Utilisation`` object.
+        """
+
+        return self.kernel_utilisation(
+            kernel=self.combined_section_kernel, load_case=load_case, position=position
+        )
+
+    @property
+    def combined_section_kernel(self) -> CheckKernel:
+        """
+        The ``CheckKernel`` for the combined actions section check. The demand is the
+        full (load case, position, component) tensor of N, MX & MY, and the capacity of
+        each element is the array [φNt, φNs, φMsx, φMsy], so that the interaction of all
+        load cases at all positions is evaluated in a single broadcast expression.
+        """
 
-                    ret_loads += [l]
-                    ret_pos += [p]
-                    ret_util += [x]
+        def capacity():
 
-        if load_case is None and position is not None:
-            # if load case is none but position is not, filter on position.
+            capacities = self._cached("capacities", self._element_capacities)
 
-            ret_util = [ret_util[i] for i, p in enumerate(ret_pos) if p in position]
+            return np.column_stack(
+                [capacities[c] for c in ("φNt", "φNs", "φMsx", "φMsy")]
+            )
+
+        def utilisation(loads, capacity):
+
+            N, M_x, M_y = loads[..., 0], loads[..., 1], loads[..., 2]
+            φN_t, φN_s, φM_sx, φM_sy = capacity.T
+
+            φN = S8.s8_3_φN(N=N, φN_t=φN_t, φN_s=φN_s)
+
+            return S8.s8_3_4_interaction(
+                N=N, M_x=M_x, M_y=M_y, φN=φN, φM_sx=φM_sx, φM_sy=φM_sy
+            )
 
-        if position is None and load_case is not None:
-            # if position is None, but load case is not, filter on load case.
+        return CheckKernel(
+            name="combined_section",
+            component=[LoadComponents.N, LoadComponents.MX, LoadComponents.MY],
+            demand=lambda loads: loads,
+            capacity=capacity,
+            utilisation=utilisation,
+            # |N| / φN is convex, as both of its branches increase away from N = 0.
+            convex=True,
+        )
+
+    def _axis_kernel(
+        self, *, name: str, capacity: str, axis: str, component: LoadComponents
+    ) -> CheckKernel:
+        """
+        Helper method to build a ``CheckKernel`` for a check about a single axis, where
+        the demand is the magnitude of a single load component and the capacity is
+        one of the cached ``_element_capacities``.
+
+        :param name: The name of the check.
+        :param capacity: The capacity, excluding the axis (i.e. "φVv").
+        :param axis: The axis, "x" or "y".
+        :param component: The load component that makes up the demand.
+        :return: The ``CheckKernel``.
+        """
 
-            ret_util = [ret_util[i] for i, l in enumerate(ret_loads) if l in load_case]
+        key = self._axis_capacity_key(capacity=capacity, axis=axis)
 
-        return max(ret_util)
+        return CheckKernel(
+            name=f"{name}_{axis}",
+            component=component,
+            demand=lambda loads: np.abs(loads[..., 0]),
+            capacity=lambda: self._cached("capacities", self._element_capacities)[key],
+            convex=True,
+        )
+
+    @staticmethod
+    def _axis_capacity_key(*, capacity: str, axis: str) -> str:
+        """
+        Helper method to get the key of a capacity about a given axis in
+        ``_element_capacities``.
+
+        :param capacity: The capacity, excluding the axis (i.e. "φVv").
+        :param axis: The axis, "x" or "y".
+        :return: The key.
+        """
+
+        if axis not in ("x", "y"):
+            raise CodeCheckError(f"Expected axis to be 'x' or 'y'. Received {axis}.")
+
+        return f"{capacity}{axis}"
 
     def get_section(
         self,
@@ -210,6 +1037,71 @@ class AS4100(CodeCheck):
 
         return (positions, as4100_sections)
 
+    def get_as4100_section_runs(
+        self,
+        *,
+        position: Union[List[float], float] = None,
+        min_positions: int = None,
+        load_case: int = None,
+    ) -> Tuple[List[float], np.ndarray, List[Tuple[float, float, AS4100Section]]]:
+        """
+        A run-length version of ``get_as4100_section``. Returns the runs of adjacent
+        elements with the same section along the beam, and the index of the run at each
+        position, so that section properties & capacities can be calculated once per
+        run and broadcast to the positions.
+
+        If the ``CodeCheck`` object is a section based object, it will raise a
+        SectionOnlyError.
+
+        :param min_positions: The minimum no. of positions to return.
+        :param position: The position to return the section from. If ``None`` it returns
+            all sections. If a position is given it returns the sections at the given
+            positions.
+        :param load_case: The load case to consider if using min_positions. Can be
+            ``None``, in which case only the start & ends of elements are returned.
+        :return: Returns a tuple of positions, run indices and as4100 section runs:
+
+            (
+                [pos_1, ..., pos_n]
+                [run_1, ..., run_n]
+                [(start_0, end_0, section_0), ..., (start_m, end_m, section_m)]
+            )
+        """
+
+        positions, run_index, runs = self.get_section_runs(
+            position=position, min_positions=min_positions, load_case=load_case
+        )
+
+        # the AS4100Section of each run is taken from the first element in the run.
+        first_elements, _ = self._section_runs()
+
+        as4100_runs = [
+            (start, end, self.as4100_sections[e])
+            for (start, end, section), e in zip(runs, first_elements)
+        ]
+
+        return (positions, run_index, as4100_runs)
+
+    def _section_runs(self) -> Tuple[List[int], np.ndarray]:
+        """
+        Helper method to get the runs of adjacent elements with the same section (see
+        ``Beam.section_runs``). A section only object has a single run.
+
+        :return: A tuple of the first element in each run, and an array of the run that
+            each element belongs to.
+        """
+
+        if self.beam is None:
+            return [0], np.zeros(1, dtype=int)
+
+        element_runs = self.beam.element_section_runs
+
+        first_elements = [
+            int(i) for i in np.flatnonzero(np.diff(element_runs, prepend=-1))
+        ]
+
+        return first_elements, element_runs
+
     def get_loads(
         self,
         *,
@@ -275,19 +1167,7 @@ class AS4100(CodeCheck):
         :return: The calculated yield tension capacity.
         """
 
-        if position is None:
-            sections = self.as4100_sections
-        else:
-            if isinstance(position, float):
-                # if a float is provided, wrap it in a list for consistent logic below.
-                position = [position]
-
-            positions, sections = self.get_as4100_section(position=position)
-
-        # now we have a list of all sections to check, do the check
-        N = [self.s7_2_Nty(Ag=s.Ag, fy=s.min_fy) for s in sections]
-
-        return min(N)
+        return self._min_capacity(capacity="Nty", position=position)
 
     def φNty(self, *, position: Union[List[float], float] = None):
         """
@@ -316,22 +1196,7 @@ class AS4100(CodeCheck):
         :return: The calculated ultimate capacity.
         """
 
-        if position is None:
-            sections = self.as4100_sections
-        else:
-            if isinstance(position, float):
-                # if a float is provided, wrap it in a list for consistent logic below.
-                position = [position]
-
-            positions, sections = self.get_as4100_section(position=position)
-
-        # now we have a list of all sections to check, do the check
-        N = [
-            self.s7_2_Ntu(An=s.An, fu=s.min_fu, kt=self.kt, αu=self.αu)
-            for s in sections
-        ]
-
-        return min(N)
+        return self._min_capacity(capacity="Ntu", position=position)
 
     def φNtu(self, *, position: Union[List[float], float] = None):
         """
@@ -411,12 +1276,136 @@ class AS4100(CodeCheck):
 
         return An * fu * kt * αu
 
+    @classmethod
+    def catalogue_capacities(
+        cls,
+        *,
+        Ag: Union[np.ndarray, List[float]],
+        An: Union[np.ndarray, List[float]],
+        thickness: Union[np.ndarray, List[float]],
+        material: Material,
+        kf: Union[np.ndarray, List[float], float] = None,
+        φ_steel: float = None,
+        αu: float = None,
+        kt: float = None,
+        file_path: str = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculates the capacities of a catalogue of sections in a single vectorised
+        call, without creating an ``AS4100`` object (or any ``Section`` objects) for
+        each section. This is intended for design tables and section selection, where
+        thousands of sections need to be compared.
+
+        :param Ag: The gross areas of the sections in m².
+        :param An: The net areas of the sections in m².
+        :param thickness: The thicknesses that determine the strength of each section
+            (i.e. the thickest element of each section) in m.
+        :param material: The material of the sections.
+        :param kf: The compression form factors of the sections. If ``None``, the
+            compression section capacities are not calculated.
+        :param φ_steel: The capacity reduction factor. If ``None``, the default value
+            is used (see ``get_defaults``).
+        :param αu: The uncertainty factor for ultimate strength. If ``None``, the
+            default value is used.
+        :param kt: The connection efficiency factor. If ``None``, the default value is
+            used.
+        :param file_path: A file to load any default values from. If ``None``, the
+            default values stored in the package are used.
+        :return: A dictionary of arrays, with one value per section:
+
+            {
+                "fy": The yield strength in Pa.
+                "fu": The ultimate strength in Pa.
+                "Nty": The yield capacity in tension, in N.
+                "Ntu": The ultimate fracture capacity in tension, in N.
+                "Nt": The tension capacity, in N.
+                "φNt": The design tension capacity, in N.
+                "Ns": The compression section capacity, in N. Only if ``kf`` is given.
+                "φNs": The design compression section capacity, in N. Only if ``kf``
+                    is given.
+            }
+        """
+
+        if None in (φ_steel, αu, kt):
+            defaults = cls.get_defaults(file_path=file_path)["defaults"]
+
+            φ_steel = defaults["φ_steel"] if φ_steel is None else φ_steel
+            αu = defaults["αu"] if αu is None else αu
+            kt = defaults["kt"] if kt is None else kt
+
+        Ag, An, thickness = np.broadcast_arrays(
+            np.asarray(Ag, dtype=float),
+            np.asarray(An, dtype=float),
+            np.asarray(thickness, dtype=float),
+        )
+
+        strengths = material.properties["strengths"]
+
+        fy = AS4100Section.get_f_array(
+            thickness=thickness, yield_or_ult="Y", strengths=strengths
+        )
+        fu = AS4100Section.get_f_array(
+            thickness=thickness, yield_or_ult="U", strengths=strengths
+        )
+
+        Nty = cls.s7_2_Nty(Ag=Ag, fy=fy)
+        Ntu = cls.s7_2_Ntu(An=An, fu=fu, kt=kt, αu=αu)
+        Nt = np.minimum(Nty, Ntu)
+
+        capacities = {
+            "fy": fy,
+            "fu": fu,
+            "Nty": Nty,
+            "Ntu": Ntu,
+            "Nt": Nt,
+            "φNt": φ_steel * Nt,
+        }
+
+        if kf is not None:
+            Ns = S6.s6_2_N_s(A_e=S6.s6_2_A_e(A_n=An, k_f=np.asarray(kf)), f_y=fy)
+
+            capacities["Ns"] = Ns
+            capacities["φNs"] = φ_steel * Ns
+
+        return capacities
+
     @classmethod
     def default_AS4100(
-        cls, beam: Beam = None, section: Section = None, file_path: str = None
+        cls,
+        beam: Beam = None,
+        section: Section = None,
+        file_path: str = None,
+        profile: str = None,
     ) -> "as4100":
+        """
+        Creates an ``AS4100`` object using default values for the capacity reduction
+        factors etc.
+
+        :param beam: The ``Beam`` to check.
+        :param section: The ``Section`` to check.
+        :param file_path: A file to load the default values from. If ``None``, the
+            default values stored in the package are used.
+        :param profile: The name of a profile registered with ``register_profile`` to
+            use instead of a file. Cannot be used with ``file_path``.
+        :return: An ``AS4100`` object.
+        """
+
+        if profile is not None:
+            if file_path is not None:
+                raise CodeCheckError(
+                    f"Expected only one of file_path or profile. Both were provided."
+                )
+
+            if profile not in _PROFILES:
+                raise CodeCheckError(
+                    f"No profile named {profile} has been registered. "
+                    + f"Registered profiles are: {list(_PROFILES)}"
+                )
+
+            config = _PROFILES[profile]
+        else:
+            config = cls.get_defaults(file_path=file_path)
 
-        config = cls.get_defaults(file_path=file_path)
         defaults = config["defaults"]
 
         return cls(beam=beam, section=section, **defaults)
@@ -424,13 +1413,16 @@ class AS4100(CodeCheck):
     @classmethod
     def get_defaults(cls, *, file_path: str = None) -> Dict[str, any]:
         """
-        This class method loads a JSON file containing default values for as4100 objects
-        that is stored in the specified location.
+        This class method loads a TOML file containing default values for as4100
+        objects that is stored in the specified location.
         If not specified, the default values stored in the package are loaded.
 
+        Parsed files are cached for the life of the process, and are only parsed again
+        if the file is modified.
+
         :param file_path: The file_path to load the values from. If not specified, the
             default values will be loaded from the file in the package.
-        :return: A dictionary containing the parsed JSON file.
+        :return: A dictionary containing the parsed TOML file.
         """
 
         if file_path is None:
@@ -440,7 +1432,49 @@ class AS4100(CodeCheck):
         else:
             file_path = Path(file_path)
 
-        with file_path.open(mode="r", encoding="utf-8") as f:
-            vals = toml.load(f=f)
+        key = str(file_path.resolve())
+        mtime = file_path.stat().st_mtime_ns
+
+        cached = _DEFAULTS_CACHE.get(key)
+
+        if cached is None or cached[0] != mtime:
+
+            with file_path.open(mode="r", encoding="utf-8") as f:
+                vals = toml.load(f=f)
+
+            cached = (mtime, vals)
+            _DEFAULTS_CACHE[key] = cached
+
+        # return a copy so that callers cannot modify the cached values.
+        return copy.deepcopy(cached[1])
+
+    @classmethod
+    def register_profile(
+        cls, *, name: str, defaults: Dict[str, any] = None, file_path: str = None
+    ):
+        """
+        Registers a named set of default values (i.e. project level overrides) for use
+        with ``default_AS4100(profile=name)``.
+
+        :param name: The name of the profile.
+        :param defaults: Values to override in the [defaults] section of the base file,
+            i.e. {"φ_steel": 0.85}.
+        :param file_path: The file to load the base values from. If not specified, the
+            default values stored in the package are used.
+        """
+
+        config = cls.get_defaults(file_path=file_path)
+
+        if defaults is not None:
+            config["defaults"].update(defaults)
+
+        _PROFILES[name] = config
+
+    @classmethod
+    def clear_defaults_cache(cls):
+        """
+        Clears the cache of parsed default value files and all registered profiles.
+        """
 
-        return vals
+        _DEFAULTS_CACHE.clear()
+        _PROFILES.clear()
@@ -4,9 +4,13 @@ as required by as4100 S5, 6 & 7.
 """
 
 from abc import ABC, abstractmethod
+from math import pi
 
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
+from beamdesign.codecheck.as4100.S5_Shear import s5_11_3_α_vma
 from beamdesign.sections.section import Section
 from beamdesign.sections.circle import Circle
 from beamdesign.sections.hollowcircle import HollowCircle
@@ -101,6 +105,101 @@ class AS4100Section(ABC):
 
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def kf(self) -> float:
+        """
+        The form factor of the section, to as4100 S6.2.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def rx(self) -> float:
+        """
+        The radius of gyration about the x axis.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def ry(self) -> float:
+        """
+        The radius of gyration about the y axis.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    def αb(self) -> float:
+        """
+        The member section constant, to as4100 T6.3.3(1) & (2). By default this is
+        conservatively taken as 1.0.
+        """
+
+        return 1.0
+
+    @property
+    @abstractmethod
+    def Zex(self) -> float:
+        """
+        The effective section modulus for bending about the x axis, to as4100 S5.2.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def Zey(self) -> float:
+        """
+        The effective section modulus for bending about the y axis, to as4100 S5.2.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def Awx(self) -> float:
+        """
+        The area of the section effective in resisting shear in the x direction, to
+        as4100 S5.11.4.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def Awy(self) -> float:
+        """
+        The area of the section effective in resisting shear in the y direction, to
+        as4100 S5.11.4.
+        """
+
+        raise NotImplementedError()
+
+    @property
+    def α_vma(self) -> float:
+        """
+        The non-uniform shear modification factor, to as4100 S5.11.3. By default this
+        is 1.0 (i.e. a uniform shear stress distribution).
+        """
+
+        return 1.0
+
+    def web(self, *, axis: str) -> Optional[Tuple[float, float]]:
+        """
+        The web panel depth & thickness that resist shear in the given direction, for
+        checking shear buckling to as4100 S5.11.5.
+
+        :param axis: The direction of the shear, "x" or "y".
+        :return: A tuple of (d_p, t_w), or ``None`` if the section has no web that is
+            susceptible to shear buckling. By default this is ``None``.
+        """
+
+        return None
+
     @staticmethod
     def _get_f(
         *,
@@ -178,6 +277,66 @@ class AS4100Section(ABC):
             f"Unknown error determining material yield or ultimate strength."
         )
 
+    @staticmethod
+    def get_f_array(
+        *,
+        thickness: Union[np.ndarray, List[float], float],
+        yield_or_ult: Union[bool, str],
+        strengths: List[List[float]],
+    ) -> np.ndarray:
+        """
+        A vectorised version of ``_get_f`` that determines the strength of steel of
+        many thicknesses at once (i.e. for a catalogue of sections).
+
+        :param thickness: The thicknesses of the steel.
+        :param yield_or_ult: Return the yield strength or ultimate? If True or "y",
+            return yield, if False or "u" then return ultimate.
+        :param strengths: The strengths of the steel vs the thickness, in a list of
+            lists:
+
+            [
+                [t_1, ..., t_n],
+                [fy_1, ..., fy_n],
+                [fu_1, ..., fu_n],
+            ]
+        :return: The strengths, in an array with the same shape as ``thickness``.
+        """
+
+        thickness = np.asarray(thickness, dtype=float)
+        thicknesses_list = np.asarray(strengths[0], dtype=float)
+
+        if np.any(thickness < 0):
+            raise InvalidThicknessError(
+                f"Thickness used to determine the strength should be > 0. "
+                + f"Thicknesses given were {thickness}"
+            )
+
+        if np.any(np.diff(thicknesses_list) <= 0):
+            raise InvalidMaterialError(
+                f"Expected that the strengths list in the material object would be "
+                + f"sorted by thickness. Strengths list was {strengths}."
+            )
+
+        if np.any(thickness > thicknesses_list[-1]):
+            raise InvalidThicknessError(
+                f"Expected thickness to be within the strength range of the provided "
+                + f"strengths. Thicknesses were {thickness} and strengths were "
+                + f"{strengths}"
+            )
+
+        if isinstance(yield_or_ult, str):
+            yield_or_ult = yield_or_ult.lower()
+
+        yield_choice = {"y": 1, "u": 2, True: 1, False: 2}
+
+        strength_index = yield_choice[yield_or_ult]
+
+        # the index of the first thickness in the list that is >= each thickness, as
+        # for _get_f.
+        indices = np.searchsorted(thicknesses_list, thickness, side="left")
+
+        return np.asarray(strengths[strength_index], dtype=float)[indices]
+
     @classmethod
     def AS4100_sect_factory(cls, section) -> "AS4100Section":
 
@@ -223,6 +382,62 @@ class AS4100Circle(AS4100Section):
 
         return self.section.area_net
 
+    @property
+    def kf(self) -> float:
+
+        # a solid circle is not subject to local buckling.
+        return 1.0
+
+    @property
+    def rx(self) -> float:
+
+        return self.section.radius / 2
+
+    @property
+    def ry(self) -> float:
+
+        return self.section.radius / 2
+
+    @property
+    def Zex(self) -> float:
+
+        return self._Ze
+
+    @property
+    def Zey(self) -> float:
+
+        return self._Ze
+
+    @property
+    def _Ze(self) -> float:
+        """
+        The effective section modulus of the circle, which is the same about any axis.
+        A solid circle is compact (as4100 S5.2.3), so Ze = min(S, 1.5Z).
+        """
+
+        r = self.section.radius
+
+        S = 4 * r ** 3 / 3
+        Z = pi * r ** 3 / 4
+
+        return min(S, 1.5 * Z)
+
+    @property
+    def Awx(self) -> float:
+
+        return self.section.area
+
+    @property
+    def Awy(self) -> float:
+
+        return self.section.area
+
+    @property
+    def α_vma(self) -> float:
+
+        # the maximum shear stress in a solid circle is 4/3 of the average.
+        return s5_11_3_α_vma(f_vm=4.0, f_va=3.0)
+
 
 def s6_2_λ_e_flatplate(b, t, f_y, f_ref=250.0):
     """
@@ -0,0 +1,468 @@
+"""
+Contains functions for checking many ``Beam`` objects in parallel.
+
+The loads of the beams are placed in shared memory (see ``beamdesign.sharedmemory``) so
+that only small handles are sent to the worker processes, and the beams are grouped
+into chunks of roughly equal cost so that each task is large enough to be worth sending
+to a worker.
+"""
+
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+from beamdesign.beam import Beam
+from beamdesign.codecheck.as4100.as4100 import AS4100
+from beamdesign.codecheck.codecheck import DEFAULT_ASSESSMENT_POINTS
+from beamdesign.codecheck.resultcache import ResultCache
+from beamdesign.sharedmemory import SharedBeamHandle, SharedBeams, acquire, release
+
+# the no. of chunks to aim for per worker, so that workers which finish early can pick
+# up more work.
+CHUNKS_PER_WORKER = 4
+
+
+class BatchResult:
+    """
+    The result of checking a single ``Beam`` in a batch.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        key: Any,
+        result: Any = None,
+        error: Exception = None,
+        error_traceback: str = None,
+    ):
+        """
+        Constructor for a ``BatchResult``.
+
+        :param index: The position of the ``Beam`` in the input.
+        :param key: The key of the ``Beam`` (the dictionary key if a dictionary of
+            beams was checked, otherwise the same as ``index``).
+        :param result: The result of the check, if it was successful.
+        :param error: The exception raised by the check, if it failed.
+        :param error_traceback: The formatted traceback of the exception.
+        """
+
+        self.index = index
+        self.key = key
+        self.result = result
+        self.error = error
+        self.error_traceback = error_traceback
+
+    @property
+    def ok(self) -> bool:
+        """
+        Did the check complete without raising an error?
+        """
+
+        return self.error is None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + f"key={self.key}, "
+            + (f"result={self.result}" if self.ok else f"error={self.error!r}")
+            + f")"
+        )
+
+
+def beam_cost(*, beam: Beam, assessment_points: int = DEFAULT_ASSESSMENT_POINTS) -> int:
+    """
+    Estimates the relative cost of checking a ``Beam``, as:
+
+        no. elements x no. load cases x no. positions per element
+
+    where the no. of positions per element is the larger of the average no. of stored
+    load positions and the no. of assessment points spread over the elements.
+
+    :param beam: The ``Beam`` to estimate the cost of.
+    :param assessment_points: The minimum no. of points that will be assessed.
+    :return: The estimated cost.
+    """
+
+    no_cases = beam.no_load_cases
+    no_elements = beam.no_elements
+
+    no_rows = sum(
+        e.loads[l].num_positions if e.loads[l].loads is not None else 1
+        for e in beam.elements
+        for l in beam.load_cases
+    )
+
+    positions = max(no_rows / max(no_elements * no_cases, 1), 1.0)
+    positions = max(positions, assessment_points / no_elements)
+
+    return max(int(no_elements * no_cases * positions), 1)
+
+
+def chunk_by_cost(*, costs: Sequence[float], target: float) -> List[List[int]]:
+    """
+    Groups consecutive items into chunks with a total cost of approximately
+    ``target``. Items are kept in order, and an item whose cost exceeds ``target`` is
+    placed in a chunk on its own.
+
+    :param costs: The cost of each item.
+    :param target: The target cost of each chunk.
+    :return: A list of chunks, each of which is a list of item indices.
+    """
+
+    chunks = []
+    chunk = []
+    chunk_cost = 0.0
+
+    for i, cost in enumerate(costs):
+
+        if chunk and chunk_cost + cost > target:
+            chunks += [chunk]
+            chunk = []
+            chunk_cost = 0.0
+
+        chunk += [i]
+        chunk_cost += cost
+
+    if chunk:
+        chunks += [chunk]
+
+    return chunks
+
+
+def check_all(
+    beams: Union[Sequence[Beam], Dict[Any, Beam]],
+    *,
+    code: Callable = AS4100,
+    code_kwargs: Dict[str, Any] = None,
+    check: str = "tension_utilisation",
+    check_kwargs: Dict[str, Any] = None,
+    max_workers: int = None,
+    executor: Executor = None,
+    chunk_cost: float = None,
+    ordered: bool = True,
+    cache: ResultCache = None,
+) -> Iterator[BatchResult]:
+    """
+    Checks many ``Beam`` objects in parallel, yielding a ``BatchResult`` for each.
+
+    Each beam is checked by creating a ``CodeCheck`` object with
+    ``code(beam=beam, **code_kwargs)`` and then calling
+    ``getattr(code_check, check)(**check_kwargs)``. An error in checking one beam is
+    captured in its ``BatchResult`` and does not stop the other beams being checked.
+
+    :param beams: The beams to check, as a list or a dictionary.
+    :param code: The ``CodeCheck`` class (or a function returning a ``CodeCheck``
+        object) to check the beams with.
+    :param code_kwargs: Keyword arguments to create the ``CodeCheck`` objects with. If
+        ``None`` and ``code`` has a ``get_defaults`` method (i.e. ``AS4100``), the
+        default values are used.
+    :param check: The name of the method to call on each ``CodeCheck`` object.
+    :param check_kwargs: Keyword arguments for the check method.
+    :param max_workers: The no. of worker processes to use, if ``executor`` is
+        ``None``.
+    :param executor: An existing ``Executor`` to run the checks on. If ``None``, a
+        ``ProcessPoolExecutor`` is created and shut down once all beams are checked.
+    :param chunk_cost: The target cost of each chunk of beams sent to a worker (see
+        ``beam_cost``). If ``None``, the total cost is split into approximately
+        ``CHUNKS_PER_WORKER`` chunks per worker.
+    :param ordered: If ``True``, results are yielded in the same order as ``beams``.
+        If ``False``, results are yielded as they complete.
+    :param cache: An optional ``ResultCache`` to reuse the results of beams checked
+        previously (in this or an earlier session). Only beams whose contents, code
+        parameters or check have changed are sent to the workers, and their successful
+        results are stored in the cache. If ``ordered`` is ``False``, cached results
+        are yielded first.
+    :return: An iterator of ``BatchResult`` objects.
+    """
+
+    if not isinstance(beams, dict):
+        beams = dict(enumerate(beams))
+
+    if code_kwargs is None:
+        code_kwargs = (
+            code.get_defaults()["defaults"] if hasattr(code, "get_defaults") else {}
+        )
+
+    if check_kwargs is None:
+        check_kwargs = {}
+
+    keys = list(beams)
+
+    if not keys:
+        return
+
+    cached, cache_keys = {}, {}
+
+    if cache is not None:
+        cached, cache_keys = _cached_results(
+            beams=beams,
+            keys=keys,
+            cache=cache,
+            code=code,
+            code_kwargs=code_kwargs,
+            check=check,
+            check_kwargs=check_kwargs,
+        )
+
+    pending = [i for i in range(len(keys)) if i not in cached]
+
+    if not pending:
+        yield from (cached[i] for i in sorted(cached))
+        return
+
+    costs = [beam_cost(beam=beams[keys[i]]) for i in pending]
+
+    own_executor = executor is None
+
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    if chunk_cost is None:
+        workers = getattr(executor, "_max_workers", None) or 1
+        chunk_cost = sum(costs) / (workers * CHUNKS_PER_WORKER)
+
+    chunks = [
+        [pending[i] for i in chunk]
+        for chunk in chunk_by_cost(costs=costs, target=chunk_cost)
+    ]
+
+    try:
+        with SharedBeams(beams={keys[i]: beams[keys[i]] for i in pending}) as shared:
+
+            futures = {
+                executor.submit(
+                    _check_chunk,
+                    items=[(i, keys[i], shared.handles[keys[i]]) for i in chunk],
+                    code=code,
+                    code_kwargs=code_kwargs,
+                    check=check,
+                    check_kwargs=check_kwargs,
+                ): chunk
+                for chunk in chunks
+            }
+
+            if ordered:
+                results = _ordered_results(futures=futures, keys=keys)
+            else:
+                yield from (cached[i] for i in sorted(cached))
+                cached = {}
+
+                results = (
+                    r
+                    for future in as_completed(futures)
+                    for r in _chunk_results(
+                        future=future, chunk=futures[future], keys=keys
+                    )
+                )
+
+            remaining = sorted(cached)
+
+            for r in results:
+
+                if r.ok and r.index in cache_keys:
+                    cache.put(cache_keys[r.index], r.result)
+
+                # interleave the cached results in input order.
+                while remaining and remaining[0] < r.index:
+                    yield cached[remaining.pop(0)]
+
+                yield r
+
+            yield from (cached[i] for i in remaining)
+
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _cached_results(
+    *,
+    beams: Dict[Any, Beam],
+    keys: List[Any],
+    cache: ResultCache,
+    code: Callable,
+    code_kwargs: Dict[str, Any],
+    check: str,
+    check_kwargs: Dict[str, Any],
+) -> Tuple[Dict[int, BatchResult], Dict[int, str]]:
+    """
+    Helper function for ``check_all`` that looks up the results of the beams in a
+    ``ResultCache``. Beams whose ``CodeCheck`` objects cannot be created are left to be
+    checked by the workers, so that their errors are reported as usual.
+
+    :param beams: The beams to check.
+    :param keys: The keys of the beams.
+    :param cache: The ``ResultCache`` to look the results up in.
+    :param code: The ``CodeCheck`` class to check the beams with.
+    :param code_kwargs: Keyword arguments to create the ``CodeCheck`` objects with.
+    :param check: The name of the method to call on each ``CodeCheck`` object.
+    :param check_kwargs: Keyword arguments for the check method.
+    :return: A tuple of:
+
+        (
+            {index: BatchResult} for the beams found in the cache,
+            {index: cache key} for the beams not found in the cache,
+        )
+    """
+
+    cached, cache_keys = {}, {}
+    missing = object()
+
+    for i, k in enumerate(keys):
+
+        try:
+            code_check = code(beam=beams[k], **code_kwargs)
+            cache_key = cache.key(
+                code_check=code_check, check=check, check_kwargs=check_kwargs
+            )
+        except Exception:
+            continue
+
+        result = cache.get(cache_key, default=missing)
+
+        if result is missing:
+            cache_keys[i] = cache_key
+        else:
+            cached[i] = BatchResult(index=i, key=k, result=result)
+
+    return cached, cache_keys
+
+
+def _ordered_results(*, futures, keys: List[Any]) -> Iterator[BatchResult]:
+    """
+    Helper function for ``check_all`` that yields the results of the chunks in input
+    order, as soon as all preceding chunks are complete.
+
+    :param futures: A dictionary of futures mapped to the chunk of beam indices they
+        check.
+    :param keys: The keys of the beams.
+    :return: An iterator of ``BatchResult`` objects.
+    """
+
+    pending = {chunk[0]: future for future, chunk in futures.items()}
+
+    for first in sorted(pending):
+
+        future = pending[first]
+
+        yield from _chunk_results(future=future, chunk=futures[future], keys=keys)
+
+
+def _chunk_results(*, future, chunk: List[int], keys: List[Any]) -> List[BatchResult]:
+    """
+    Helper function for ``check_all`` that gets the results of a chunk. If the whole
+    chunk failed (i.e. if the worker process died), a failed ``BatchResult`` is
+    returned for every beam in the chunk.
+
+    :param future: The future of the chunk.
+    :param chunk: The indices of the beams in the chunk.
+    :param keys: The keys of the beams.
+    :return: A list of ``BatchResult`` objects.
+    """
+
+    try:
+        return future.result()
+    except Exception as error:
+        error_traceback = traceback.format_exc()
+
+        return [
+            BatchResult(
+                index=i, key=keys[i], error=error, error_traceback=error_traceback
+            )
+            for i in chunk
+        ]
+
+
+def _check_chunk(
+    *,
+    items: List[Tuple[int, Any, SharedBeamHandle]],
+    code: Callable,
+    code_kwargs: Dict[str, Any],
+    check: str,
+    check_kwargs: Dict[str, Any],
+) -> List[BatchResult]:
+    """
+    Helper function for ``check_all`` that checks a chunk of beams in a worker.
+
+    :param items: A list of tuples of (index, key, SharedBeamHandle).
+    :param code: The ``CodeCheck`` class to check the beams with.
+    :param code_kwargs: Keyword arguments to create the ``CodeCheck`` objects with.
+    :param check: The name of the method to call on each ``CodeCheck`` object.
+    :param check_kwargs: Keyword arguments for the check method.
+    :return: A list of ``BatchResult`` objects.
+    """
+
+    names = {handle.name for _, _, handle in items}
+
+    for name in names:
+        acquire(name=name)
+
+    try:
+        return [
+            _check_item(
+                index=index,
+                key=key,
+                handle=handle,
+                code=code,
+                code_kwargs=code_kwargs,
+                check=check,
+                check_kwargs=check_kwargs,
+            )
+            for index, key, handle in items
+        ]
+
+    finally:
+        # detach from the shared memory once the chunk is complete, unless another
+        # chunk in this process is still using it.
+        for name in names:
+            release(name=name)
+
+
+def _check_item(
+    *,
+    index: int,
+    key: Any,
+    handle: SharedBeamHandle,
+    code: Callable,
+    code_kwargs: Dict[str, Any],
+    check: str,
+    check_kwargs: Dict[str, Any],
+) -> BatchResult:
+    """
+    Helper function for ``_check_chunk`` that checks a single beam. No references to
+    the rebuilt ``Beam`` (which is a view into shared memory) are kept once this
+    returns, so that the shared memory block can be detached.
+
+    :param index: The position of the ``Beam`` in the input.
+    :param key: The key of the ``Beam``.
+    :param handle: The ``SharedBeamHandle`` of the ``Beam``.
+    :param code: The ``CodeCheck`` class to check the beam with.
+    :param code_kwargs: Keyword arguments to create the ``CodeCheck`` object with.
+    :param check: The name of the method to call on the ``CodeCheck`` object.
+    :param check_kwargs: Keyword arguments for the check method.
+    :return: A ``BatchResult`` object.
+    """
+
+    try:
+        beam = handle.beam()
+
+        try:
+            code_check = code(beam=beam, **code_kwargs)
+            result = getattr(code_check, check)(**check_kwargs)
+        finally:
+            release(name=handle.name)
+
+        return BatchResult(index=index, key=key, result=result)
+
+    except Exception as error:
+        error_traceback = traceback.format_exc()
+
+        # the traceback references the frames that hold the beam, and is already
+        # captured as a string.
+        return BatchResult(
+            index=index,
+            key=key,
+            error=error.with_traceback(None),
+            error_traceback=error_traceback,
+        )
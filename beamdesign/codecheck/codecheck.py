@@ -2,14 +2,18 @@
 This will contain an Abstract Base Class that all codecheck classes should inherit from.
 """
 
+import hashlib
 from abc import ABC, abstractmethod
-from typing import List, Union, Tuple
+from typing import Any, Dict, List, Union, Tuple
 
 import numpy as np
 
 from beamdesign.beam import Beam
+from beamdesign.codecheck.kernel import CheckKernel
+from beamdesign.codecheck.utilisation import Utilisation
 from beamdesign.sections.section import Section
 from beamdesign.utility.exceptions import CodeCheckError, SectionOnlyError
+from beamdesign.utility.instrumentation import Instrumentation
 from beamdesign.const import LoadComponents
 
 DEFAULT_ASSESSMENT_POINTS = 20
@@ -27,7 +31,12 @@ class CodeCheck(ABC):
     """
 
     def __init__(
-        self, *, beam: Beam = None, section=None, assessment_points: int = None
+        self,
+        *,
+        beam: Beam = None,
+        section=None,
+        assessment_points: int = None,
+        stations_only: bool = False,
     ):
         """
         Constructor for a ``CodeCheck`` object.
@@ -39,6 +48,9 @@ class CodeCheck(ABC):
         :param assessment_points: The minimum number of points to be checked when
             determining utilisations etc. Note that more points may actually be checked
             due to load and element discontinuities etc.
+        :param stations_only: If ``True``, checks that allow it are only assessed at
+            the load stations (see ``stations_only``) rather than at
+            ``assessment_points`` equally spaced points as well.
         """
 
         if beam is None and section is None:
@@ -55,6 +67,14 @@ class CodeCheck(ABC):
         else:
             self._assessment_points = assessment_points
 
+        self._stations_only = stations_only
+
+        self._cache = {}
+        self._cache_key = None
+
+        # opt-in timers, counters & cache statistics. Disabled by default.
+        self.instrumentation = Instrumentation()
+
     @property
     def beam(self) -> Beam:
         """
@@ -114,6 +134,76 @@ class CodeCheck(ABC):
 
         self._assessment_points = assessment_points
 
+    @property
+    def stations_only(self) -> bool:
+        """
+        Are checks only assessed at the load stations (the element starts & ends, the
+        stored load positions and any restraints) instead of also at
+        ``assessment_points`` equally spaced points?
+
+        Loads vary linearly between the stations and capacities do not change between
+        them, so for checks where the utilisation is a convex function of the loads
+        (see ``CheckKernel.convex``) the maximum utilisation is always at a station. For
+        these checks assessing the stations only gives the exact maximum utilisation
+        with far fewer evaluations on long beams. Checks that are not convex are always
+        assessed at the equally spaced points as well.
+        """
+        return self._stations_only
+
+    @stations_only.setter
+    def stations_only(self, stations_only: bool):
+        """
+        Are checks only assessed at the load stations? See ``stations_only``.
+
+        :param stations_only: Assess checks at the load stations only?
+        """
+
+        self._stations_only = stations_only
+
+    def assessment_positions(
+        self, *, load_case: Union[int, List[int]] = None
+    ) -> np.ndarray:
+        """
+        Returns the grid of positions at which utilisation etc. will be assessed when
+        no positions are specified. This includes at least ``assessment_points``
+        equally spaced positions, as well as all element starts & ends and the load
+        discontinuities in every given load case. See ``Beam.assessment_positions``.
+
+        If the ``CodeCheck`` object is a section based object, it will raise a
+        SectionOnlyError.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all
+            load cases are considered.
+        :return: A sorted numpy array of unique positions.
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"assessment_positions does not apply to Section based CodeCheck "
+                + f"objects."
+            )
+
+        if isinstance(load_case, int):
+            load_case = [load_case]
+
+        return self.beam.assessment_positions(
+            min_positions=self.assessment_points, load_cases=load_case
+        )
+
+    @property
+    def tension_capacity_load_dependent(self) -> bool:
+        """
+        Does the tension capacity depend on the load applied (i.e. through interaction
+        with other load components)?
+
+        If ``False``, the tension utilisation can be calculated directly as
+        load / capacity. If ``True`` an iterative solution is required. By default this
+        is ``True`` so that an iterative solution is used unless a ``CodeCheck``
+        sub-class states otherwise.
+        """
+
+        return True
+
     @abstractmethod
     def tension_capacity(self, *, position: Union[List[float], float] = None):
         """
@@ -133,7 +223,7 @@ class CodeCheck(ABC):
     @abstractmethod
     def tension_utilisation(
         self, *, load_case: int = None, position: Union[List[float], float] = None
-    ) -> float:
+    ) -> Utilisation:
         """
         Get the utilisation ratio of the section in tension.
 
@@ -151,11 +241,486 @@ class CodeCheck(ABC):
             which is the highest tension utilisation of the entire object.
         :param load_case: The load case to get the utilisation ratio in - if ``None``,
             return the highest utilisation ratio of any load case.
-        :return: The utilisation of the section in tension.
+        :return: The utilisation of the section in tension, as a ``Utilisation`` object.
+            This is a float equal to the highest utilisation, which also stores the
+            utilisation in each load case at each position checked.
+        """
+
+        raise NotImplementedError()
+
+    def tension_utilisation_bound(self, *, load_case: Union[int, List[int]] = None):
+        """
+        Get a cheap upper bound on the tension utilisation, for screening. Sub-classes
+        should implement this using the load envelope of the beam and the minimum
+        capacity along it, rather than a detailed check.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the tension utilisation.
         """
 
         raise NotImplementedError()
 
+    def utilisation_bound(self, *, load_case: Union[int, List[int]] = None) -> float:
+        """
+        Get a cheap upper bound on the utilisation of the object in any of the checks
+        implemented, for screening. By default only the tension check is included, so
+        sub-classes that implement other checks must override this to include the
+        bounds of every check they implement. Otherwise ``screen`` may pass objects that
+        fail one of the other checks.
+
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: An upper bound on the utilisation.
+        """
+
+        return self.tension_utilisation_bound(load_case=load_case)
+
+    def screen(
+        self, *, threshold: float, load_case: Union[int, List[int]] = None
+    ) -> bool:
+        """
+        Screens the object, to determine if a detailed check is required.
+
+        The utilisation bound (see ``utilisation_bound``) is compared to ``threshold``.
+        If the bound is below the threshold the object passes the screening, and the
+        actual utilisation in every check included in the bound is guaranteed to also
+        be below the threshold.
+
+        :param threshold: The utilisation threshold below which the object passes the
+            screening (i.e. 0.7).
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :return: ``True`` if the object passes the screening and no detailed check is
+            required, ``False`` otherwise.
+        """
+
+        return self.utilisation_bound(load_case=load_case) < threshold
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """
+        The parameters that the results of the ``CodeCheck`` object depend on, other
+        than the beam or section itself (i.e. capacity factors). Sub-classes should
+        extend this with their own parameters, so that persistent result caches (see
+        ``beamdesign.codecheck.resultcache``) are invalidated when they change.
+
+        :return: A dictionary of parameter values.
+        """
+
+        return {
+            "code": f"{type(self).__module__}.{type(self).__qualname__}",
+            "assessment_points": self.assessment_points,
+            "stations_only": self.stations_only,
+        }
+
+    def _cache_state(self) -> tuple:
+        """
+        The state that cached values depend on. If this changes, all cached values are
+        discarded. By default this is the ``section_version`` of the ``Beam`` and the
+        content of the sections (which can be modified in place without changing the
+        ``section_version``); sub-classes should extend it with any factors their
+        capacities depend on.
+        """
+
+        if self.beam is None:
+            return (None, self.section.content_hash)
+
+        return (self.beam.section_version, self.beam.section_hash)
+
+    def _cached(self, key, function):
+        """
+        Helper method to get a cached value, recalculating it with the provided
+        function if it has not yet been calculated or if ``_cache_state`` has changed
+        since it was calculated.
+
+        :param key: The key to store the value under.
+        :param function: A function with no arguments that calculates the value.
+        :return: The cached value.
+        """
+
+        cache_key = self._cache_state()
+
+        if self._cache_key != cache_key:
+            self._cache = {}
+            self._cache_key = cache_key
+
+        if self.instrumentation.enabled:
+            name = key if isinstance(key, str) else ":".join(str(k) for k in key[:2])
+            self.instrumentation.cache(name, hit=key in self._cache)
+
+        if key not in self._cache:
+            self._cache[key] = function()
+
+        return self._cache[key]
+
+    def kernel_utilisation(
+        self,
+        *,
+        kernel: CheckKernel,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Utilisation:
+        """
+        Runs a check described by a ``CheckKernel`` and returns the utilisation.
+
+        This is the common driver for all checks: it resolves the load cases and the
+        positions to check, fetches the loads in all load cases at once, finds the
+        capacity at each position and applies the kernel. The results of each load case
+        are cached, and only recalculated if the loads in that load case change.
+
+        :param kernel: The ``CheckKernel`` describing the check.
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            positions are as per ``assessment_positions``, or only the load stations
+            if ``stations_only`` is set and the check is convex.
+        :return: The utilisation, as a ``Utilisation`` object.
+        """
+
+        if load_case is None:
+            load_case = self.beam.load_cases
+
+        if isinstance(load_case, int):
+            # convert into List now for consistency later.
+            load_case = [load_case]
+
+        positions, utilisation = self._incremental_kernel_matrix(
+            kernel=kernel, load_case=load_case, position=position
+        )
+
+        return Utilisation(
+            load_cases=load_case, positions=positions, utilisation=utilisation
+        )
+
+    def kernel_utilisation_max(
+        self,
+        *,
+        kernels: List[CheckKernel],
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Utilisation:
+        """
+        Runs several checks described by ``CheckKernel`` objects at the same positions,
+        and returns the maximum utilisation of any of them at each position (i.e. the
+        utilisation in either direction for checks about both axes).
+
+        :param kernels: The ``CheckKernel`` objects describing the checks.
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            positions are the union of the default positions of each check.
+        :return: The utilisation, as a ``Utilisation`` object.
+        """
+
+        if load_case is None:
+            load_case = self.beam.load_cases
+
+        if isinstance(load_case, int):
+            # convert into List now for consistency later.
+            load_case = [load_case]
+
+        if position is None:
+            # all the checks must be made at the same positions to be combined.
+            position = np.unique(
+                np.concatenate(
+                    [
+                        self._kernel_positions(kernel=k, load_case=load_case)
+                        for k in kernels
+                    ]
+                )
+            )
+
+        results = [
+            self.kernel_utilisation(kernel=k, load_case=load_case, position=position)
+            for k in kernels
+        ]
+
+        return Utilisation(
+            load_cases=load_case,
+            positions=results[0].positions,
+            utilisation=np.maximum.reduce([r.utilisation for r in results]),
+        )
+
+    def kernel_utilisation_matrix(
+        self,
+        *,
+        kernel: CheckKernel,
+        load_case: Union[int, List[int]] = None,
+        position: Union[List[float], float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the utilisation of a check described by a ``CheckKernel`` in every
+        load case at every position, in a single pass.
+
+        Where a position is at a load or element discontinuity multiple values are
+        returned at that position. The capacity at a position is the minimum capacity
+        of any of the elements at that position.
+
+        If the ``CodeCheck`` object is a section based object, it will raise a
+        SectionOnlyError.
+
+        :param kernel: The ``CheckKernel`` describing the check.
+        :param load_case: The load case or load cases to consider. If ``None``, all load
+            cases are considered.
+        :param position: The position or positions to consider. If ``None``, the
+            positions are as per ``assessment_positions``, or only the load stations
+            if ``stations_only`` is set and the check is convex.
+        :return: A tuple of the positions and the utilisation:
+
+            (
+                np.array([pos_0, ..., pos_n]),
+                np.array(
+                    [
+                        [util_case_0_pos_0, ..., util_case_0_pos_n],
+                        ...
+                        [util_case_m_pos_0, ..., util_case_m_pos_n],
+                    ]
+                )
+            )
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"kernel_utilisation_matrix does not apply to Section based CodeCheck "
+                + f"objects."
+            )
+
+        if load_case is None:
+            load_case = self.beam.load_cases
+
+        if isinstance(load_case, int):
+            # convert into List now for consistency later.
+            load_case = [load_case]
+
+        instrumentation = self.instrumentation
+        instrumentation.count(f"kernel_utilisation_matrix:{kernel.name}")
+
+        if position is None:
+            with instrumentation.timer("positions"):
+                position = self._kernel_positions(kernel=kernel, load_case=load_case)
+
+        with instrumentation.timer("load_fetch"):
+            positions, elements, loads = self.beam.get_loads_multi_case(
+                position=position, load_cases=load_case, component=kernel.components
+            )
+
+        with instrumentation.timer("capacity"):
+            capacity = self._kernel_capacity(
+                kernel=kernel, positions=positions, elements=elements
+            )
+
+        with instrumentation.timer("solve"):
+            utilisation = kernel.utilisation(kernel.demand(loads), capacity)
+
+        return positions, utilisation
+
+    def _kernel_capacity(
+        self, *, kernel: CheckKernel, positions: np.ndarray, elements: np.ndarray
+    ) -> np.ndarray:
+        """
+        Helper method to get the capacity of a check at each row of loads returned by
+        ``Beam.get_loads_multi_case``.
+
+        :param kernel: The ``CheckKernel`` describing the check.
+        :param positions: The position of each row.
+        :param elements: The element of each row.
+        :return: An array of the capacity of each row. Where multiple rows are at the
+            same position, all rows take the minimum capacity at that position.
+        """
+
+        # the capacities are cached per element, so that they are only calculated once.
+        capacity = np.asarray(
+            self._cached(("capacity",) + kernel.cache_key, kernel.capacity)
+        )
+
+        if kernel.restraints is None:
+            capacity = capacity[elements]
+        else:
+            # a position at a restraint is in the segments either side of it, so use
+            # the minimum capacity of both segments.
+            last = kernel.restraints.shape[0] - 2
+
+            after = np.searchsorted(kernel.restraints, positions, side="right") - 1
+            before = np.searchsorted(kernel.restraints, positions, side="left") - 1
+
+            capacity = np.minimum(
+                capacity[np.clip(after, 0, last), elements],
+                capacity[np.clip(before, 0, last), elements],
+            )
+
+        # at discontinuities use the minimum capacity of all elements at the position.
+        _, group_start, group = np.unique(
+            positions, return_index=True, return_inverse=True
+        )
+        return np.minimum.reduceat(capacity, group_start)[group]
+
+    def _kernel_positions(
+        self, *, kernel: CheckKernel, load_case: List[int], base: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Helper method to get the default positions to check for a ``CheckKernel``. This
+        is the union of the base positions and any restraints of the kernel, as the
+        capacity may change at a restraint.
+
+        :param kernel: The ``CheckKernel`` describing the check.
+        :param load_case: The load cases to consider.
+        :param base: The base positions. If ``None``, ``assessment_positions`` is used,
+            or the load stations if ``stations_only`` is set and the check is convex.
+        :return: A sorted numpy array of unique positions.
+        """
+
+        if base is None:
+            if self.stations_only and kernel.convex:
+                base = self.beam.station_positions(load_cases=load_case)
+            else:
+                base = self.assessment_positions(load_case=load_case)
+
+        if kernel.restraints is None:
+            return base
+
+        return np.union1d(base, kernel.restraints)
+
+    def _incremental_kernel_matrix(
+        self,
+        *,
+        kernel: CheckKernel,
+        load_case: List[int],
+        position: Union[List[float], float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper method to calculate the utilisation matrix of a check, reusing the
+        results of any load cases that have not changed since they were last
+        calculated.
+
+        The results of each load case are stored against the content hashes of its
+        ``LoadCase`` objects and the positions it must be checked at. If no positions
+        are given these are the load case's own grid (the equally spaced positions,
+        element starts & ends and its own load discontinuities), so that changing one
+        load case does not invalidate any other. Only load cases whose loads (or grid)
+        have changed are recalculated. All results are discarded if ``_cache_state``
+        changes.
+
+        All load cases are returned at the union of their grids, so a reused load case
+        is only checked at the positions added by other load cases that it has not
+        already been checked at.
+
+        :param kernel: The ``CheckKernel`` describing the check.
+        :param load_case: The load cases to consider.
+        :param position: The positions to consider. If ``None``, the assessment
+            positions of each load case are used.
+        :return: A tuple of the positions and the utilisation, as per
+            ``kernel_utilisation_matrix``.
+        """
+
+        if position is None:
+            with self.instrumentation.timer("positions"):
+                grids = {
+                    l: self._kernel_positions(kernel=kernel, load_case=[l])
+                    for l in load_case
+                }
+                grid = np.unique(np.concatenate(list(grids.values())))
+        else:
+            grid = np.unique(np.asarray(position, dtype=float))
+            grids = {l: grid for l in load_case}
+
+        results = self._cached(("case_results",) + kernel.cache_key, dict)
+
+        keys = {
+            l: (
+                tuple(e.loads[l].content_hash for e in self.beam.elements),
+                hashlib.blake2b(grids[l].tobytes(), digest_size=16).hexdigest(),
+            )
+            for l in load_case
+        }
+
+        changed = [l for l in load_case if l not in results or results[l][0] != keys[l]]
+
+        self.instrumentation.count("cases_recalculated", len(changed))
+        self.instrumentation.count("cases_reused", len(load_case) - len(changed))
+
+        if changed:
+            positions, utilisation = self.kernel_utilisation_matrix(
+                kernel=kernel, load_case=changed, position=grid
+            )
+
+            for l, u in zip(changed, utilisation):
+                results[l] = (keys[l], positions, u)
+
+        # a reused load case may not have been checked at the positions added by the
+        # other load cases. Any positions no longer required are dropped. Load cases
+        # missing the same positions are checked together.
+        missing = {}
+
+        for l in load_case:
+            _, p, u = results[l]
+
+            keep = np.isin(p, grid)
+            results[l] = (keys[l], p[keep], u[keep])
+
+            m = np.setdiff1d(grid, p)
+
+            if m.shape[0] > 0:
+                missing.setdefault(m.tobytes(), (m, []))[1].append(l)
+
+        for m, cases in missing.values():
+
+            positions, utilisation = self.kernel_utilisation_matrix(
+                kernel=kernel, load_case=cases, position=m
+            )
+
+            for l, u in zip(cases, utilisation):
+                _, p, v = results[l]
+
+                p = np.concatenate([p, positions])
+                order = np.argsort(p, kind="stable")
+
+                results[l] = (keys[l], p[order], np.concatenate([v, u])[order])
+
+        return self._merge_case_rows(
+            rows=[(results[l][1], results[l][2]) for l in load_case]
+        )
+
+    @staticmethod
+    def _merge_case_rows(
+        *, rows: List[Tuple[np.ndarray, np.ndarray]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Helper method to merge the utilisation of multiple load cases, calculated
+        separately at the same positions, into a single matrix.
+
+        Where load cases have a different no. of values at a position (i.e. at a load
+        discontinuity in only some load cases), the load cases with fewer values repeat
+        their last value at that position.
+
+        :param rows: A list of tuples of (positions, utilisation) for each load case.
+            The positions must be sorted, and every load case must have at least one
+            value at each of the same unique positions.
+        :return: A tuple of the positions and the utilisation matrix.
+        """
+
+        unique = np.unique(rows[0][0])
+
+        starts = np.array([np.searchsorted(p, unique, side="left") for p, u in rows])
+        stops = np.array([np.searchsorted(p, unique, side="right") for p, u in rows])
+        counts = stops - starts
+
+        merged_counts = np.max(counts, axis=0)
+
+        index = np.repeat(np.arange(unique.shape[0]), merged_counts)
+        occurrence = np.arange(index.shape[0]) - np.repeat(
+            np.cumsum(merged_counts) - merged_counts, merged_counts
+        )
+
+        utilisation = np.array(
+            [
+                u[s[index] + np.minimum(occurrence, c[index] - 1)]
+                for (p, u), s, c in zip(rows, starts, counts)
+            ]
+        )
+
+        return unique[index], utilisation
+
     @abstractmethod
     def get_section(
         self,
@@ -194,7 +759,47 @@ class CodeCheck(ABC):
                 f"get_section does not apply to Section based CodeCheck objects."
             )
 
-        return self.beam.get_section(
+        with self.instrumentation.timer("positions"):
+            return self.beam.get_section(
+                position=position, min_positions=min_positions, load_case=load_case
+            )
+
+    def get_section_runs(
+        self,
+        *,
+        position: Union[List[float], float] = None,
+        min_positions: int = None,
+        load_case: int = None,
+    ) -> Tuple[List[float], np.ndarray, List[Tuple[float, float, Section]]]:
+        """
+        A run-length version of ``CodeCheck.get_section``. Returns the runs of adjacent
+        elements with the same section along the beam, and the index of the run at each
+        position. See ``Beam.get_section_runs``.
+
+        If the ``CodeCheck`` object is a section based object, it will raise a
+        SectionOnlyError.
+
+        :param min_positions: The minimum no. of positions to return.
+        :param position: The position to return the section from. If ``None`` it returns
+            all sections. If a position is given it returns the sections at the given
+            positions.
+        :param load_case: The load case to consider if using min_positions. Can be
+            ``None``, in which case only the start & ends of elements are returned.
+        :return: Returns a tuple of positions, run indices and runs:
+
+            (
+                [pos_1, ..., pos_n]
+                [run_1, ..., run_n]
+                [(start_0, end_0, section_0), ..., (start_m, end_m, section_m)]
+            )
+        """
+
+        if self.beam is None:
+            raise SectionOnlyError(
+                f"get_section_runs does not apply to Section based CodeCheck objects."
+            )
+
+        return self.beam.get_section_runs(
             position=position, min_positions=min_positions, load_case=load_case
         )
 
@@ -260,12 +865,13 @@ class CodeCheck(ABC):
                 "The CodeCheck object is a section only object and has no stored loads."
             )
 
-        return self.beam.get_loads(
-            load_case=load_case,
-            position=position,
-            min_positions=min_positions,
-            component=component,
-        )
+        with self.instrumentation.timer("load_fetch"):
+            return self.beam.get_loads(
+                load_case=load_case,
+                position=position,
+                min_positions=min_positions,
+                component=component,
+            )
 
     @abstractmethod
     def get_tension(
@@ -0,0 +1,176 @@
+"""
+Contains the ``CheckKernel`` class, which describes a single vectorised design check
+(i.e. tension, compression etc.) so that it can be run by the generic utilisation driver
+in ``CodeCheck``.
+"""
+
+from typing import Callable, List, Sequence, Union
+
+import numpy as np
+
+from beamdesign.const import LoadComponents
+from beamdesign.utility.instrumentation import Instrumentation
+from beamdesign.utility.solvers import secant
+
+
+def ratio_utilisation(demand: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    """
+    Calculates the utilisation directly as demand / capacity. Suitable for any check
+    where the capacity is independent of the applied load. Where the demand is <= 0 the
+    utilisation is 0.
+
+    :param demand: An array of the demand, of shape (no. load cases, no. positions).
+    :param capacity: An array of the capacity at each position, of shape
+        (no. positions, ).
+    :return: An array of the utilisation, of the same shape as ``demand``.
+    """
+
+    demand = np.asarray(demand, dtype=float)
+    capacity = np.broadcast_to(capacity, demand.shape)
+
+    return np.divide(demand, capacity, out=np.zeros(demand.shape), where=demand > 0.0)
+
+
+def iterative_utilisation(
+    demand: np.ndarray, capacity: np.ndarray, *, instrumentation: Instrumentation = None
+) -> np.ndarray:
+    """
+    Calculates the utilisation by solving for the load factor at which the demand
+    matches the capacity. This is required where the capacity depends on the applied
+    load. Where the demand is <= 0 the utilisation is 0.
+
+    :param demand: An array of the demand, of shape (no. load cases, no. positions).
+    :param capacity: An array of the capacity at each position, of shape
+        (no. positions, ).
+    :param instrumentation: An optional ``Instrumentation`` object to record the no.
+        of solver calls & iterations in.
+    :return: An array of the utilisation, of the same shape as ``demand``.
+    """
+
+    demand = np.asarray(demand, dtype=float)
+    capacity = np.broadcast_to(capacity, demand.shape)
+
+    utilisation = np.zeros(demand.shape)
+
+    def util_func(x, load, capacity_func):
+
+        return (x * load) / capacity_func(x * load) - 1.0
+
+    for index in zip(*np.nonzero(demand > 0.0)):
+
+        cap = capacity[index]
+
+        def cap_func(load):
+            return cap
+
+        x, i, b = secant(
+            util_func,
+            demand[index],
+            cap_func,
+            x_low=-100_000,
+            x_high=100_000,
+            fallback=False,
+        )
+
+        if instrumentation is not None:
+            instrumentation.count("solver_calls")
+            instrumentation.count("solver_iterations", i)
+
+        if x != 0.0:
+            x = 1 / x
+
+        utilisation[index] = x
+
+    return utilisation
+
+
+class CheckKernel:
+    """
+    Describes a single design check as a set of vectorised functions, so that the
+    utilisation driver in ``CodeCheck`` can handle the assessment positions, fetching
+    loads in multiple load cases, caching and building ``Utilisation`` objects once for
+    every check.
+
+    A check provides:
+
+    * the load components it requires.
+    * a demand function that converts the loads into the demand on the member.
+    * a capacity function that returns the capacity of each element of the beam, or
+      of each element in each segment between restraints for member checks.
+    * a utilisation function that combines demand and capacity into utilisation.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        component: Union[LoadComponents, List[LoadComponents]],
+        demand: Callable[[np.ndarray], np.ndarray],
+        capacity: Callable[[], np.ndarray],
+        utilisation: Callable[[np.ndarray, np.ndarray], np.ndarray] = None,
+        restraints: Sequence[float] = None,
+        convex: bool = False,
+    ):
+        """
+        Constructor for a ``CheckKernel``.
+
+        :param name: The name of the check. Results are cached against this name, so it
+            should be unique among the checks of a ``CodeCheck`` object.
+        :param component: The load component or components required by the check.
+        :param demand: A function that takes an array of loads of shape
+            (no. load cases, no. positions, no. components), with the components in the
+            order given by ``component``, and returns an array of the demand of shape
+            (no. load cases, no. positions). Checks with a custom ``utilisation``
+            function may return extra trailing axes (i.e. the full load tensor).
+        :param capacity: A function with no arguments that returns an array of the
+            capacity of each element in the beam, of shape (no. elements, ). If
+            ``restraints`` are given, it should instead return the capacity of each
+            element in each segment, of shape (no. segments, no. elements). Checks with
+            multiple capacities (i.e. combined actions) may add a trailing axis of
+            capacities, which are each reduced to their minimum at discontinuities.
+        :param utilisation: A function that takes the demand and an array of the
+            capacity at each position (of shape (no. positions, ) plus any trailing
+            axes), and returns the utilisation. If ``None``, ``ratio_utilisation`` is
+            used.
+        :param restraints: The positions of the restraints that split the beam into
+            segments, including the start & end of the beam, for checks where the
+            capacity depends on the segment (i.e. member buckling checks). If ``None``,
+            the capacity depends only on the element.
+        :param convex: Is the utilisation a convex function of the loads, for a
+            constant capacity (i.e. demand / capacity where the demand is a magnitude
+            or the positive part of a load component)? Loads vary linearly between the
+            load stations, so the maximum utilisation of a convex check between 2x
+            adjacent stations is at one of them, and the check can be assessed at the
+            stations only (see ``CodeCheck.stations_only``).
+        """
+
+        if not isinstance(component, list):
+            component = [component]
+
+        self.name = name
+        self.components = component
+        self.demand = demand
+        self.capacity = capacity
+        self.utilisation = ratio_utilisation if utilisation is None else utilisation
+        self.restraints = (
+            None if restraints is None else np.asarray(restraints, dtype=float)
+        )
+        self.convex = convex
+
+    @property
+    def cache_key(self) -> tuple:
+        """
+        The key that cached values for this check are stored against. Includes the
+        restraints, as the capacities depend on them.
+        """
+
+        restraints = None if self.restraints is None else tuple(self.restraints)
+
+        return (self.name, restraints)
+
+    def __repr__(self):
+
+        return (
+            f"{type(self).__name__}(name={repr(self.name)}, "
+            + f"components={self.components})"
+        )
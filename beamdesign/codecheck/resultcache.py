@@ -0,0 +1,245 @@
+"""
+Contains the ``ResultCache`` class, a persistent on-disk cache of the results of
+``CodeCheck`` checks.
+
+Results are content-addressed: each result is stored against a stable hash of the
+``CodeCheck`` parameters (see ``CodeCheck.parameters``), the check called and its
+arguments, and the contents of the ``Beam`` (see ``Beam.content_hash``) or ``Section``
+checked. Re-checking a model where only some members have changed therefore only
+recalculates the changed members.
+
+The cache directory is bounded in size. When it grows beyond its limit, the least
+recently used results are evicted.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from beamdesign.codecheck.codecheck import CodeCheck
+
+# the default maximum size of the cache directory, in bytes.
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+_SUFFIX = ".pkl"
+
+
+class ResultCache:
+    """
+    A persistent, size-bounded cache of check results stored in a local directory.
+    """
+
+    def __init__(self, *, path: Union[str, Path], max_bytes: int = None):
+        """
+        Constructor for a ``ResultCache``. The directory is created if it does not
+        exist, and any results already in it are reused.
+
+        :param path: The directory to store the results in.
+        :param max_bytes: The maximum total size of the stored results, in bytes. If
+            ``None``, ``DEFAULT_MAX_BYTES`` is used.
+        """
+
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+
+        self._max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self._size = sum(f.stat().st_size for f in self._files())
+
+    @property
+    def path(self) -> Path:
+        """
+        The directory the results are stored in.
+        """
+
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        The maximum total size of the stored results, in bytes.
+        """
+
+        return self._max_bytes
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the stored results, in bytes.
+        """
+
+        return self._size
+
+    def key(
+        self, *, code_check: CodeCheck, check: str, check_kwargs: Dict[str, Any] = None
+    ) -> str:
+        """
+        Calculates the key that the result of a check is stored against.
+
+        :param code_check: The ``CodeCheck`` object that is checked.
+        :param check: The name of the check method (i.e. "tension_utilisation").
+        :param check_kwargs: The keyword arguments for the check method.
+        :return: The key, as a hex string.
+        """
+
+        if code_check.beam is not None:
+            subject = code_check.beam.content_hash
+        else:
+            subject = code_check.section.content_hash
+
+        check_kwargs = sorted((check_kwargs or {}).items())
+
+        content = repr(
+            (sorted(code_check.parameters.items()), check, check_kwargs, subject)
+        )
+
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Gets a stored result.
+
+        :param key: The key of the result.
+        :param default: The value to return if there is no stored result.
+        :return: The stored result, or ``default``.
+        """
+
+        file = self._file(key)
+
+        try:
+            with open(file, "rb") as f:
+                result = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return default
+
+        # mark the result as recently used, for eviction.
+        try:
+            os.utime(file)
+        except FileNotFoundError:
+            pass
+
+        return result
+
+    def put(self, key: str, result: Any):
+        """
+        Stores a result, evicting the least recently used results if the cache grows
+        beyond ``max_bytes``.
+
+        :param key: The key of the result.
+        :param result: The result to store. Must be picklable.
+        """
+
+        file = self._file(key)
+
+        if file.exists():
+            self._size -= file.stat().st_size
+
+        # write to a temporary file first so that other processes never read a
+        # partially written result.
+        handle, temp = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+
+        with os.fdopen(handle, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp, file)
+
+        self._size += file.stat().st_size
+
+        if self._size > self._max_bytes:
+            self._evict()
+
+    def check(
+        self, *, code_check: CodeCheck, check: str, check_kwargs: Dict[str, Any] = None
+    ) -> Any:
+        """
+        Gets the result of a check, from the cache if it has been stored previously and
+        otherwise by calling the check (and storing the result).
+
+        :param code_check: The ``CodeCheck`` object to check.
+        :param check: The name of the check method (i.e. "tension_utilisation").
+        :param check_kwargs: The keyword arguments for the check method.
+        :return: The result of the check.
+        """
+
+        if check_kwargs is None:
+            check_kwargs = {}
+
+        key = self.key(code_check=code_check, check=check, check_kwargs=check_kwargs)
+
+        result = self.get(key, default=_MISSING)
+
+        if result is _MISSING:
+            result = getattr(code_check, check)(**check_kwargs)
+            self.put(key, result)
+
+        return result
+
+    def clear(self):
+        """
+        Removes all stored results.
+        """
+
+        for f in self._files():
+            f.unlink(missing_ok=True)
+
+        self._size = 0
+
+    def __contains__(self, key: str) -> bool:
+
+        return self._file(key).exists()
+
+    def __len__(self) -> int:
+
+        return sum(1 for _ in self._files())
+
+    def _file(self, key: str) -> Path:
+        """
+        Helper method to get the file a result is stored in.
+
+        :param key: The key of the result.
+        :return: The path to the file.
+        """
+
+        return self._path / f"{key}{_SUFFIX}"
+
+    def _files(self):
+        """
+        Helper method to iterate over the stored result files.
+        """
+
+        return self._path.glob(f"*{_SUFFIX}")
+
+    def _evict(self):
+        """
+        Helper method to remove the least recently used results until the cache is
+        within ``max_bytes``.
+        """
+
+        files = []
+
+        for f in self._files():
+            try:
+                stat = f.stat()
+            except FileNotFoundError:
+                continue
+
+            files += [(stat.st_mtime_ns, stat.st_size, f)]
+
+        files.sort()
+
+        # re-sync the size, as other processes may share the directory.
+        self._size = sum(size for _, size, _ in files)
+
+        for _, size, f in files:
+
+            if self._size <= self._max_bytes:
+                break
+
+            f.unlink(missing_ok=True)
+            self._size -= size
+
+
+# a sentinel for results that are not in the cache (None is a valid result).
+_MISSING = object()
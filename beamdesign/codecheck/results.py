@@ -0,0 +1,270 @@
+"""
+Contains the ``ResultStore`` class, a sink that streams the results of checking many
+``Beam`` objects into a local SQLite database rather than holding them in memory.
+
+Each check of a beam is stored as one row per load case, holding the maximum
+utilisation in that load case and the position at which it occurs. Rows are buffered
+and written in batches, and the table is indexed so that queries such as the N worst
+members can be answered without loading all the results.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from beamdesign.codecheck.batch import BatchResult
+from beamdesign.codecheck.utilisation import Utilisation
+
+# the default no. of rows to buffer before writing them to the database.
+DEFAULT_BATCH_SIZE = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    beam,
+    "check" TEXT NOT NULL,
+    load_case,
+    position REAL,
+    utilisation REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_beam_check_utilisation
+    ON results (beam, "check", utilisation);
+CREATE INDEX IF NOT EXISTS results_check_utilisation
+    ON results ("check", utilisation);
+CREATE TABLE IF NOT EXISTS errors (
+    beam,
+    "check" TEXT NOT NULL,
+    error TEXT,
+    traceback TEXT
+);
+"""
+
+
+class ResultStore:
+    """
+    A sink for the results of checking many ``Beam`` objects, stored in a local SQLite
+    database.
+    """
+
+    def __init__(self, *, path: Union[str, Path], batch_size: int = None):
+        """
+        Constructor for a ``ResultStore``. If the database already exists, new results
+        are added to the existing results.
+
+        :param path: The path to the SQLite database file. Use ":memory:" for an
+            in-memory database.
+        :param batch_size: The no. of rows to buffer before writing them to the
+            database. If ``None``, ``DEFAULT_BATCH_SIZE`` is used.
+        """
+
+        self._connection = sqlite3.connect(str(path))
+        self._connection.executescript(_SCHEMA)
+
+        self._batch_size = DEFAULT_BATCH_SIZE if batch_size is None else batch_size
+        self._buffer = []
+
+    @property
+    def batch_size(self) -> int:
+        """
+        The no. of rows to buffer before writing them to the database.
+        """
+
+        return self._batch_size
+
+    def add(self, *, beam: Any, check: str, result: Union[Utilisation, float]):
+        """
+        Adds the result of a check of a single beam to the store.
+
+        :param beam: The key of the beam (i.e. its member tag).
+        :param check: The name of the check (i.e. "tension_utilisation").
+        :param result: The result of the check. A ``Utilisation`` is stored as one row
+            per load case; any other value is stored as a single row without a load
+            case or position.
+        """
+
+        beam = _sql_value(beam)
+
+        if isinstance(result, Utilisation):
+
+            utilisation = result.utilisation
+            governing = np.argmax(utilisation, axis=1)
+
+            case_max = utilisation[np.arange(utilisation.shape[0]), governing]
+            positions = result.positions[governing]
+
+            self._buffer += [
+                (beam, check, _sql_value(l), float(p), float(u))
+                for l, p, u in zip(result.load_cases, positions, case_max)
+            ]
+
+        else:
+            self._buffer += [(beam, check, None, None, float(result))]
+
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def add_error(self, *, beam: Any, check: str, error: Exception, traceback=None):
+        """
+        Records a check of a single beam that failed.
+
+        :param beam: The key of the beam.
+        :param check: The name of the check.
+        :param error: The exception raised by the check.
+        :param traceback: The formatted traceback of the exception, if available.
+        """
+
+        self._connection.execute(
+            'INSERT INTO errors (beam, "check", error, traceback) VALUES (?, ?, ?, ?)',
+            (_sql_value(beam), check, repr(error), traceback),
+        )
+
+    def add_batch_results(
+        self, results: Iterable[BatchResult], *, check: str
+    ) -> List[BatchResult]:
+        """
+        Streams the results of ``check_all`` into the store as they are produced, so
+        that they never all need to be held in memory.
+
+        :param results: An iterable of ``BatchResult`` objects.
+        :param check: The name of the check that produced the results.
+        :return: A list of any ``BatchResult`` objects for checks that failed. These are
+            also recorded in the store.
+        """
+
+        failed = []
+
+        for r in results:
+
+            if r.ok:
+                self.add(beam=r.key, check=check, result=r.result)
+            else:
+                self.add_error(
+                    beam=r.key,
+                    check=check,
+                    error=r.error,
+                    traceback=r.error_traceback,
+                )
+                failed += [r]
+
+        self.flush()
+
+        return failed
+
+    def flush(self):
+        """
+        Writes any buffered rows to the database.
+        """
+
+        if self._buffer:
+            self._connection.executemany(
+                'INSERT INTO results (beam, "check", load_case, position, utilisation)'
+                + " VALUES (?, ?, ?, ?, ?)",
+                self._buffer,
+            )
+            self._buffer = []
+
+        self._connection.commit()
+
+    def worst(
+        self, *, n: int = 10, check: str = None
+    ) -> List[Tuple[Any, str, Any, float, float]]:
+        """
+        Gets the N worst members, by their maximum utilisation.
+
+        :param n: The no. of members to return.
+        :param check: The check to consider. If ``None``, all checks are considered.
+        :return: A list of tuples, in order of decreasing utilisation:
+
+            [(beam, check, load_case, position, utilisation), ...]
+
+            with the check, load case & position at which each member's maximum
+            utilisation occurs.
+        """
+
+        self.flush()
+
+        where, parameters = ('WHERE "check" = ?', (check,)) if check else ("", ())
+
+        # SQLite returns the other columns from the row with the maximum utilisation.
+        return self._connection.execute(
+            'SELECT beam, "check", load_case, position, MAX(utilisation) AS u '
+            + f"FROM results {where} GROUP BY beam ORDER BY u DESC LIMIT ?",
+            parameters + (n,),
+        ).fetchall()
+
+    def beam_results(
+        self, *, beam: Any, check: str = None
+    ) -> List[Tuple[str, Any, float, float]]:
+        """
+        Gets all the stored results of a single member.
+
+        :param beam: The key of the beam.
+        :param check: The check to consider. If ``None``, all checks are returned.
+        :return: A list of tuples, in order of decreasing utilisation:
+
+            [(check, load_case, position, utilisation), ...]
+        """
+
+        self.flush()
+
+        where, parameters = "WHERE beam = ?", (_sql_value(beam),)
+
+        if check:
+            where += ' AND "check" = ?'
+            parameters += (check,)
+
+        return self._connection.execute(
+            'SELECT "check", load_case, position, utilisation '
+            + f"FROM results {where} ORDER BY utilisation DESC",
+            parameters,
+        ).fetchall()
+
+    def errors(self, *, check: str = None) -> List[Tuple[Any, str, str, str]]:
+        """
+        Gets the recorded errors.
+
+        :param check: The check to consider. If ``None``, all checks are returned.
+        :return: A list of tuples of (beam, check, error, traceback).
+        """
+
+        self.flush()
+
+        where, parameters = ('WHERE "check" = ?', (check,)) if check else ("", ())
+
+        return self._connection.execute(
+            f'SELECT beam, "check", error, traceback FROM errors {where}', parameters
+        ).fetchall()
+
+    def close(self):
+        """
+        Writes any buffered rows and closes the database.
+        """
+
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _sql_value(value: Any) -> Union[int, float, str]:
+    """
+    Helper function to convert a beam key or load case into a value that can be stored
+    in SQLite. Integers, floats & strings (including their numpy equivalents) are stored
+    as is, anything else is stored as its string representation.
+
+    :param value: The value to convert.
+    :return: The converted value.
+    """
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, (int, float, str)):
+        return value
+
+    return str(value)
@@ -0,0 +1,154 @@
+"""
+Contains the ``Utilisation`` class, used to return the results of utilisation checks.
+"""
+
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class Utilisation(float):
+    """
+    The result of a utilisation check. A ``Utilisation`` is a float equal to the
+    maximum utilisation, so it can be used anywhere the maximum utilisation was
+    previously returned, but it also stores the utilisation in every load case at every
+    position so that the governing load case & position can be found without repeating
+    the check.
+
+    The governing values & per load case maxima are only calculated when first
+    requested.
+    """
+
+    def __new__(
+        cls, *, load_cases: List[Any], positions: np.ndarray, utilisation: np.ndarray
+    ):
+        """
+        Constructor for a ``Utilisation`` object.
+
+        :param load_cases: The load cases that the utilisation was calculated in.
+        :param positions: The positions that the utilisation was calculated at. Where a
+            position is at a discontinuity it may be repeated.
+        :param utilisation: The utilisation in each load case at each position, as an
+            array of shape (no. load cases, no. positions).
+        """
+
+        positions = np.array(positions, dtype=float)
+        utilisation = np.array(utilisation, dtype=float)
+
+        if utilisation.shape != (len(load_cases), positions.shape[0]):
+            raise ValueError(
+                f"Expected utilisation to have shape "
+                + f"({len(load_cases)}, {positions.shape[0]}). "
+                + f"Shape was {utilisation.shape}."
+            )
+
+        obj = super().__new__(cls, np.max(utilisation))
+
+        obj._load_cases = list(load_cases)
+        obj._positions = positions
+        obj._utilisation = utilisation
+
+        positions.flags.writeable = False
+        utilisation.flags.writeable = False
+
+        return obj
+
+    def __getnewargs_ex__(self):
+        # required for pickling & copying as __new__ has keyword only arguments.
+        return (
+            (),
+            {
+                "load_cases": self._load_cases,
+                "positions": self._positions,
+                "utilisation": self._utilisation,
+            },
+        )
+
+    @property
+    def load_cases(self) -> List[Any]:
+        """
+        The load cases that the utilisation was calculated in.
+        """
+
+        return self._load_cases
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        The positions that the utilisation was calculated at.
+        """
+
+        return self._positions
+
+    @property
+    def utilisation(self) -> np.ndarray:
+        """
+        The utilisation in each load case at each position, as an array of shape
+        (no. load cases, no. positions).
+        """
+
+        return self._utilisation
+
+    @property
+    def max(self) -> float:
+        """
+        The maximum utilisation, as a plain float.
+        """
+
+        return float(self)
+
+    @cached_property
+    def governing_index(self) -> Tuple[int, int]:
+        """
+        The index of the governing utilisation in ``Utilisation.utilisation``, as a
+        tuple of (load case index, position index).
+        """
+
+        index = np.unravel_index(np.argmax(self._utilisation), self._utilisation.shape)
+
+        return int(index[0]), int(index[1])
+
+    @property
+    def governing_load_case(self) -> Any:
+        """
+        The load case with the maximum utilisation.
+        """
+
+        return self._load_cases[self.governing_index[0]]
+
+    @property
+    def governing_position(self) -> float:
+        """
+        The position with the maximum utilisation.
+        """
+
+        return float(self._positions[self.governing_index[1]])
+
+    @cached_property
+    def case_max(self) -> Dict[Any, float]:
+        """
+        The maximum utilisation in each load case, as a dictionary keyed by load case.
+        """
+
+        return {
+            case: float(u)
+            for case, u in zip(self._load_cases, np.max(self._utilisation, axis=1))
+        }
+
+    @cached_property
+    def envelope(self) -> np.ndarray:
+        """
+        The maximum utilisation of any load case at each position.
+        """
+
+        return np.max(self._utilisation, axis=0)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + f"max={float(self)}, "
+            + f"no. load cases={len(self._load_cases)}, "
+            + f"no. positions={self._positions.shape[0]}"
+            + f")"
+        )
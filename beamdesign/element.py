@@ -1,11 +1,12 @@
-from typing import Dict, List, Union
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple, Union
 
 import numpy as np
 
 from beamdesign.const import LoadComponents
 from beamdesign.loadcase import LoadCase
 from beamdesign.sections.section import Section
-from beamdesign.utility.exceptions import ElementLengthError
+from beamdesign.utility.exceptions import ElementCaseError, ElementLengthError
 
 
 class Element:
@@ -14,6 +15,13 @@ class Element:
     will form the basis of a single Beam object, to allow easier mapping between the
     output of FEA models, where multiple FEA elements will correspond to a single
     design ``Beam`` objects.
+
+    The ``length`` and ``section`` of an ``Element`` can be changed after it is
+    created, and individual load cases can be replaced with ``set_loads``. Each change
+    increments ``Element.version``, so that objects which cache quantities derived from
+    the ``Element`` can tell when their caches are stale. Changes to the length or
+    section also increment ``Element.section_version``, so that caches which do not
+    depend on the loads (i.e. capacities) can be kept when only the loads change.
     """
 
     def __init__(
@@ -29,26 +37,102 @@ class Element:
         :param section: The section of the ``Element``.
         """
 
+        self._version = 0
+        self._section_version = 0
+
+        self.length = length
+        self.section = section
+
+        self._loads = dict(loads)
+
+    @property
+    def version(self) -> int:
+        """
+        A counter that is incremented every time the ``Element`` is modified. Objects
+        that cache quantities derived from the ``Element`` can store the version they
+        were calculated at and recalculate if it changes.
+
+        :return: The version of the ``Element``.
+        """
+
+        return self._version
+
+    @property
+    def section_version(self) -> int:
+        """
+        A counter that is incremented every time the length or section of the
+        ``Element`` is modified, but not when its loads are modified.
+
+        :return: The section version of the ``Element``.
+        """
+
+        return self._section_version
+
+    @property
+    def length(self) -> float:
+        """
+        The length of the ``Element``, corresponding to its real world length.
+        """
+
+        return self._length
+
+    @length.setter
+    def length(self, length: float):
+
         if length is not None:
             if length < 0.0:
                 raise ElementLengthError(
                     f"Expected length to be +ve or None, actual length was {length}"
                 )
 
-        self.length = length
-        self.section = section
+        self._length = length
+        self._version += 1
+        self._section_version += 1
+
+    @property
+    def section(self) -> Section:
+        """
+        The section of the ``Element``.
+        """
+
+        return self._section
 
-        self._loads = loads
+    @section.setter
+    def section(self, section: Section):
+
+        self._section = section
+        self._version += 1
+        self._section_version += 1
 
     @property
-    def loads(self) -> Dict[int, LoadCase]:
+    def loads(self) -> Mapping[int, LoadCase]:
         """
         The loads on the ``Element``. This is a property decorator to enforce read-only
         status.
 
-        :return: The loads on the element as a dictionary of ``LoadCase`` objects.
+        :return: The loads on the element as a read-only mapping of ``LoadCase``
+            objects.
+        """
+        return MappingProxyType(self._loads)
+
+    def set_loads(self, *, load_case: int, loads: LoadCase):
+        """
+        Replaces the loads in an existing load case.
+
+        :param load_case: The ID of the load case to replace. Must already be on the
+            ``Element`` so that the load cases remain consistent with any other
+            ``Element`` objects in the same ``Beam``.
+        :param loads: The new ``LoadCase``.
         """
-        return self._loads
+
+        if load_case not in self._loads:
+            raise ElementCaseError(
+                f"Load case {load_case} is not on the Element. "
+                + f"Only existing load cases can be replaced."
+            )
+
+        self._loads[load_case] = loads
+        self._version += 1
 
     @property
     def no_load_cases(self) -> int:
@@ -147,6 +231,84 @@ class Element:
 
         return self.loads[load_case].load_positions
 
+    def station_positions(self, *, load_cases: List[int] = None) -> np.ndarray:
+        """
+        Returns the unique local positions at which loads are stored in any of the
+        given load cases, including the start & end of the ``Element``.
+
+        :param load_cases: The load cases to consider. If ``None``, all load cases on
+            the ``Element`` are considered.
+        :return: A sorted numpy array of unique local positions between 0.0 and 1.0.
+        """
+
+        if load_cases is None:
+            load_cases = self.load_cases
+
+        positions = [np.array([0.0, 1.0])]
+
+        for l in load_cases:
+
+            if self.loads[l].loads is not None:
+                positions += [self.load_positions(load_case=l)]
+
+        return np.unique(np.concatenate(positions))
+
+    def get_loads_multi_case(
+        self, *, position: np.ndarray, load_cases: List[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the loads on the ``Element`` at the given local positions in multiple load
+        cases at once.
+
+        Because different load cases may have discontinuities at different positions,
+        each position is repeated as many times as the largest number of stored rows at
+        that position in any of the load cases. This ensures that every load case
+        returns an identically shaped array. Where a load case has fewer rows at a
+        position than required, its final row is repeated (see
+        ``LoadCase.get_load_rows``).
+
+        :param position: A numpy array of unique, sorted local positions between 0.0
+            and 1.0.
+        :param load_cases: The load cases to get the loads in. If ``None``, all load
+            cases on the ``Element`` are used.
+        :return: A tuple containing:
+
+            (
+                an array of indices into ``position`` for each row returned,
+                an array of loads of shape (no. load cases, no. rows, 6)
+            )
+        """
+
+        if load_cases is None:
+            load_cases = self.load_cases
+
+        position = np.asarray(position, dtype=float).reshape(-1)
+
+        counts = np.ones(position.shape, dtype=int)
+
+        for l in load_cases:
+            counts = np.maximum(
+                counts, self.loads[l].position_counts(position=position)
+            )
+
+        index = np.repeat(np.arange(position.shape[0]), counts)
+
+        # the occurrence of each row at its position, i.e. 0, 1, ..., count - 1
+        occurrence = np.arange(index.shape[0]) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+
+        expanded = position[index]
+
+        loads = np.empty((len(load_cases), index.shape[0], 6))
+
+        for i, l in enumerate(load_cases):
+            loads[i] = self.loads[l].get_load_rows(
+                position=expanded, occurrence=occurrence
+            )
+
+        return index, loads
+
     @classmethod
     def empty_element(cls, length: float = 0.0, section=None, material=None):
         """
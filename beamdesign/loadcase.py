@@ -2,6 +2,8 @@
 Contains the LoadCase class used for applying loads to an element.
 """
 
+import hashlib
+from functools import cached_property
 from typing import Union, List
 
 import numpy as np
@@ -11,11 +13,45 @@ from beamdesign.const import LoadComponents
 from beamdesign.utility.interp import multi_interp
 
 
+def get_components(
+    component: Union[int, str, LoadComponents, List[LoadComponents]] = None
+) -> List[LoadComponents]:
+    """
+    Converts a component or list of components into a list of ``LoadComponents``.
+
+    :param component: The component/s to convert. Can be an int, a str, a
+        ``LoadComponents`` object or a list of ``LoadComponents``. If ``None``, all
+        components are returned.
+    :return: A list of ``LoadComponents``.
+    """
+
+    if component is None:
+        return [
+            LoadComponents.VX,
+            LoadComponents.VY,
+            LoadComponents.N,
+            LoadComponents.MX,
+            LoadComponents.MY,
+            LoadComponents.T,
+        ]
+
+    if isinstance(component, str):
+        return [LoadComponents[component]]
+
+    if isinstance(component, LoadComponents):
+        return [component]
+
+    if isinstance(component, int):
+        return [LoadComponents(component)]
+
+    return [get_components(c)[0] for c in component]
+
+
 class LoadCase:
 
     _loads: np.ndarray
 
-    def __init__(self, *, loads=None):
+    def __init__(self, *, loads=None, copy: bool = True):
         """
         Initialises a LoadCase object.
 
@@ -29,10 +65,13 @@ class LoadCase:
                 ...
                 [pos_n, vx_n, vy_n, N_n, mx_n, my_n, T_n]
             ]
+        :param copy: If ``False`` and ``loads`` is already a numpy array, the
+            ``LoadCase`` stores a view of ``loads`` rather than a copy (i.e. to wrap
+            load arrays held in shared memory). Note that the view is made read-only.
         """
 
         # set the loads using some setting logic
-        self._set_loads(loads=loads)
+        self._set_loads(loads=loads, copy=copy)
 
         pass
 
@@ -45,6 +84,24 @@ class LoadCase:
         """
         return self._loads
 
+    @cached_property
+    def content_hash(self) -> str:
+        """
+        A hash of the loads stored in the loadcase object. ``LoadCase`` objects with
+        identical loads have identical hashes, so this can be used to determine if the
+        loads have changed (i.e. to reuse results calculated for an identical
+        ``LoadCase``).
+        """
+
+        if self._loads is None:
+            return "empty"
+
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(self._loads.shape).encode())
+        h.update(np.ascontiguousarray(self._loads, dtype=float).tobytes())
+
+        return h.hexdigest()
+
     @property
     def load_positions(self) -> np.ndarray:
         """
@@ -69,7 +126,7 @@ class LoadCase:
 
         return len(self.load_positions)
 
-    def _set_loads(self, *, loads):
+    def _set_loads(self, *, loads, copy: bool = True):
         """
         Helper method to set the loads property.
 
@@ -81,13 +138,14 @@ class LoadCase:
              ...
              [pos_n, vx_n, vy_n, fz_n, mx_n, my_n, T_n]
              ]
+        :param copy: If ``False``, avoid copying ``loads`` where possible.
         """
 
         if loads is None:
             self._loads = None
             return
 
-        arr = np.array(loads)
+        arr = np.array(loads) if copy else np.asarray(loads).view()
 
         if len(arr.shape) == 1:
             # if passed a single row list, see if we can reshape into a 2D numpy array
@@ -120,6 +178,9 @@ class LoadCase:
             pos >= 0.0
         ), "Positions should be between 0 & 1.0"
 
+        # the loads are read-only so that anything derived from them can be cached.
+        arr.flags.writeable = False
+
         self._loads = arr
 
     def _get_input_loads(self, *, component: Union[str, int, LoadComponents]):
@@ -528,6 +589,93 @@ class LoadCase:
             )
         return position
 
+    def position_counts(self, *, position: np.ndarray) -> np.ndarray:
+        """
+        Returns the number of stored load rows at each of the given positions. This is
+        0 for positions that fall between stored positions, 1 for a stored position and
+        > 1 where there is a load discontinuity at the position.
+
+        :param position: A numpy array of positions, between 0.0 and 1.0.
+        :return: A numpy array of integer counts, the same shape as ``position``.
+        """
+
+        position = np.asarray(position, dtype=float)
+
+        if self._loads is None:
+            return np.zeros(position.shape, dtype=int)
+
+        left = np.searchsorted(self.load_positions, position, side="left")
+        right = np.searchsorted(self.load_positions, position, side="right")
+
+        return right - left
+
+    def get_load_rows(
+        self, *, position: np.ndarray, occurrence: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        A vectorised equivalent of ``self.get_load`` that returns exactly one row of
+        loads for every position provided, in the order provided. Returns a numpy array
+        of the format:
+
+        [[vx_1, vy_1, N_1, mx_1, my_1, T_1]
+         [vx_2, vy_2, N_2, mx_2, my_2, T_2]
+         ...
+         [vx_n, vy_n, N_n, mx_n, my_n, T_n]
+        ]
+
+        Where a position matches a stored load position that has multiple rows (i.e.
+        at a load discontinuity) the ``occurrence`` parameter selects which of the rows
+        is returned. Occurrences beyond the last stored row return the last stored row,
+        so the first occurrence is always the value approaching from the start of the
+        ``LoadCase`` and the largest occurrence is always the value leaving towards the
+        end of the ``LoadCase``.
+
+        If no loads are stored, loads of 0.0 are returned.
+
+        :param position: A numpy array of positions between 0.0 and 1.0. Positions do
+            not need to be sorted or unique.
+        :param occurrence: A numpy array of integers the same shape as ``position``. If
+            ``None``, the first occurrence is returned at every position.
+        :return: A numpy array of shape (len(position), 6).
+        """
+
+        position = np.asarray(position, dtype=float).reshape(-1)
+
+        if self._loads is None:
+            return np.zeros((position.shape[0], 6))
+
+        if occurrence is None:
+            occurrence = np.zeros(position.shape, dtype=int)
+
+        load_positions = self.load_positions
+
+        left = np.searchsorted(load_positions, position, side="left")
+        right = np.searchsorted(load_positions, position, side="right")
+        counts = right - left
+
+        direct = counts > 0
+
+        ret_val = np.empty((position.shape[0], 6))
+
+        if np.any(direct):
+            rows = left[direct] + np.minimum(occurrence[direct], counts[direct] - 1)
+            ret_val[direct] = self._loads[rows, 1:]
+
+        interp = ~direct
+
+        if np.any(interp):
+            # np.interp uses the last of any duplicated xp values on the left of an
+            # interval and the first on the right, which is exactly the behaviour
+            # required either side of a load discontinuity.
+            ret_val[interp] = np.column_stack(
+                [
+                    np.interp(position[interp], load_positions, self._loads[:, c])
+                    for c in range(1, 7)
+                ]
+            )
+
+        return ret_val
+
     @classmethod
     def constant_load(
         cls,
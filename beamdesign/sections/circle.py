@@ -43,6 +43,11 @@ class Circle(Section):
 
         return False
 
+    @property
+    def dimensions(self):
+
+        return (("radius", self.radius),)
+
     @property
     def area(self) -> float:
         return math.pi * (self.radius ** 2)
@@ -41,6 +41,14 @@ class HollowCircle(Section):
         else:
             self._radius_i = radius_i
 
+    @property
+    def dimensions(self):
+        """
+        The dimensions that define the section.
+        """
+
+        return (("radius_o", self.radius_o), ("radius_i", self.radius_i))
+
     @property
     def area(self):
         """
@@ -1,7 +1,9 @@
 """This defines a parent class of "section" objects
 for calculating section properties."""
 
+import hashlib
 from abc import ABC, abstractmethod
+from typing import Tuple
 
 from beamdesign.materials.material import Material
 
@@ -35,6 +37,42 @@ class Section(ABC):
 
         self.material = material
 
+    @property
+    def dimensions(self) -> Tuple[Tuple[str, float], ...]:
+        """
+        The dimensions that define the section, as a tuple of (name, value) pairs. Used
+        by ``content_hash``, so sub-classes must provide every dimension the section
+        properties depend on.
+
+        :return: A tuple of the form ((name_0, value_0), ..., (name_n, value_n)).
+        """
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not provide its dimensions."
+        )
+
+    @property
+    def content_hash(self) -> str:
+        """
+        A stable hash of the section's type, its dimensions (see ``dimensions``) and its
+        material properties. Section objects can be modified in place, so this is
+        recalculated every time it is accessed rather than cached.
+
+        :return: The hash, as a hex string.
+        """
+
+        properties = getattr(self.material, "properties", None) or {}
+
+        content = repr(
+            (
+                f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                tuple(self.dimensions),
+                sorted(properties.items()),
+            )
+        )
+
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
     @property
     @abstractmethod
     def is_circle(self) -> bool:
@@ -0,0 +1,599 @@
+"""
+Contains the ``BeamSegments`` class, which splits a ``Beam`` into segments between
+restraints, and the ``LoadRangeIndex`` class, which answers queries about the loads
+between arbitrary positions along a ``Beam``.
+
+Restraints are design code specific information and so are deliberately NOT stored on
+the ``Beam`` object itself (see the notes in ``beamdesign.beam``). Instead, a
+``BeamSegments`` object wraps a ``Beam`` and a set of restraint positions, and
+precomputes the ``Element`` and load station indices that make up each segment so that
+per-segment quantities can be determined for all load cases at once.
+"""
+
+from typing import List, Union
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.const import LoadComponents
+from beamdesign.loadcase import get_components
+from beamdesign.utility.exceptions import InvalidPositionError, PositionNotInBeamError
+from beamdesign.utility.rangequery import SparseTable
+
+
+class BeamSegments:
+    """
+    A ``BeamSegments`` object describes the segments of a ``Beam`` between restraints,
+    as used in the member checks of design codes (e.g. AS4100 S5.6 & S6.3).
+
+    The loads in every load case are retrieved once, at all the load stations along the
+    ``Beam``, the restraint positions and the segment quarter points. All per-segment
+    quantities are then determined from these stored loads with vectorised numpy
+    operations.
+    """
+
+    def __init__(
+        self,
+        *,
+        beam: Beam,
+        restraints: Union[List[float], float] = None,
+        load_cases: List[int] = None,
+    ):
+        """
+        Constructor for a ``BeamSegments`` object.
+
+        :param beam: The ``Beam`` to split into segments.
+        :param restraints: The positions of the restraints along the ``Beam``, as
+            *real* positions between 0.0 and ``Beam.length``. The start & end of the
+            ``Beam`` are always treated as restraints. Duplicates are ignored.
+        :param load_cases: The load cases to consider. If ``None``, all load cases on
+            the ``Beam`` are considered.
+        """
+
+        if restraints is None:
+            restraints = []
+
+        restraints = np.asarray(restraints, dtype=float).reshape(-1)
+
+        if np.any(restraints < 0) or np.any(restraints > beam.length):
+            raise PositionNotInBeamError(
+                f"Expected restraints to be > 0 or < the length of the beam. "
+                + f"Provided restraints were {restraints}, beam length is"
+                + f" {beam.length}."
+            )
+
+        if load_cases is None:
+            load_cases = beam.load_cases
+
+        self._beam = beam
+        self._load_cases = list(load_cases)
+
+        restraints = np.unique(np.concatenate((restraints, [0.0, beam.length])))
+
+        self._restraints = restraints
+        self._ends = np.column_stack((restraints[:-1], restraints[1:]))
+
+        starts = self._ends[:, 0]
+        lengths = self._ends[:, 1] - starts
+
+        # quarter points, mid points & three-quarter points of each segment.
+        self._quarter_points = starts[:, np.newaxis] + np.outer(
+            lengths, [0.25, 0.50, 0.75]
+        )
+
+        positions = np.concatenate(
+            (
+                beam.station_positions(load_cases=self._load_cases),
+                restraints,
+                self._quarter_points.reshape(-1),
+            )
+        )
+
+        self._positions, self._elements, self._loads = beam.get_loads_multi_case(
+            position=positions, load_cases=self._load_cases
+        )
+
+        # the elements that overlap each segment. Elements that only touch a segment at
+        # a restraint are not included, except for zero length elements which are
+        # included in the segments either side of them.
+        element_ends = np.array(beam.element_ends)
+        element_ids = np.arange(beam.no_elements)
+        positive = element_ends[:, 1] > element_ends[:, 0]
+
+        first = np.searchsorted(element_ends[:, 1], self._ends[:, 0], side="right")
+        last = np.searchsorted(element_ends[:, 0], self._ends[:, 1], side="left") - 1
+
+        # extend to any zero length elements immediately before / after the segment.
+        prev_positive = np.maximum.accumulate(np.where(positive, element_ids, -1))
+        next_positive = np.minimum.accumulate(
+            np.where(positive, element_ids, beam.no_elements)[::-1]
+        )[::-1]
+
+        first = np.where(first > 0, prev_positive[np.maximum(first - 1, 0)] + 1, 0)
+        last = np.where(
+            last < beam.no_elements - 1,
+            next_positive[np.minimum(last + 1, beam.no_elements - 1)] - 1,
+            beam.no_elements - 1,
+        )
+
+        self._element_ranges = np.column_stack((first, last))
+
+        # the rows of the stored loads that fall into each segment. As the rows are
+        # sorted by position and then by element, both the element & the position of
+        # the rows are non-decreasing, so each segment is a contiguous block of rows.
+        self._station_ranges = np.column_stack(
+            (
+                np.maximum(
+                    np.searchsorted(self._positions, self._ends[:, 0], side="left"),
+                    np.searchsorted(self._elements, first, side="left"),
+                ),
+                np.minimum(
+                    np.searchsorted(self._positions, self._ends[:, 1], side="right"),
+                    np.searchsorted(self._elements, last, side="right"),
+                ),
+            )
+        )
+
+        # the rows that fall on each quarter point.
+        self._quarter_ranges = np.stack(
+            (
+                np.searchsorted(self._positions, self._quarter_points, side="left"),
+                np.searchsorted(self._positions, self._quarter_points, side="right"),
+            ),
+            axis=-1,
+        )
+
+    @property
+    def beam(self) -> Beam:
+        """
+        The ``Beam`` that the segments are defined on.
+        """
+
+        return self._beam
+
+    @property
+    def load_cases(self) -> List[int]:
+        """
+        The load cases considered by the ``BeamSegments`` object. The first axis of all
+        per-segment results is in the same order as this list.
+        """
+
+        return self._load_cases
+
+    @property
+    def restraints(self) -> np.ndarray:
+        """
+        The positions of the restraints, including the start & end of the ``Beam``.
+        """
+
+        return self._restraints
+
+    @property
+    def no_segments(self) -> int:
+        """
+        The no. of segments.
+        """
+
+        return self._ends.shape[0]
+
+    @property
+    def segment_ends(self) -> np.ndarray:
+        """
+        The start & end positions of each segment, in an array of the form:
+
+        [[start_0, end_0]
+         [start_1, end_1]
+         ...
+         [start_n, end_n]
+         ]
+        """
+
+        return self._ends
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """
+        The length of each segment.
+        """
+
+        return self._ends[:, 1] - self._ends[:, 0]
+
+    @property
+    def element_ranges(self) -> np.ndarray:
+        """
+        The first & last ``Element`` (inclusive) that make up each segment, in an array
+        of the form below. Elements that only touch a segment at a restraint are not
+        included, with the exception of zero length elements at the restraint.
+
+        [[first_element_0, last_element_0]
+         ...
+         [first_element_n, last_element_n]
+         ]
+        """
+
+        return self._element_ranges
+
+    @property
+    def station_ranges(self) -> np.ndarray:
+        """
+        The start & stop indices (stop is exclusive, as per python slicing) of the rows
+        in ``self.positions`` that fall within each segment.
+        """
+
+        return self._station_ranges
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        The positions at which the loads are stored.
+        """
+
+        return self._positions
+
+    @property
+    def elements(self) -> np.ndarray:
+        """
+        The ``Element`` each row of stored loads comes from.
+        """
+
+        return self._elements
+
+    @property
+    def loads(self) -> np.ndarray:
+        """
+        The stored loads, as an array of shape (no. load cases, no. positions, 6).
+        """
+
+        return self._loads
+
+    @property
+    def quarter_points(self) -> np.ndarray:
+        """
+        The positions of the quarter points of each segment, as an array of shape
+        (no. segments, 3).
+        """
+
+        return self._quarter_points
+
+    def segment_at(self, *, position: Union[List[float], float]) -> np.ndarray:
+        """
+        Returns the segment that each position falls into. Positions exactly at a
+        restraint are placed in the segment that starts at the restraint (except for
+        the end of the ``Beam``, which is in the last segment).
+
+        :param position: The positions to locate.
+        :return: A numpy array of segment indices.
+        """
+
+        position = np.asarray(position, dtype=float)
+
+        segment = np.searchsorted(self._restraints, position, side="right") - 1
+
+        return np.clip(segment, 0, self.no_segments - 1)
+
+    def max_load(
+        self,
+        *,
+        component: Union[int, str, LoadComponents],
+        absolute: bool = True,
+    ) -> np.ndarray:
+        """
+        Returns the maximum load of a given component in each segment, in every load
+        case.
+
+        :param component: The component of load to consider.
+        :param absolute: If ``True``, the maximum absolute value is returned. If
+            ``False``, the maximum signed value is returned.
+        :return: A numpy array of shape (no. load cases, no. segments).
+        """
+
+        return self._reduce_segments(
+            values=self._component(component=component, absolute=absolute),
+            ufunc=np.maximum,
+        )
+
+    def min_load(self, *, component: Union[int, str, LoadComponents]) -> np.ndarray:
+        """
+        Returns the minimum (signed) load of a given component in each segment, in
+        every load case.
+
+        :param component: The component of load to consider.
+        :return: A numpy array of shape (no. load cases, no. segments).
+        """
+
+        return self._reduce_segments(
+            values=self._component(component=component, absolute=False),
+            ufunc=np.minimum,
+        )
+
+    def max_moment(
+        self, *, component: Union[int, str, LoadComponents] = LoadComponents.MX
+    ) -> np.ndarray:
+        """
+        Returns the maximum absolute bending moment in each segment (M_m in AS4100
+        S5.6.1), in every load case.
+
+        :param component: The bending moment component to consider. By default MX.
+        :return: A numpy array of shape (no. load cases, no. segments).
+        """
+
+        return self.max_load(component=component)
+
+    def quarter_point_moments(
+        self, *, component: Union[int, str, LoadComponents] = LoadComponents.MX
+    ) -> np.ndarray:
+        """
+        Returns the absolute bending moments at the quarter point, mid point &
+        three-quarter point of each segment (M_2, M_3 & M_4 in AS4100 S5.6.1), in every
+        load case. Where there is a discontinuity at one of these points, the largest
+        absolute value is returned.
+
+        :param component: The bending moment component to consider. By default MX.
+        :return: A numpy array of shape (no. load cases, no. segments, 3).
+        """
+
+        values = self._component(component=component, absolute=True)
+
+        ranges = self._quarter_ranges.reshape((-1, 2))
+
+        moments = self._reduce_ranges(values=values, ranges=ranges, ufunc=np.maximum)
+
+        return moments.reshape((len(self._load_cases), self.no_segments, 3))
+
+    def max_axial(self, *, absolute: bool = True) -> np.ndarray:
+        """
+        Returns the maximum axial load in each segment, in every load case.
+
+        :param absolute: If ``True``, the maximum absolute value is returned. If
+            ``False``, the maximum signed value (i.e. the maximum tension) is returned.
+        :return: A numpy array of shape (no. load cases, no. segments).
+        """
+
+        return self.max_load(component=LoadComponents.N, absolute=absolute)
+
+    def _component(
+        self, *, component: Union[int, str, LoadComponents], absolute: bool
+    ) -> np.ndarray:
+        """
+        Helper method to get the stored loads of a single component.
+
+        :param component: The component to get.
+        :param absolute: Return the absolute values?
+        :return: A numpy array of shape (no. load cases, no. positions).
+        """
+
+        values = self._loads[..., get_components(component)[0].value - 1]
+
+        if absolute:
+            values = np.abs(values)
+
+        return values
+
+    def _reduce_segments(self, *, values: np.ndarray, ufunc) -> np.ndarray:
+        """
+        Helper method to reduce stored values over each segment.
+
+        :param values: The values to reduce, of shape (no. load cases, no. positions).
+        :param ufunc: The numpy ufunc to reduce with (i.e. np.maximum).
+        :return: A numpy array of shape (no. load cases, no. segments).
+        """
+
+        return self._reduce_ranges(
+            values=values, ranges=self._station_ranges, ufunc=ufunc
+        )
+
+    @staticmethod
+    def _reduce_ranges(*, values: np.ndarray, ranges: np.ndarray, ufunc) -> np.ndarray:
+        """
+        Reduces values over a set of (possibly overlapping) ranges of columns at once.
+
+        :param values: The values to reduce, of shape (no. load cases, no. positions).
+        :param ranges: An array of [start, stop) ranges, of shape (no. ranges, 2). Every
+            range must contain at least 1x position.
+        :param ufunc: The numpy ufunc to reduce with (i.e. np.maximum).
+        :return: A numpy array of shape (no. load cases, no. ranges).
+        """
+
+        # ufunc.reduceat reduces between consecutive indices, so interleaving the starts
+        # & stops and keeping every second result gives the reduction over each range.
+        # A dummy column is added so that a stop at the final position is valid.
+        padded = np.concatenate((values, values[:, -1:]), axis=1)
+
+        return ufunc.reduceat(padded, ranges.reshape(-1), axis=1)[:, ::2]
+
+
+class LoadRangeIndex:
+    """
+    A ``LoadRangeIndex`` answers queries of the form "what is the max / min load of a
+    component between position a and position b" for every load case at once.
+
+    Loads are retrieved once at the load stations of the ``Beam`` (the stored load
+    positions & element ends), between which all loads vary linearly. A
+    ``SparseTable`` is then built over the station loads so that the extreme values
+    within any range of stations are returned in O(1) time. The loads at the ends of a
+    queried range are linearly interpolated between the adjacent stations, so queries
+    are exact for any positions, not just at the stations.
+
+    This is intended for use where the same load diagrams are queried many times, such
+    as when optimising the layout of restraints.
+    """
+
+    def __init__(
+        self,
+        *,
+        beam: Beam,
+        component: Union[int, str, LoadComponents],
+        load_cases: List[int] = None,
+    ):
+        """
+        Constructor for a ``LoadRangeIndex``.
+
+        :param beam: The ``Beam`` to build the index over.
+        :param component: The component of load to index.
+        :param load_cases: The load cases to index. If ``None``, all load cases on the
+            ``Beam`` are indexed.
+        """
+
+        if load_cases is None:
+            load_cases = beam.load_cases
+
+        self._beam = beam
+        self._load_cases = list(load_cases)
+        self._component = get_components(component)[0]
+
+        positions, elements, loads = beam.get_loads_multi_case(
+            position=beam.station_positions(load_cases=self._load_cases),
+            load_cases=self._load_cases,
+            component=self._component,
+        )
+
+        self._positions = positions
+        self._values = loads[..., 0]
+
+        self._max_table = SparseTable(values=self._values, ufunc=np.maximum)
+        self._min_table = SparseTable(values=self._values, ufunc=np.minimum)
+
+    @property
+    def beam(self) -> Beam:
+        """
+        The ``Beam`` that the index is built over.
+        """
+
+        return self._beam
+
+    @property
+    def load_cases(self) -> List[int]:
+        """
+        The load cases in the index. The first axis of all query results is in the same
+        order as this list.
+        """
+
+        return self._load_cases
+
+    @property
+    def component(self) -> LoadComponents:
+        """
+        The load component that is indexed.
+        """
+
+        return self._component
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        The positions of the stations the index is built on.
+        """
+
+        return self._positions
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The loads at the stations the index is built on, as an array of shape
+        (no. load cases, no. stations).
+        """
+
+        return self._values
+
+    def value_at(self, *, position: Union[List[float], float]) -> np.ndarray:
+        """
+        Returns the load at the given positions, linearly interpolated between the
+        stations. At a discontinuity the value approaching from the start of the
+        ``Beam`` is returned.
+
+        :param position: The positions to get the load at.
+        :return: A numpy array of shape (no. load cases, no. positions).
+        """
+
+        position = np.atleast_1d(np.asarray(position, dtype=float))
+
+        p = self._positions
+        j = np.clip(np.searchsorted(p, position, side="left"), 0, p.shape[0] - 1)
+        i = np.maximum(j - 1, 0)
+
+        span = p[j] - p[i]
+        t = np.divide(position - p[i], span, out=np.ones(span.shape), where=span > 0)
+
+        return self._values[:, i] + t * (self._values[:, j] - self._values[:, i])
+
+    def max(
+        self, *, start: Union[List[float], float], end: Union[List[float], float]
+    ) -> np.ndarray:
+        """
+        Returns the maximum load between ``start`` and ``end`` (inclusive).
+
+        :param start: The start positions of the ranges to query.
+        :param end: The end positions of the ranges to query.
+        :return: A numpy array of shape (no. load cases, no. ranges).
+        """
+
+        start, end, lo, hi = self._ranges(start=start, end=end)
+
+        return np.maximum(
+            self._max_table.query(start=lo, stop=hi),
+            np.maximum(self.value_at(position=start), self.value_at(position=end)),
+        )
+
+    def min(
+        self, *, start: Union[List[float], float], end: Union[List[float], float]
+    ) -> np.ndarray:
+        """
+        Returns the minimum load between ``start`` and ``end`` (inclusive).
+
+        :param start: The start positions of the ranges to query.
+        :param end: The end positions of the ranges to query.
+        :return: A numpy array of shape (no. load cases, no. ranges).
+        """
+
+        start, end, lo, hi = self._ranges(start=start, end=end)
+
+        return np.minimum(
+            self._min_table.query(start=lo, stop=hi),
+            np.minimum(self.value_at(position=start), self.value_at(position=end)),
+        )
+
+    def max_abs(
+        self, *, start: Union[List[float], float], end: Union[List[float], float]
+    ) -> np.ndarray:
+        """
+        Returns the maximum absolute load between ``start`` and ``end`` (inclusive).
+
+        :param start: The start positions of the ranges to query.
+        :param end: The end positions of the ranges to query.
+        :return: A numpy array of shape (no. load cases, no. ranges).
+        """
+
+        return np.maximum(
+            self.max(start=start, end=end), -self.min(start=start, end=end)
+        )
+
+    def _ranges(self, *, start, end):
+        """
+        Helper method to convert the start & end positions of queried ranges into the
+        range of stations that fall within them.
+
+        :param start: The start positions of the ranges.
+        :param end: The end positions of the ranges.
+        :return: A tuple of (start, end, first station, stop station) arrays.
+        """
+
+        start = np.atleast_1d(np.asarray(start, dtype=float))
+        end = np.atleast_1d(np.asarray(end, dtype=float))
+
+        if np.any(end < start):
+            raise InvalidPositionError(
+                f"Expected the start of each range to be <= the end. "
+                + f"Ranges were start={start}, end={end}."
+            )
+
+        if np.any(start < 0) or np.any(end > self._beam.length):
+            raise PositionNotInBeamError(
+                f"Expected ranges to be within the length of the beam. "
+                + f"Ranges were start={start}, end={end}, beam length is"
+                + f" {self._beam.length}."
+            )
+
+        lo = np.searchsorted(self._positions, start, side="left")
+        hi = np.searchsorted(self._positions, end, side="right")
+
+        return start, end, lo, hi
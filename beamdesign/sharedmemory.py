@@ -0,0 +1,339 @@
+"""
+Contains classes for sharing ``Beam`` objects between processes without copying their
+loads.
+
+Pickling a ``Beam`` (i.e. to send it to a worker in a ``ProcessPoolExecutor``) copies
+every ``LoadCase`` array. ``SharedBeams`` instead packs the loads of one or more
+``Beam`` objects into a single ``multiprocessing.shared_memory`` block, and provides a
+lightweight, picklable ``SharedBeamHandle`` for each ``Beam``. Workers rebuild the
+``Beam`` from the handle, with ``LoadCase`` objects that are read-only views into the
+shared block.
+
+Typical usage is:
+
+    with SharedBeams(beams=beams) as shared:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(check, shared.handles.values())
+
+where ``check`` calls ``handle.beam()`` to get its ``Beam``, and
+``release(name=handle.name)`` once it has finished with it.
+"""
+
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+
+# the shared memory blocks attached to by this process, keyed by name. Blocks are kept
+# open for the life of the process (or until detach_all is called) so that multiple
+# tasks in the same worker only attach once, and so the views into them remain valid.
+_attached: Dict[str, shared_memory.SharedMemory] = {}
+
+# the no. of users of each block in this process (see acquire, release &
+# SharedBeamHandle.beam), so that a block is only detached once no task (i.e. in
+# another thread) is still using it.
+_users: Dict[str, int] = {}
+
+# guards _attached & _users, as threads in the same process share them.
+_lock = threading.Lock()
+
+
+class SharedBeamHandle:
+    """
+    A lightweight, picklable handle to a ``Beam`` whose loads are stored in shared
+    memory. Only the element lengths, sections, load case IDs and the location of each
+    load array in the shared block are pickled.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        shape: Tuple[int, int],
+        lengths: List[float],
+        sections: List[Any],
+        load_cases: List[int],
+        rows: List[List[Tuple[int, int]]],
+    ):
+        """
+        Constructor for a ``SharedBeamHandle``. Generally this should only be called by
+        ``SharedBeams``.
+
+        :param name: The name of the shared memory block.
+        :param shape: The shape of the load array stored in the shared memory block.
+        :param lengths: The length of each element in the ``Beam``.
+        :param sections: The section of each element in the ``Beam``.
+        :param load_cases: The load case IDs.
+        :param rows: The (start, stop) rows of the load array of each element & load
+            case, indexed as rows[element][case]. A start of -1 indicates a
+            ``LoadCase`` with no loads.
+        """
+
+        self.name = name
+        self.shape = shape
+        self.lengths = lengths
+        self.sections = sections
+        self.load_cases = load_cases
+        self.rows = rows
+
+    def beam(self) -> Beam:
+        """
+        Rebuilds the ``Beam``, attaching to the shared memory block if this process is
+        not already attached. The caller is registered as a user of the block (see
+        ``acquire``), and should call ``release`` once it has finished with the
+        ``Beam``, so that the block is not detached while it is still in use.
+
+        :return: A ``Beam`` whose ``LoadCase`` objects are read-only views into the
+            shared memory block.
+        """
+
+        with _lock:
+            block = _attached.get(self.name)
+
+            if block is None:
+                block = shared_memory.SharedMemory(name=self.name)
+                _attached[self.name] = block
+
+            # register the user under the same lock as the attach, so that the block
+            # cannot be detached by ``release`` in another thread in between.
+            _users[self.name] = _users.get(self.name, 0) + 1
+
+        loads = np.ndarray(self.shape, dtype=float, buffer=block.buf)
+
+        elements = []
+
+        for length, section, rows in zip(self.lengths, self.sections, self.rows):
+
+            cases = {
+                case: LoadCase(
+                    loads=None if start < 0 else loads[start:stop], copy=False
+                )
+                for case, (start, stop) in zip(self.load_cases, rows)
+            }
+
+            elements += [Element(loads=cases, length=length, section=section)]
+
+        return Beam(elements=elements)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + f"name={self.name}, "
+            + f"no. elements={len(self.lengths)}, "
+            + f"no. load cases={len(self.load_cases)}"
+            + f")"
+        )
+
+
+class SharedBeams:
+    """
+    Stores the loads of one or more ``Beam`` objects in a single shared memory block.
+
+    The block is owned by the ``SharedBeams`` object, and is released when ``close`` is
+    called (or on exiting a ``with`` block). Any ``Beam`` objects rebuilt from its
+    handles must not be used after this.
+    """
+
+    def __init__(self, *, beams: Union[Beam, Sequence[Beam], Dict[Any, Beam]]):
+        """
+        Constructor for the ``SharedBeams`` object.
+
+        :param beams: The ``Beam`` objects to share. Can be a single ``Beam``, a list
+            of ``Beam`` objects or a dictionary of ``Beam`` objects. The handles are
+            keyed by the dictionary keys, or by the position in the list (a single
+            ``Beam`` has key 0).
+        """
+
+        if isinstance(beams, Beam):
+            beams = [beams]
+
+        if not isinstance(beams, dict):
+            beams = dict(enumerate(beams))
+
+        arrays = []
+        layouts = {}
+        no_rows = 0
+
+        for key, beam in beams.items():
+
+            load_cases = beam.load_cases
+            rows = []
+
+            for e in beam.elements:
+
+                element_rows = []
+
+                for case in load_cases:
+
+                    loads = e.loads[case].loads
+
+                    if loads is None:
+                        element_rows += [(-1, -1)]
+                        continue
+
+                    arrays += [loads]
+                    element_rows += [(no_rows, no_rows + loads.shape[0])]
+                    no_rows += loads.shape[0]
+
+                rows += [element_rows]
+
+            layouts[key] = (beam, load_cases, rows)
+
+        shape = (no_rows, 7)
+
+        # a shared memory block cannot have zero size.
+        size = max(no_rows * 7 * np.dtype(float).itemsize, 1)
+
+        self._block = shared_memory.SharedMemory(create=True, size=size)
+
+        if no_rows > 0:
+            shared = np.ndarray(shape, dtype=float, buffer=self._block.buf)
+            np.concatenate(arrays, axis=0, out=shared)
+            del shared
+
+        self._handles = {
+            key: SharedBeamHandle(
+                name=self._block.name,
+                shape=shape,
+                lengths=[e.length for e in beam.elements],
+                sections=[e.section for e in beam.elements],
+                load_cases=load_cases,
+                rows=rows,
+            )
+            for key, (beam, load_cases, rows) in layouts.items()
+        }
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory block.
+        """
+
+        return self._block.name
+
+    @property
+    def handles(self) -> Dict[Any, SharedBeamHandle]:
+        """
+        The handles to each ``Beam``, keyed as per the ``beams`` parameter used to
+        create the ``SharedBeams`` object.
+        """
+
+        return self._handles
+
+    def close(self):
+        """
+        Releases the shared memory block. This process is detached from the block
+        first, if any ``Beam`` objects have been rebuilt from the handles in it.
+        """
+
+        if self._block is None:
+            return
+
+        detach(name=self._block.name)
+
+        self._block.close()
+        self._block.unlink()
+        self._block = None
+
+    def __enter__(self) -> "SharedBeams":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}("
+            + f"name={None if self._block is None else self._block.name}, "
+            + f"no. beams={len(self._handles)}"
+            + f")"
+        )
+
+
+def acquire(*, name: str):
+    """
+    Records that a task in this process is using a shared memory block, so that it is
+    not detached by ``release`` until the task is complete.
+
+    :param name: The name of the shared memory block.
+    """
+
+    with _lock:
+        _users[name] = _users.get(name, 0) + 1
+
+
+def release(*, name: str):
+    """
+    Records that a task in this process has finished using a shared memory block (see
+    ``acquire``), and detaches from the block if no other task is still using it.
+    Otherwise a long-lived process stays attached to every block it has ever used.
+
+    :param name: The name of the shared memory block.
+    """
+
+    with _lock:
+        users = _users.get(name, 0) - 1
+
+        if users > 0:
+            _users[name] = users
+            return
+
+        # the block is removed under the same lock that decides it has no users, so
+        # that another thread cannot acquire it and rebuild a ``Beam`` from it before
+        # it is closed.
+        _users.pop(name, None)
+        block = _attached.pop(name, None)
+
+    _close(block=block)
+
+
+def detach(*, name: str):
+    """
+    Detaches this process from a shared memory block attached to by
+    ``SharedBeamHandle.beam``, regardless of whether any task is still using it. Any
+    ``Beam`` objects rebuilt from the block in this process must not be used after
+    this.
+
+    :param name: The name of the shared memory block.
+    """
+
+    with _lock:
+        _users.pop(name, None)
+        block = _attached.pop(name, None)
+
+    _close(block=block)
+
+
+def detach_all():
+    """
+    Detaches this process from all shared memory blocks attached to by
+    ``SharedBeamHandle.beam`` (i.e. at the end of a worker's life).
+    """
+
+    for name in list(_attached):
+        detach(name=name)
+
+
+def _close(*, block: Union[shared_memory.SharedMemory, None]):
+    """
+    Helper function to close a shared memory block that has been removed from
+    ``_attached``. This is done outside ``_lock``, so other blocks can be attached to
+    in the meantime.
+
+    :param block: The block to close. If ``None``, nothing is done.
+    """
+
+    if block is None:
+        return
+
+    try:
+        block.close()
+    except BufferError:
+        # views into the block are still referenced. The block is unmapped when they
+        # are garbage collected instead.
+        pass
@@ -27,6 +27,15 @@ class BeamError(BeamDesignError):
     pass
 
 
+class BeamAssemblyError(BeamError):
+    """
+    Error to throw when ``Beam`` objects cannot be assembled from element connectivity
+    (i.e. if the elements in a member branch or are not connected).
+    """
+
+    pass
+
+
 class ElementError(BeamError):
     """
     Main Exception for ``Element`` object errors.
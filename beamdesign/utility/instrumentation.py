@@ -0,0 +1,142 @@
+"""
+Contains the ``Instrumentation`` class, which collects opt-in timing, call count and
+cache statistics from ``CodeCheck`` objects so that slow runs can be diagnosed without
+a profiler.
+
+Instrumentation is disabled by default. When disabled every method returns immediately
+(``timer`` returns a shared no-op context manager), so the overhead is a single
+attribute check per call.
+"""
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict
+
+# a shared no-op context manager returned by Instrumentation.timer when disabled.
+_NULL_TIMER = nullcontext()
+
+
+class Instrumentation:
+    """
+    Collects per-stage timers, counters and cache hit / miss counts.
+    """
+
+    def __init__(self, *, enabled: bool = False):
+        """
+        Constructor for an ``Instrumentation`` object.
+
+        :param enabled: Is the instrumentation collecting data?
+        """
+
+        self.enabled = enabled
+
+        self._timers = {}
+        self._counters = {}
+        self._caches = {}
+
+    def timer(self, stage: str):
+        """
+        Times a stage of a calculation, for use as a context manager:
+
+            with instrumentation.timer("load_fetch"):
+                ...
+
+        Nested timers are recorded separately, so the time of an inner stage is also
+        included in the time of any outer stage.
+
+        :param stage: The name of the stage.
+        :return: A context manager.
+        """
+
+        if not self.enabled:
+            return _NULL_TIMER
+
+        return self._time(stage)
+
+    @contextmanager
+    def _time(self, stage: str):
+        """
+        Helper method for ``timer`` that records the time of a stage.
+
+        :param stage: The name of the stage.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            calls, total = self._timers.get(stage, (0, 0.0))
+            self._timers[stage] = (calls + 1, total + time.perf_counter() - start)
+
+    def count(self, name: str, n: int = 1):
+        """
+        Increments a counter.
+
+        :param name: The name of the counter.
+        :param n: The amount to increment the counter by.
+        """
+
+        if not self.enabled:
+            return
+
+        self._counters[name] = self._counters.get(name, 0) + n
+
+    def cache(self, name: str, hit: bool):
+        """
+        Records a cache lookup.
+
+        :param name: The name of the cached value.
+        :param hit: Was the value found in the cache?
+        """
+
+        if not self.enabled:
+            return
+
+        hits, misses = self._caches.get(name, (0, 0))
+        self._caches[name] = (hits + hit, misses + (not hit))
+
+    def reset(self):
+        """
+        Discards all the collected data.
+        """
+
+        self._timers = {}
+        self._counters = {}
+        self._caches = {}
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the collected data as a dictionary of the form:
+
+            {
+                "timers": {stage: {"calls": int, "total": float, "mean": float}},
+                "counters": {name: int},
+                "caches": {
+                    name: {"hits": int, "misses": int, "hit_rate": float}
+                },
+            }
+
+        Times are in seconds.
+
+        :return: The report.
+        """
+
+        return {
+            "timers": {
+                stage: {"calls": calls, "total": total, "mean": total / calls}
+                for stage, (calls, total) in self._timers.items()
+            },
+            "counters": dict(self._counters),
+            "caches": {
+                name: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses),
+                }
+                for name, (hits, misses) in self._caches.items()
+            },
+        }
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(enabled={self.enabled})"
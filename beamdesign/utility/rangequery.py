@@ -0,0 +1,90 @@
+"""
+Contains data structures for answering range queries (i.e. the maximum of an array
+between 2x indices) quickly.
+"""
+
+import numpy as np
+
+
+class SparseTable:
+    """
+    A sparse table for answering range queries with an idempotent operation (such as
+    max or min) in O(1) time, after O(n log n) construction.
+
+    The table is built along the last axis of the provided values, so multiple rows of
+    values (i.e. multiple load cases) can be queried at once.
+    """
+
+    def __init__(self, *, values: np.ndarray, ufunc=np.maximum):
+        """
+        Constructor for a ``SparseTable``.
+
+        :param values: The values to build the table over. Queries are made along the
+            last axis.
+        :param ufunc: The numpy ufunc to reduce values with. Must be idempotent (i.e.
+            np.maximum or np.minimum).
+        """
+
+        values = np.asarray(values, dtype=float)
+
+        if values.shape[-1] == 0:
+            raise ValueError("Expected at least 1x value to build a SparseTable.")
+
+        self._ufunc = ufunc
+        self._identity = -np.inf if ufunc is np.maximum else np.inf
+
+        levels = [values]
+
+        width = 1
+
+        while 2 * width <= values.shape[-1]:
+            prev = levels[-1]
+            levels += [ufunc(prev[..., :-width], prev[..., width:])]
+            width *= 2
+
+        self._levels = levels
+
+    @property
+    def size(self) -> int:
+        """
+        The no. of values along the axis the table is built on.
+        """
+
+        return self._levels[0].shape[-1]
+
+    def query(self, *, start, stop) -> np.ndarray:
+        """
+        Reduces the values between ``start`` and ``stop`` (exclusive, as per python
+        slicing).
+
+        :param start: The start index or an array of start indices.
+        :param stop: The stop index or an array of stop indices. Where ``stop`` <=
+            ``start`` the range is empty and the identity of the ufunc is returned
+            (-inf for np.maximum, +inf for np.minimum).
+        :return: An array of the reduced values, of shape
+            (*values.shape[:-1], no. of queries).
+        """
+
+        start = np.atleast_1d(np.asarray(start, dtype=int))
+        stop = np.atleast_1d(np.asarray(stop, dtype=int))
+
+        length = np.maximum(stop - start, 1)
+        level = np.floor(np.log2(length)).astype(int)
+        width = 2 ** level
+
+        ret_val = np.full(self._levels[0].shape[:-1] + start.shape, self._identity)
+
+        for k in np.unique(level):
+            # group the queries by level, so that each level is only indexed once.
+            mask = level == k
+            table = self._levels[k]
+
+            lo = np.clip(start[mask], 0, table.shape[-1] - 1)
+            hi = np.clip(stop[mask] - width[mask], 0, table.shape[-1] - 1)
+
+            ret_val[..., mask] = self._ufunc(table[..., lo], table[..., hi])
+
+        empty = stop <= start
+        ret_val[..., empty] = self._identity
+
+        return ret_val
@@ -2,9 +2,10 @@
 Tests for the as4100 class
 """
 
+import os
 from math import isclose, pi
 
-from pytest import mark
+from pytest import approx, mark
 
 import numpy as np
 
@@ -14,8 +15,10 @@ from beamdesign.element import Element
 from beamdesign.sections.circle import Circle
 from beamdesign.materials.material import Material
 from beamdesign.loadcase import LoadCase
+from beamdesign.codecheck.as4100 import S6
 from beamdesign.utility.exceptions import (
     CodeCheckError,
+    PositionNotInBeamError,
     SectionOnlyError,
     InvalidPositionError,
 )
@@ -64,6 +67,54 @@ def test_AS4100_default():
     assert a
 
 
+def test_AS4100_get_defaults_cache(tmp_path):
+    """
+    Test that default files are only re-parsed when they change, and that the cached
+    values cannot be modified by callers.
+    """
+
+    file_path = tmp_path / "defaults.toml"
+    file_path.write_text('[defaults]\n"φ_steel" = 0.8\nkt = 1.0\n"αu" = 0.85\n')
+
+    config = AS4100.get_defaults(file_path=file_path)
+    config["defaults"]["φ_steel"] = 0.1
+
+    assert AS4100.get_defaults(file_path=file_path)["defaults"]["φ_steel"] == 0.8
+
+    file_path.write_text('[defaults]\n"φ_steel" = 0.7\nkt = 1.0\n"αu" = 0.85\n')
+    os.utime(file_path, ns=(0, file_path.stat().st_mtime_ns + 1_000_000_000))
+
+    assert AS4100.get_defaults(file_path=file_path)["defaults"]["φ_steel"] == 0.7
+
+
+def test_AS4100_profile():
+    """
+    Test registering & using a profile of default values.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    AS4100.register_profile(name="test project", defaults={"kt": 0.75})
+
+    a = AS4100.default_AS4100(section=s, profile="test project")
+
+    assert a.kt == 0.75
+    assert a.φ_steel == 0.90
+
+
+@mark.xfail(strict=True, raises=CodeCheckError)
+def test_AS4100_profile_error():
+    """
+    Test that an unregistered profile raises an error.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    AS4100.default_AS4100(section=s, profile="not a profile")
+
+    assert True
+
+
 @mark.xfail(strict=True, raises=CodeCheckError)
 def test_AS4100_beam_section_None_error():
     """
@@ -192,6 +243,32 @@ def test_AS4100_get_section2():
     assert a.get_section(position=0.75) == ([0.75], [s3])
 
 
+def test_AS4100_get_as4100_section_runs():
+    """
+    Test the get_as4100_section_runs method against get_as4100_section.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.04, material=as3678_250)
+
+    e1 = Element.empty_element(length=0.5, section=s1)
+    e2 = Element.empty_element(length=0.0, section=s2)
+    e3 = Element.empty_element(length=0.5, section=s2)
+
+    b = Beam(elements=[e1, e2, e3])
+
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    positions, run_index, runs = a.get_as4100_section_runs(position=[0.25, 0.5])
+    expected = a.get_as4100_section(position=[0.25, 0.5])
+
+    assert len(runs) == 2
+    assert positions == expected[0]
+    assert [runs[r][2].section for r in run_index] == [
+        s.section for s in expected[1]
+    ]
+
+
 # some values sto test the get_tension method against
 invals = (
     {
@@ -580,6 +657,46 @@ def test_AS4100_Ntu_multi_positions():
     assert isclose(expected, a.Ntu(position=[0.75, 1.00]))
 
 
+def test_AS4100_capacity_cache():
+    """
+    Test that cached capacities are recalculated when the beam or the AS4100 factors
+    change.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.04, material=as3678_250)
+
+    e1 = Element.empty_element(length=0.5, section=s1)
+    e2 = Element.empty_element(length=0.5, section=s1)
+
+    b = Beam(elements=[e1, e2])
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    assert isclose(a.Nty(position=0.75), 250e6 * pi * 0.02 ** 2)
+
+    e2.section = s2
+
+    assert isclose(a.Nty(position=0.75), 240e6 * pi * 0.04 ** 2)
+    assert isclose(a.Nty(position=0.5), 250e6 * pi * 0.02 ** 2)
+    assert a.as4100_sections[1].section is s2
+
+    expected = 0.85 * 1.0 * a.as4100_sections[1].min_fu * pi * 0.04 ** 2
+
+    assert isclose(a.Ntu(position=0.75), expected)
+
+    a.kt = 0.5
+
+    assert isclose(a.Ntu(position=0.75), expected * 0.5)
+
+    # sections are mutable, so modifying one in place must also recalculate the
+    # cached capacities.
+    s2.radius = 0.06
+
+    expected = 0.85 * 0.5 * a.as4100_sections[1].min_fu * pi * 0.06 ** 2
+
+    assert isclose(a.Ntu(position=0.75), expected)
+
+
 def test_AS4100_tension_utilisation():
     """
     Very simple test of the tension_utilisation method.
@@ -656,6 +773,686 @@ def test_AS4100_tension_utilisation2():
         assert isclose(actual, expected)
 
 
+def test_AS4100_tension_utilisation_solver():
+    """
+    Test that the direct calculation of the tension utilisation matches the iterative
+    solution used for load dependent capacities.
+    """
+
+    class SolverAS4100(AS4100):
+        @property
+        def tension_capacity_load_dependent(self):
+            return True
+
+    s = Circle(radius=0.02, material=as3678_250)
+    l = LoadCase(
+        loads=[
+            [0.00, 0, 0, -50000, 0, 0, 0],
+            [0.50, 0, 0, 150000, 0, 0, 0],
+            [1.00, 0, 0, 200000, 0, 0, 0],
+        ]
+    )
+    b = Beam(elements=Element(loads={1: l}, length=1.0, section=s))
+
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+    a_solver = SolverAS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    assert not a.tension_capacity_load_dependent
+
+    u = a.tension_utilisation()
+
+    assert u.governing_load_case == 1
+    assert u.governing_position == 1.0
+    assert isclose(u.case_max[1], u)
+
+    for p in [0.0, 0.25, 0.5, 1.0]:
+        assert isclose(
+            a.tension_utilisation(position=p), a_solver.tension_utilisation(position=p)
+        )
+
+
+def test_AS4100_instrumentation():
+    """
+    Test the instrumentation report of a tension check, including the solver.
+    """
+
+    class SolverAS4100(AS4100):
+        @property
+        def tension_capacity_load_dependent(self):
+            return True
+
+    s = Circle(radius=0.02, material=as3678_250)
+    e = Element.constant_load_element(length=1.0, section=s, N=100000)
+    a = SolverAS4100(beam=Beam(elements=e), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    a.tension_utilisation()
+
+    # disabled by default.
+    assert a.instrumentation.report()["timers"] == {}
+
+    a.instrumentation.enabled = True
+
+    e.set_loads(load_case=0, loads=LoadCase.constant_load(N=50000))
+    a.tension_utilisation()
+    a.tension_utilisation()
+
+    report = a.instrumentation.report()
+
+    assert {"positions", "load_fetch", "capacity", "solve"} <= set(report["timers"])
+    assert report["counters"]["kernel_utilisation_matrix:tension"] == 1
+    assert report["counters"]["cases_recalculated"] == 1
+    assert report["counters"]["cases_reused"] == 1
+    assert report["counters"]["solver_calls"] > 0
+    assert report["counters"]["solver_iterations"] >= report["counters"]["solver_calls"]
+    assert report["caches"]["capacity:tension"]["hits"] == 1
+
+
+def test_AS4100_tension_utilisation_matrix():
+    """
+    Test the tension_utilisation_matrix method over multiple load cases and sections.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.03, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase(loads=[[0.0, 0, 0, 100000, 0, 0, 0]]),
+            2: LoadCase(loads=[[0.0, 0, 0, -100000, 0, 0, 0]]),
+        },
+        length=0.5,
+        section=s1,
+    )
+    e2 = Element(
+        loads={
+            1: LoadCase(loads=[[0.0, 0, 0, 200000, 0, 0, 0]]),
+            2: LoadCase(loads=[[0.0, 0, 0, 50000, 0, 0, 0]]),
+        },
+        length=0.5,
+        section=s2,
+    )
+    b = Beam(elements=[e1, e2])
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    c1 = 0.9 * 250e6 * pi * 0.02 ** 2
+    c2 = 0.9 * 240e6 * pi * 0.03 ** 2
+
+    positions, utilisation = a.tension_utilisation_matrix(position=[0.25, 0.5, 0.75])
+
+    assert np.allclose(positions, [0.25, 0.5, 0.5, 0.75])
+
+    # at the element boundary the capacity is the minimum of both sections.
+    expected = [
+        [100000 / c1, 100000 / c1, 200000 / c1, 200000 / c2],
+        [0.0, 0.0, 50000 / c1, 50000 / c2],
+    ]
+
+    assert np.allclose(utilisation, expected)
+
+
+def test_AS4100_tension_utilisation_grid():
+    """
+    Test that the peak load in a later load case is found, even if it is not at a
+    position used by the first load case.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+    l1 = LoadCase.constant_load(N=10000)
+    l2 = LoadCase(
+        loads=[
+            [0.00, 0, 0, 0, 0, 0, 0],
+            [0.37, 0, 0, 200000, 0, 0, 0],
+            [1.00, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    b = Beam(elements=Element(loads={1: l1, 2: l2}, length=1.0, section=s))
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    capacity = 0.9 * 250e6 * pi * 0.02 ** 2
+    actual = a.tension_utilisation()
+
+    assert isclose(actual, 200000 / capacity)
+    assert actual.governing_load_case == 2
+    assert isclose(actual.governing_position, 0.37)
+
+    # assessing only the load stations should find the same maximum.
+    a.stations_only = True
+    actual = a.tension_utilisation()
+
+    assert isclose(actual, 200000 / capacity)
+    assert np.allclose(actual.positions, [0.0, 0.37, 1.0])
+
+
+def test_AS4100_screen():
+    """
+    Test the utilisation bound & screening against the actual utilisation.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.03, material=as3678_250)
+    l1 = LoadCase(loads=[[0.0, 0, 0, 100000, 0, 0, 0], [1.0, 0, 0, -50000, 0, 0, 0]])
+    l2 = LoadCase(loads=[[0.0, 0, 0, 150000, 0, 0, 0], [1.0, 0, 0, 200000, 0, 0, 0]])
+
+    e1 = Element(loads={1: l1}, length=0.5, section=s1)
+    e2 = Element(loads={1: l2}, length=0.5, section=s2)
+    a = AS4100(beam=Beam(elements=[e1, e2]), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    c1 = 0.9 * 250e6 * pi * 0.02 ** 2
+
+    bound = a.utilisation_bound()
+
+    assert isclose(bound, 200000 / c1)
+    assert bound >= a.tension_utilisation()
+
+    assert a.screen(threshold=bound + 0.01)
+    assert not a.screen(threshold=bound - 0.01)
+
+
+@mark.parametrize(
+    "loads",
+    [
+        {"N": 100, "MX": 5e4},
+        {"N": -2e5},
+        {"VX": 1e5, "VY": -5e4},
+        {"N": -5e4, "MX": -1e3, "MY": 2e3},
+        {"N": 1e5, "MY": 1e3, "T": 1e6},
+    ],
+)
+def test_AS4100_screen_all_checks(loads):
+    """
+    The utilisation bound should bound the utilisation of every implemented check, not
+    just the tension check.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.03, material=as3678_250)
+
+    e1 = Element(loads={1: LoadCase.constant_load(**loads)}, length=1.0, section=s1)
+    e2 = Element(loads={1: LoadCase.constant_load()}, length=2.0, section=s2)
+
+    a = AS4100(beam=Beam(elements=[e1, e2]), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    bound = a.utilisation_bound()
+
+    actual = max(
+        a.tension_utilisation(),
+        a.compression_utilisation(),
+        a.shear_utilisation(),
+        a.section_moment_utilisation(),
+        a.combined_section_utilisation(),
+    )
+
+    assert actual > 0
+    assert bound >= actual * (1 - 1e-9)
+    assert not a.screen(threshold=actual)
+
+    assert a.compression_utilisation_bound() >= a.compression_utilisation() - 1e-9
+    assert a.shear_utilisation_bound() >= a.shear_utilisation() - 1e-9
+    assert (
+        a.section_moment_utilisation_bound()
+        >= a.section_moment_utilisation() - 1e-9
+    )
+    assert (
+        a.combined_section_utilisation_bound()
+        >= a.combined_section_utilisation() - 1e-9
+    )
+
+
+@mark.xfail(strict=True, raises=SectionOnlyError)
+def test_AS4100_utilisation_bound_section_only():
+    """
+    Section based AS4100 objects have no load envelope to bound the utilisation with.
+    """
+
+    a = AS4100(
+        section=Circle(radius=0.02, material=as3678_250), φ_steel=0.9, αu=0.85, kt=1.0
+    )
+
+    a.utilisation_bound()
+
+
+def test_AS4100_tension_utilisation_incremental():
+    """
+    Test that only changed load cases are recalculated, and that the results match a
+    fresh check.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase.constant_load(N=100000),
+            2: LoadCase(
+                loads=[[0.0, 0, 0, 0, 0, 0, 0], [0.5, 0, 0, 50000, 0, 0, 0]]
+                + [[0.5, 0, 0, 10000, 0, 0, 0], [1.0, 0, 0, 0, 0, 0, 0]]
+            ),
+        },
+        length=1.0,
+        section=s,
+    )
+    b = Beam(elements=e1)
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    capacity = 0.9 * 250e6 * pi * 0.02 ** 2
+
+    u = a.tension_utilisation()
+
+    assert isclose(u, 100000 / capacity)
+    assert u.governing_load_case == 1
+
+    calls = []
+    matrix = a.kernel_utilisation_matrix
+
+    def counting_matrix(*, kernel, load_case, position):
+        calls.append(load_case)
+        return matrix(kernel=kernel, load_case=load_case, position=position)
+
+    a.kernel_utilisation_matrix = counting_matrix
+
+    # no changes, so nothing is recalculated.
+    a.tension_utilisation()
+
+    assert calls == []
+
+    e1.set_loads(load_case=1, loads=LoadCase.constant_load(N=10000))
+
+    u = a.tension_utilisation()
+    expected = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0).tension_utilisation()
+
+    assert calls == [[1]]
+    assert isclose(u, 50000 / capacity)
+    assert u.governing_load_case == 2
+    assert np.allclose(u.positions, expected.positions)
+    assert np.allclose(u.utilisation, expected.utilisation)
+
+
+def test_AS4100_tension_utilisation_incremental_new_station():
+    """
+    Test that adding a load discontinuity to one load case does not recalculate the
+    other load cases, which are only checked at the new position.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase.constant_load(N=100000),
+            2: LoadCase(
+                loads=[[0.0, 0, 0, 0, 0, 0, 0], [0.5, 0, 0, 50000, 0, 0, 0]]
+                + [[0.5, 0, 0, 10000, 0, 0, 0], [1.0, 0, 0, 0, 0, 0, 0]]
+            ),
+            3: LoadCase.constant_load(N=20000),
+        },
+        length=1.0,
+        section=s,
+    )
+    b = Beam(elements=e1)
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    a.tension_utilisation()
+
+    calls = []
+    matrix = a.kernel_utilisation_matrix
+
+    def counting_matrix(*, kernel, load_case, position):
+        calls.append((load_case, np.asarray(position).tolist()))
+        return matrix(kernel=kernel, load_case=load_case, position=position)
+
+    a.kernel_utilisation_matrix = counting_matrix
+    a.instrumentation.enabled = True
+
+    e1.set_loads(
+        load_case=3,
+        loads=LoadCase(
+            loads=[[0.0, 0, 0, 20000, 0, 0, 0], [0.25, 0, 0, 150000, 0, 0, 0]]
+            + [[1.0, 0, 0, 20000, 0, 0, 0]]
+        ),
+    )
+
+    u = a.tension_utilisation()
+    expected = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0).tension_utilisation()
+
+    report = a.instrumentation.report()
+
+    assert report["counters"]["cases_recalculated"] == 1
+    assert report["counters"]["cases_reused"] == 2
+
+    # load case 3 is recalculated, and load cases 1 & 2 are only checked at the new
+    # discontinuity.
+    assert calls[0][0] == [3]
+    assert calls[1:] == [([1, 2], [0.25])]
+
+    assert u.governing_load_case == 3
+    assert np.allclose(u.positions, expected.positions)
+    assert np.allclose(u.utilisation, expected.utilisation)
+
+    # no changes, so nothing is recalculated.
+    calls.clear()
+    a.tension_utilisation()
+
+    assert calls == []
+
+
+def make_compression_check(**kwargs):
+    """
+    Helper function to build an as4100 object for compression checks, over a 4m beam
+    of 3x elements with 2x sections, and a restraint part way along the first element.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.03, material=as3678_250)
+
+    loads = {
+        1: LoadCase.constant_load(N=-20000),
+        2: LoadCase.constant_load(N=20000),
+    }
+
+    e1 = Element(loads=loads, length=2.0, section=s1)
+    e2 = Element(loads=loads, length=1.0, section=s1)
+    e3 = Element(loads=loads, length=1.0, section=s2)
+
+    b = Beam(elements=[e1, e2, e3])
+
+    return AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0, **kwargs)
+
+
+def test_AS4100_compression_capacity():
+    """
+    Test the member compression capacity, which is calculated once per segment and
+    section.
+    """
+
+    a = make_compression_check(restraints=[1.0])
+
+    def φNc(section, length):
+        return a.s6_1_1_Nc(section=a.as4100_sections[section], length=length)["φN_c"]
+
+    c_0 = φNc(0, 1.0)
+    c_1 = φNc(0, 3.0)
+    c_2 = φNc(2, 3.0)
+
+    assert c_1 < c_0
+    assert c_1 < c_2
+
+    calls = []
+    s6_1_1_Nc = a.s6_1_1_Nc
+
+    def counting_Nc(*, section, length):
+        calls.append(length)
+        return s6_1_1_Nc(section=section, length=length)
+
+    a.s6_1_1_Nc = counting_Nc
+
+    assert isclose(a.compression_capacity(), c_1)
+    assert isclose(a.compression_capacity(position=0.5), c_0)
+    assert isclose(a.compression_capacity(position=1.0), c_1)
+    assert isclose(a.compression_capacity(position=3.5), c_2)
+    assert isclose(a.compression_capacity(position=[0.5, 3.5]), c_1)
+
+    # 1x calculation for the first segment, and 1x for each section in the second.
+    assert len(calls) == 3
+
+    # changing the restraints invalidates the cached capacities.
+    a.restraints = None
+
+    assert isclose(a.compression_capacity(position=0.5), φNc(0, 4.0))
+
+
+def test_AS4100_compression_capacity_S6():
+    """
+    The compression capacity should match a direct call to s6_1_1_Nc.
+    """
+
+    a = make_compression_check(k_ex=0.85, k_ey=0.7)
+    s = a.as4100_sections[0]
+
+    expected = S6.s6_1_1_Nc(
+        A_n=s.An,
+        k_f=1.0,
+        l=4.0,
+        k_ex=0.85,
+        k_ey=0.7,
+        k_ez=1.0,
+        r_x=0.01,
+        r_y=0.01,
+        x_o=0.0,
+        y_o=0.0,
+        J=0.0,
+        I_w=0.0,
+        f_y=250e6,
+        E=200e9,
+        G=0.0,
+        φ=0.9,
+        calc_torsion=False,
+    )
+
+    assert isclose(a.compression_capacity(position=0.5), expected["φN_c"])
+
+
+def test_AS4100_compression_utilisation():
+    """
+    Test the compression utilisation over multiple segments & sections.
+    """
+
+    a = make_compression_check(restraints=[1.0])
+
+    c_0 = a.compression_capacity(position=0.5)
+    c_1 = a.compression_capacity(position=2.5)
+    c_2 = a.compression_capacity(position=3.5)
+
+    u = a.compression_utilisation()
+
+    assert isclose(u, 20000 / c_1)
+    assert u.governing_load_case == 1
+    assert 1.0 <= u.governing_position <= 3.0
+
+    positions, utilisation = a.compression_utilisation_matrix(
+        position=[0.5, 1.0, 2.5, 3.5]
+    )
+
+    expected = np.array(
+        [
+            [20000 / c_0, 20000 / c_1, 20000 / c_1, 20000 / c_2],
+            [0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    assert np.allclose(positions, [0.5, 1.0, 2.5, 3.5])
+    assert np.allclose(utilisation, expected)
+
+    # the restraints are always included in the positions checked.
+    assert 1.0 in u.positions
+
+
+@mark.xfail(strict=True, raises=PositionNotInBeamError)
+def test_AS4100_compression_restraint_error():
+    """
+    Restraints outside the beam should raise an error.
+    """
+
+    a = make_compression_check(restraints=[5.0])
+
+    a.compression_utilisation()
+
+
+def test_AS4100_shear_capacity():
+    """
+    Test the shear capacity of a solid circle, including the non-uniform shear factor.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+    a = AS4100(section=s, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    α_vma = 2 / (0.9 + 4 / 3)
+    expected = 0.9 * α_vma * 0.6 * 250e6 * pi * 0.02 ** 2
+
+    assert isclose(a.shear_capacity(), expected)
+    assert isclose(a.shear_capacity(axis="x"), expected)
+    assert isclose(a.shear_capacity(axis="y"), expected)
+
+
+def test_AS4100_shear_utilisation():
+    """
+    Test the shear utilisation in both directions, over multiple sections.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.03, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase.constant_load(VX=10000, VY=-30000),
+            2: LoadCase.constant_load(VX=-40000, VY=5000),
+        },
+        length=1.0,
+        section=s1,
+    )
+    e2 = Element(
+        loads={
+            1: LoadCase.constant_load(VX=60000, VY=0),
+            2: LoadCase.constant_load(VX=0, VY=0),
+        },
+        length=1.0,
+        section=s2,
+    )
+
+    a = AS4100(beam=Beam(elements=[e1, e2]), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    c1 = a.shear_capacity(position=0.5)
+    c2 = a.shear_capacity(position=1.5)
+
+    assert isclose(a.shear_capacity(position=1.0), c1)
+
+    ux = a.shear_utilisation(axis="x")
+    uy = a.shear_utilisation(axis="y")
+    u = a.shear_utilisation()
+
+    # at the element boundary the capacity of the smaller section governs.
+    assert isclose(ux, 60000 / c1)
+    assert ux.governing_load_case == 1
+    assert isclose(ux.governing_position, 1.0)
+    assert isclose(uy, 30000 / c1)
+    assert isclose(u, 60000 / c1)
+    assert np.allclose(u.utilisation, np.maximum(ux.utilisation, uy.utilisation))
+
+    u = a.shear_utilisation(load_case=2, position=[0.5, 1.5])
+
+    assert np.allclose(u.utilisation, [[40000 / c1, 0.0]])
+    assert isclose(u, 40000 / c1)
+
+    a.stations_only = True
+
+    assert isclose(a.shear_utilisation(), 60000 / c1)
+    assert isclose(a.shear_utilisation(position=1.5), 60000 / c2)
+
+
+@mark.xfail(strict=True, raises=CodeCheckError)
+def test_AS4100_shear_axis_error():
+    """
+    An invalid shear axis should raise an error.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+    a = AS4100(section=s, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    a.shear_capacity(axis="z")
+
+
+def test_AS4100_section_moment_capacity():
+    """
+    Test the section moment capacity of a solid circle.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+    a = AS4100(section=s, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    # a solid circle is compact, so Ze = min(S, 1.5Z) = 1.5Z.
+    expected = 0.9 * 250e6 * 1.5 * pi * 0.02 ** 3 / 4
+
+    assert isclose(a.section_moment_capacity(), expected)
+    assert isclose(a.section_moment_capacity(axis="x"), expected)
+    assert isclose(a.section_moment_capacity(axis="y"), expected)
+
+
+def test_AS4100_section_moment_utilisation():
+    """
+    Test the section moment utilisation about both axes, over multiple load cases.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase(
+                loads=[[0.0, 0, 0, 0, 0, 0, 0], [1.0, 0, 0, 0, -1000, 200, 0]]
+            ),
+            2: LoadCase.constant_load(MX=100, MY=-700),
+        },
+        length=2.0,
+        section=s,
+    )
+
+    a = AS4100(beam=Beam(elements=e1), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    c = a.section_moment_capacity()
+
+    ux = a.section_moment_utilisation(axis="x")
+    uy = a.section_moment_utilisation(axis="y")
+    u = a.section_moment_utilisation()
+
+    assert isclose(ux, 1000 / c)
+    assert ux.governing_load_case == 1
+    assert isclose(ux.governing_position, 2.0)
+    assert isclose(uy, 700 / c)
+    assert uy.governing_load_case == 2
+    assert isclose(u, 1000 / c)
+    assert u.case_max[2] == approx(700 / c)
+
+    u = a.section_moment_utilisation(load_case=1, position=[0.0, 1.0, 2.0])
+
+    assert np.allclose(u.utilisation, [[0.0, 500 / c, 1000 / c]])
+
+
+def test_AS4100_combined_section_utilisation():
+    """
+    Test the combined actions section utilisation, with both tensile & compressive
+    axial loads.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase.constant_load(N=20000, MX=500, MY=-200),
+            2: LoadCase(
+                loads=[[0.0, 0, 0, -40000, 0, 0, 0], [1.0, 0, 0, -40000, 0, 800, 0]]
+            ),
+        },
+        length=2.0,
+        section=s,
+    )
+
+    a = AS4100(beam=Beam(elements=e1), φ_steel=0.9, αu=0.85, kt=1.0)
+
+    φNt = a.tension_capacity()
+    φNs = 0.9 * 250e6 * pi * 0.02 ** 2
+    φMs = a.section_moment_capacity()
+
+    u = a.combined_section_utilisation()
+
+    expected_1 = 20000 / φNt + 500 / φMs + 200 / φMs
+    expected_2 = 40000 / φNs + 800 / φMs
+
+    assert u.case_max == approx({1: expected_1, 2: expected_2})
+    assert isclose(u, max(expected_1, expected_2))
+    assert u.governing_load_case == 2
+    assert isclose(u.governing_position, 2.0)
+
+    u = a.combined_section_utilisation(load_case=2, position=[0.0, 1.0])
+
+    assert np.allclose(u.utilisation, [[40000 / φNs, 40000 / φNs + 400 / φMs]])
+
+
 def test_AS4100_tension_utilisation3():
     """
     Test the tension_utilisation method when there are multiple sections along the beam.
@@ -959,3 +1756,53 @@ def test_AS4100_tension_utilisation6():
         actual = a.tension_utilisation(position=p, load_case=2)
 
         assert isclose(actual, expected)
+
+
+def test_AS4100_catalogue_capacities():
+    """
+    The capacities of a catalogue of sections should match those of individual AS4100
+    objects.
+    """
+
+    radii = [0.004, 0.01, 0.02, 0.05]
+
+    checks = [
+        AS4100.default_AS4100(section=Circle(radius=r, material=as3678_250))
+        for r in radii
+    ]
+
+    area = np.array([pi * r ** 2 for r in radii])
+    thickness = 2 * np.array(radii)
+
+    capacities = AS4100.catalogue_capacities(
+        Ag=area, An=area, thickness=thickness, material=as3678_250, kf=1.0
+    )
+
+    assert np.allclose(capacities["fy"], [a.as4100_sections[0].min_fy for a in checks])
+    assert np.allclose(capacities["Nty"], [a.Nty() for a in checks])
+    assert np.allclose(capacities["Ntu"], [a.Ntu() for a in checks])
+    assert np.allclose(capacities["φNt"], [a.tension_capacity() for a in checks])
+    # a solid circle is fully effective in compression.
+    assert np.allclose(capacities["φNs"], 0.9 * capacities["fy"] * area)
+
+
+def test_AS4100_catalogue_capacities_factors():
+    """
+    Test that capacity factors override the defaults, and that Ns is only calculated
+    when kf is provided.
+    """
+
+    capacities = AS4100.catalogue_capacities(
+        Ag=[1.0, 1.0],
+        An=[0.5, 1.0],
+        thickness=0.01,
+        material=as3678_250,
+        φ_steel=0.8,
+        αu=1.0,
+        kt=1.0,
+    )
+
+    # fy = 260 MPa, fu = 410 MPa.
+    assert np.allclose(capacities["Nt"], [0.5 * 410e6, 260e6])
+    assert np.allclose(capacities["φNt"], 0.8 * capacities["Nt"])
+    assert "Ns" not in capacities
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+import beamdesign.codecheck.as4100.S8 as S8
+
+
+class Test_S8_Test(unittest.TestCase):
+    def test_s8_3_φN(self):
+        """
+        Test that the tension capacity is used for tensile loads and the compression
+        capacity for compressive loads.
+        """
+
+        N = np.array([[10.0, -10.0], [0.0, -5.0]])
+        φN_t = np.array([100.0, 200.0])
+        φN_s = np.array([50.0, 80.0])
+
+        expected = np.array([[100.0, 80.0], [100.0, 80.0]])
+
+        self.assertTrue(np.allclose(S8.s8_3_φN(N=N, φN_t=φN_t, φN_s=φN_s), expected))
+
+    def test_s8_3_4_interaction(self):
+        """
+        Test the S8.3.4 interaction equation, broadcast over load cases & positions.
+        """
+
+        N = np.array([[10.0, -20.0, 0.0], [0.0, 0.0, 40.0]])
+        M_x = np.array([[5.0, 0.0, -10.0], [0.0, 0.0, 0.0]])
+        M_y = np.array([[0.0, 4.0, 0.0], [-8.0, 0.0, 0.0]])
+
+        φN = np.array([100.0, 50.0, 100.0])
+        φM_sx = np.array([20.0, 20.0, 40.0])
+        φM_sy = np.array([10.0, 10.0, 20.0])
+
+        expected = np.array([[0.35, 0.8, 0.25], [0.8, 0.0, 0.4]])
+
+        actual = S8.s8_3_4_interaction(
+            N=N, M_x=M_x, M_y=M_y, φN=φN, φM_sx=φM_sx, φM_sy=φM_sy
+        )
+
+        self.assertTrue(np.allclose(actual, expected))
+
+    def test_s8_3_4_interaction_scalar(self):
+        """
+        Test the S8.3.4 interaction equation with scalar values.
+        """
+
+        actual = S8.s8_3_4_interaction(
+            N=-25.0, M_x=10.0, M_y=-5.0, φN=100.0, φM_sx=40.0, φM_sy=20.0
+        )
+
+        self.assertAlmostEqual(float(actual), 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
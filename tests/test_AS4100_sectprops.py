@@ -6,9 +6,12 @@ from math import isclose, pi
 
 from pytest import mark
 
+import numpy as np
+
 from beamdesign.codecheck.as4100.as4100_sect_props import AS4100Section, AS4100Circle
 from beamdesign.sections.circle import Circle
 from beamdesign.materials.material import Material
+from beamdesign.utility.exceptions import InvalidThicknessError
 
 as3678_250 = Material.load_material(name="AS3678-2016-250")
 
@@ -120,3 +123,84 @@ def test_circle_An():
     expected = pi * 0.02 ** 2
 
     assert isclose(expected, actual)
+
+
+def test_circle_compression_props():
+    """
+    Test the AS4100Circle compression properties.
+    """
+
+    c = Circle(material=as3678_250, radius=0.02)
+
+    as4100circle = AS4100Circle(section=c)
+
+    assert isclose(as4100circle.kf, 1.0)
+    assert isclose(as4100circle.rx, 0.01)
+    assert isclose(as4100circle.ry, 0.01)
+    assert isclose(as4100circle.αb, 1.0)
+
+
+def test_circle_shear_props():
+    """
+    Test the AS4100Circle shear properties.
+    """
+
+    c = Circle(material=as3678_250, radius=0.02)
+
+    as4100circle = AS4100Circle(section=c)
+
+    assert isclose(as4100circle.Awx, pi * 0.02 ** 2)
+    assert isclose(as4100circle.Awy, pi * 0.02 ** 2)
+    assert isclose(as4100circle.α_vma, 2 / (0.9 + 4 / 3))
+    assert as4100circle.web(axis="x") is None
+
+
+def test_circle_Ze():
+    """
+    Test the AS4100Circle effective section modulus.
+    """
+
+    c = Circle(material=as3678_250, radius=0.02)
+
+    as4100circle = AS4100Circle(section=c)
+
+    expected = 1.5 * pi * 0.02 ** 3 / 4
+
+    assert isclose(as4100circle.Zex, expected)
+    assert isclose(as4100circle.Zey, expected)
+
+
+def test_get_f_array():
+    """
+    The vectorised strength lookup should match the scalar lookup.
+    """
+
+    strengths = as3678_250.properties["strengths"]
+    thicknesses = [0.0, 0.008, 0.009, 0.02, 0.021, 0.2]
+
+    for yield_or_ult in ("Y", "U"):
+        expected = [
+            AS4100Section._get_f(
+                thickness=t, yield_or_ult=yield_or_ult, strengths=strengths
+            )
+            for t in thicknesses
+        ]
+
+        actual = AS4100Section.get_f_array(
+            thickness=thicknesses, yield_or_ult=yield_or_ult, strengths=strengths
+        )
+
+        assert np.allclose(actual, expected)
+
+
+@mark.xfail(strict=True, raises=InvalidThicknessError)
+def test_get_f_array_error():
+    """
+    Thicknesses outside the range of the material strengths should raise an error.
+    """
+
+    AS4100Section.get_f_array(
+        thickness=[0.01, 0.3],
+        yield_or_ult="Y",
+        strengths=as3678_250.properties["strengths"],
+    )
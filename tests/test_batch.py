@@ -0,0 +1,118 @@
+"""
+Contains tests for the batch checking functions.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from math import isclose
+
+from beamdesign.beam import Beam
+from beamdesign.codecheck.as4100.as4100 import AS4100
+from beamdesign.codecheck.batch import beam_cost, check_all, chunk_by_cost
+from beamdesign.element import Element
+from beamdesign.materials.material import Material
+from beamdesign.sections.circle import Circle
+from beamdesign import sharedmemory
+
+as3678_250 = Material.load_material(name="AS3678-2016-250")
+
+
+def make_beams(n):
+    """
+    Helper function to make a list of beams with increasing tension loads.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    return [
+        Beam(elements=Element.constant_load_element(length=1.0, section=s, N=1000 * i))
+        for i in range(n)
+    ]
+
+
+def test_chunk_by_cost():
+    """
+    Test grouping items into chunks by cost.
+    """
+
+    chunks = chunk_by_cost(costs=[1, 1, 1, 5, 1, 2], target=3)
+
+    assert chunks == [[0, 1, 2], [3], [4, 5]]
+
+
+def test_beam_cost():
+    """
+    Test that the cost of a beam increases with its no. of load cases.
+    """
+
+    beams = make_beams(1)
+
+    assert beam_cost(beam=beams[0]) > 0
+
+
+def test_check_all():
+    """
+    Test checking a number of beams, including one that fails.
+    """
+
+    beams = make_beams(6)
+    beams[3] = Beam(elements=Element.constant_load_element(length=1.0, N=1000))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(check_all(beams, executor=executor, chunk_cost=1))
+
+    assert [r.index for r in results] == list(range(6))
+    assert [r.ok for r in results] == [True, True, True, False, True, True]
+
+    capacity = AS4100.default_AS4100(beam=beams[1]).tension_capacity()
+
+    assert isclose(results[5].result, 5000 / capacity)
+
+
+def test_check_all_process_pool():
+    """
+    Test checking a dictionary of beams on a process pool, with results returned as
+    they complete.
+    """
+
+    beams = dict(zip("abcd", make_beams(4)))
+
+    results = list(check_all(beams, max_workers=2, ordered=False))
+
+    assert sorted(r.key for r in results) == ["a", "b", "c", "d"]
+    assert all(r.ok for r in results)
+
+
+def attached_blocks():
+    """
+    Helper function to get the shared memory blocks that a worker is attached to.
+    """
+
+    return list(sharedmemory._attached)
+
+
+def test_check_all_reused_executor():
+    """
+    Workers should detach from the shared memory once each chunk is checked, so that
+    reusing an executor across many calls does not keep every model in memory.
+    """
+
+    beams = make_beams(4)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+
+        for _ in range(3):
+            results = list(check_all(beams, executor=executor, chunk_cost=1))
+
+            assert all(r.ok for r in results)
+            assert executor.submit(attached_blocks).result() == []
+
+    # a failed check should not keep the block attached either.
+    beams[1] = Beam(elements=Element.constant_load_element(length=1.0, N=1000))
+
+    attached = set(sharedmemory._attached)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(check_all(beams, executor=executor, chunk_cost=1))
+
+    assert [r.ok for r in results] == [True, False, True, True]
+    assert set(sharedmemory._attached) == attached
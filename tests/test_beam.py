@@ -738,6 +738,33 @@ def test_Beam_get_section_multiple():
     )
 
 
+def test_Beam_get_section_runs():
+    """
+    Test the beam get_section_runs method against get_section.
+    """
+
+    s1 = Circle(radius=0.02, material=as3678_250)
+    s2 = Circle(radius=0.04, material=as3678_250)
+
+    e1 = Element.empty_element(length=0.5, section=s1)
+    e2 = Element.empty_element(length=0.5, section=s1)
+    e3 = Element.empty_element(length=0.0, section=s2)
+    e4 = Element.empty_element(length=1.0, section=s1)
+
+    b = Beam(elements=[e1, e2, e3, e4])
+
+    assert b.section_runs == [(0.0, 1.0, s1), (1.0, 1.0, s2), (1.0, 2.0, s1)]
+    assert np.array_equal(b.element_section_runs, [0, 0, 1, 2])
+
+    position = [0.25, 0.5, 1.0, 1.5]
+
+    positions, run_index, runs = b.get_section_runs(position=position)
+
+    assert positions == b.get_section(position=position)[0]
+    assert np.array_equal(run_index, [0, 0, 0, 0, 1, 1, 2, 2])
+    assert [runs[r][2] for r in run_index] == b.get_section(position=position)[1]
+
+
 @mark.xfail(strict=True, raises=PositionNotInBeamError)
 @mark.parametrize("position", [-0.1, 1.1])
 def test_Beam_get_section_outside_range_err(position):
@@ -758,3 +785,172 @@ def test_Beam_get_section_outside_range_err(position):
     b.get_section(position=position)
 
     assert True
+
+
+def test_Beam_station_positions():
+    """
+    Test the station_positions method, which should include all element ends and load
+    positions in all load cases.
+    """
+
+    l1 = LoadCase(loads=[[0.0, 0, 0, 1.0, 0, 0, 0], [0.5, 0, 0, 2.0, 0, 0, 0]])
+    l2 = LoadCase(loads=[[0.25, 0, 0, 1.0, 0, 0, 0], [1.0, 0, 0, 2.0, 0, 0, 0]])
+
+    e1 = Element(loads={1: l1, 2: l2}, length=2.0)
+    e2 = Element(loads={1: l2, 2: l1}, length=2.0)
+
+    b = Beam(elements=[e1, e2])
+
+    assert np.allclose(b.station_positions(), [0.0, 0.5, 1.0, 2.0, 2.5, 3.0, 4.0])
+    assert np.allclose(b.station_positions(load_cases=[1]), [0.0, 1.0, 2.0, 2.5, 4.0])
+
+
+def test_Beam_get_loads_multi_case():
+    """
+    Test the get_loads_multi_case method against the get_loads method in each load
+    case, including a discontinuity in only one of the load cases.
+    """
+
+    l1 = LoadCase(
+        loads=[
+            [0.0, 0, 0, 1.0, 0, 0, 0],
+            [0.5, 0, 0, 2.0, 0, 0, 0],
+            [0.5, 0, 0, 3.0, 0, 0, 0],
+            [1.0, 0, 0, 4.0, 0, 0, 0],
+        ]
+    )
+    l2 = LoadCase.constant_load(N=5.0)
+
+    e1 = Element(loads={1: l1, 2: l2}, length=1.0)
+    e2 = Element(loads={1: l2, 2: l1}, length=1.0)
+
+    b = Beam(elements=[e1, e2])
+
+    positions, elements, loads = b.get_loads_multi_case(
+        position=[0.0, 0.25, 0.5, 1.0, 1.5, 2.0], component="N"
+    )
+
+    assert np.allclose(positions, [0.0, 0.25, 0.5, 0.5, 1.0, 1.0, 1.5, 1.5, 2.0])
+    assert np.array_equal(elements, [0, 0, 0, 0, 0, 1, 1, 1, 1])
+    assert loads.shape == (2, 9, 1)
+
+    expected = np.array(
+        [
+            [1.0, 1.5, 2.0, 3.0, 4.0, 5.0, 5.0, 5.0, 5.0],
+            [5.0, 5.0, 5.0, 5.0, 5.0, 1.0, 2.0, 3.0, 4.0],
+        ]
+    )
+
+    assert np.allclose(loads[..., 0], expected)
+
+    positions, elements, loads = b.get_loads_multi_case(position=0.75, load_cases=[2])
+
+    assert loads.shape == (1, 1, 6)
+    assert np.allclose(loads[0, 0], [0, 0, 5.0, 0, 0, 0])
+
+
+def test_Beam_version():
+    """
+    Test that values cached on the ``Beam`` are updated when an ``Element`` changes.
+    """
+
+    e1 = Element.empty_element(length=1.0)
+    e2 = Element.empty_element(length=2.0)
+
+    b = Beam(elements=[e1, e2])
+
+    version = b.version
+
+    assert b.length == 3.0
+    assert b.element_ends == [[0.0, 1.0], [1.0, 3.0]]
+
+    e1.length = 2.0
+
+    assert b.version > version
+    assert b.length == 4.0
+    assert b.element_ends == [[0.0, 2.0], [2.0, 4.0]]
+    assert b.get_element_start_end(element=1) == [2.0, 4.0]
+
+
+def test_Beam_content_hash():
+    """
+    Test that identical beams have the same content hash, and that the hash changes
+    when the loads or sections change.
+    """
+
+    def make_beam():
+        s = Circle(radius=0.02, material=as3678_250)
+
+        return Beam(elements=Element.constant_load_element(length=1.0, section=s, N=1))
+
+    b = make_beam()
+    content_hash = b.content_hash
+
+    assert make_beam().content_hash == content_hash
+
+    b.elements[0].set_loads(load_case=0, loads=LoadCase.constant_load(N=2))
+
+    assert b.content_hash != content_hash
+
+    b = make_beam()
+    b.elements[0].section = Circle(radius=0.03, material=as3678_250)
+
+    assert b.content_hash != content_hash
+
+    # sections are mutable, so modifying one in place must also change the hash.
+    b = make_beam()
+    assert b.content_hash == content_hash
+
+    b.elements[0].section.radius = 0.03
+
+    assert b.content_hash != content_hash
+
+    # elements may have no length.
+    assert (
+        Beam(elements=Element.empty_element(length=None)).content_hash
+        != Beam(elements=Element.empty_element(length=0.0)).content_hash
+    )
+
+
+def test_Beam_assessment_positions():
+    """
+    Test that the assessment grid includes the discontinuities in every load case.
+    """
+
+    l1 = LoadCase(loads=[[0.0, 0, 0, 1, 0, 0, 0], [0.3, 0, 0, 1, 0, 0, 0]])
+    l2 = LoadCase(loads=[[0.0, 0, 0, 1, 0, 0, 0], [0.7, 0, 0, 1, 0, 0, 0]])
+
+    e1 = Element(loads={1: l1, 2: l2}, length=1.0)
+    e2 = Element(loads={1: l1, 2: l2}, length=1.0)
+
+    b = Beam(elements=[e1, e2])
+
+    positions = b.assessment_positions(min_positions=3)
+
+    assert np.allclose(positions, [0.0, 0.3, 0.7, 1.0, 1.3, 1.7, 2.0])
+    assert b.assessment_positions(min_positions=3) is positions
+
+    positions = b.assessment_positions(min_positions=3, load_cases=[2])
+
+    assert np.allclose(positions, [0.0, 0.7, 1.0, 1.7, 2.0])
+
+
+def test_Beam_load_envelope():
+    """
+    Test the envelope of the loads along the beam.
+    """
+
+    l1 = LoadCase(loads=[[0.0, 1, 2, 3, 4, 5, 6], [1.0, -1, -2, -3, -4, -5, -6]])
+    l2 = LoadCase(loads=[[0.0, 10, 0, 0, 0, 0, 0]])
+
+    b = Beam(elements=Element(loads={1: l1, 2: l2, 3: LoadCase()}, length=1.0))
+
+    max_loads, min_loads = b.load_envelope()
+
+    assert np.allclose(max_loads, [10, 2, 3, 4, 5, 6])
+    assert np.allclose(min_loads, [-1, -2, -3, -4, -5, -6])
+
+    max_loads, min_loads = b.load_envelope(load_cases=[2])
+
+    assert np.allclose(max_loads, [10, 0, 0, 0, 0, 0])
+    assert np.allclose(min_loads, [0, 0, 0, 0, 0, 0])
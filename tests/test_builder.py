@@ -0,0 +1,165 @@
+"""
+Contains tests for the functions in builder.py.
+"""
+
+from pytest import mark
+
+import numpy as np
+
+from beamdesign.builder import assemble_beams, chain_elements, reverse_loads
+from beamdesign.utility.exceptions import BeamAssemblyError
+
+
+def make_loads(no_elements):
+    """
+    Helper function to build a loads array with 2x load cases and 2x stations per
+    element. The axial load increases linearly along each element, from element no. to
+    element no. + 0.5, and is negated in the 2nd load case.
+    """
+
+    loads = np.zeros((2, no_elements, 2, 7))
+
+    for e in range(no_elements):
+        loads[0, e, :, 0] = [0.0, 1.0]
+        loads[0, e, :, 3] = [e, e + 0.5]
+
+    loads[1] = loads[0]
+    loads[1, ..., 3] *= -1
+
+    return loads
+
+
+def test_chain_elements():
+    """
+    Test ordering the elements of 2x members, one of which has a reversed element and
+    is provided out of order.
+    """
+
+    node_i = [1, 4, 10, 2, 11]
+    node_j = [2, 3, 11, 3, 12]
+    tags = ["A", "A", "B", "A", "B"]
+
+    members = chain_elements(node_i=node_i, node_j=node_j, tags=tags)
+
+    order, reverse = members["A"]
+
+    assert np.array_equal(order, [0, 3, 1])
+    assert np.array_equal(reverse, [False, False, True])
+
+    order, reverse = members["B"]
+
+    assert np.array_equal(order, [2, 4])
+    assert np.array_equal(reverse, [False, False])
+
+
+def test_chain_elements_first_reversed():
+    """
+    Test that the direction of the member follows the first element provided.
+    """
+
+    members = chain_elements(node_i=[2, 2], node_j=[3, 1], tags=[1, 1])
+
+    order, reverse = members[1]
+
+    assert np.array_equal(order, [1, 0])
+    assert np.array_equal(reverse, [True, False])
+
+
+def test_reverse_loads():
+    """
+    Test reversing the loads on an element.
+    """
+
+    loads = make_loads(2)
+
+    reversed_loads = reverse_loads(loads=loads, reverse=[False, True])
+
+    assert np.allclose(reversed_loads[:, 0], loads[:, 0])
+    assert np.allclose(reversed_loads[0, 1, :, 0], [0.0, 1.0])
+    assert np.allclose(reversed_loads[0, 1, :, 3], [1.5, 1.0])
+
+    factors = [-1.0, -1.0, 1.0, 1.0, 1.0, -1.0]
+
+    reversed_loads = reverse_loads(
+        loads=loads, reverse=[False, True], reversal_factors=factors
+    )
+
+    assert np.allclose(reversed_loads[1, 1, :, 3], [-1.5, -1.0])
+    assert np.allclose(loads, make_loads(2))
+
+
+def test_assemble_beams():
+    """
+    Test assembling beams from element connectivity.
+    """
+
+    node_i = [1, 4, 10, 2]
+    node_j = [2, 3, 11, 3]
+    tags = ["A", "A", "B", "A"]
+    lengths = [1.0, 2.0, 5.0, 3.0]
+
+    beams = assemble_beams(
+        node_i=node_i,
+        node_j=node_j,
+        tags=tags,
+        lengths=lengths,
+        loads=make_loads(4),
+        load_cases=[101, 102],
+    )
+
+    assert set(beams) == {"A", "B"}
+
+    a = beams["A"]
+
+    assert a.no_elements == 3
+    assert a.length == 6.0
+    assert set(a.load_cases) == {101, 102}
+
+    # element 1 is reversed, so its loads run from 1.5 to 1.0.
+    assert np.isclose(
+        a.get_loads(load_case=101, position=5.0, component="N")[0, 1], 1.25
+    )
+    assert np.isclose(
+        a.get_loads(load_case=101, position=6.0, component="N")[0, 1], 1.0
+    )
+    assert np.isclose(
+        a.get_loads(load_case=102, position=2.5, component="N")[0, 1], -3.25
+    )
+
+    assert beams["B"].length == 5.0
+
+
+@mark.parametrize(
+    "node_i, node_j",
+    [
+        ([1, 2, 2], [2, 3, 4]),  # branched member
+        ([1, 3], [2, 4]),  # disconnected member
+        ([1, 2, 3], [2, 3, 1]),  # closed loop
+    ],
+)
+@mark.xfail(strict=True, raises=BeamAssemblyError)
+def test_chain_elements_error(node_i, node_j):
+    """
+    Test that members which are not a single open chain of elements raise an error.
+    """
+
+    chain_elements(node_i=node_i, node_j=node_j, tags=[0] * len(node_i))
+
+    assert True
+
+
+@mark.xfail(strict=True, raises=BeamAssemblyError)
+def test_assemble_beams_loads_error():
+    """
+    Test that a loads array of the wrong shape raises an error.
+    """
+
+    assemble_beams(
+        node_i=[1, 2],
+        node_j=[2, 3],
+        tags=[0, 0],
+        lengths=[1.0, 1.0],
+        loads=make_loads(3),
+    )
+
+    assert True
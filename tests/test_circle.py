@@ -4,7 +4,10 @@ Contains tests for the circle section properties class
 
 from math import isclose
 
+from pytest import mark
+
 from beamdesign.sections.circle import Circle
+from beamdesign.sections.section import Section
 from beamdesign.materials.material import Material
 
 as3678_250 = Material.load_material(name="AS3678-2016-250")
@@ -42,3 +45,39 @@ def test_Circle_area():
     expected = 0.00125663706143592
 
     assert isclose(actual, expected)
+
+
+def test_Circle_content_hash():
+    """
+    Test that the content hash depends on the dimensions & material, and not on the
+    identity of the object.
+    """
+
+    c = Circle(radius=0.02, material=as3678_250)
+    content_hash = c.content_hash
+
+    assert Circle(radius=0.02, material=as3678_250).content_hash == content_hash
+    assert (
+        Circle(
+            radius=0.02, material=Material.load_material(name="AS3678-2016-350")
+        ).content_hash
+        != content_hash
+    )
+
+    c.radius = 0.03
+
+    assert c.content_hash != content_hash
+
+
+@mark.xfail(strict=True, raises=NotImplementedError)
+def test_Section_content_hash_no_dimensions():
+    """
+    Test that a section that does not provide its dimensions cannot be hashed.
+    """
+
+    class NoDimensions(Circle):
+        @property
+        def dimensions(self):
+            return Section.dimensions.fget(self)
+
+    NoDimensions(radius=0.02, material=as3678_250).content_hash
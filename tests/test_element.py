@@ -5,7 +5,8 @@ Contains tests for the Element class.
 from pytest import mark
 
 from beamdesign.element import Element
-from beamdesign.utility.exceptions import ElementLengthError
+from beamdesign.loadcase import LoadCase
+from beamdesign.utility.exceptions import ElementCaseError, ElementLengthError
 
 
 def test_Element_init():
@@ -37,3 +38,68 @@ def test_Element_get_length(length):
     a.length = length
 
     assert a.length == length
+
+
+def test_Element_version():
+    """
+    Test that the ``Element.version`` changes when the ``Element`` is modified.
+    """
+
+    a = Element.empty_element(length=1.0)
+
+    version = a.version
+
+    a.length = 2.0
+
+    assert a.version > version
+
+    version = a.version
+
+    a.section = None
+
+    assert a.version > version
+
+
+@mark.xfail(strict=True, raises=TypeError)
+def test_Element_loads_read_only():
+    """
+    Test that the loads on an ``Element`` cannot be replaced.
+    """
+
+    a = Element.empty_element()
+
+    a.loads[1] = LoadCase()
+
+    assert True
+
+
+def test_Element_set_loads():
+    """
+    Test replacing the loads in a load case.
+    """
+
+    a = Element.empty_element(length=1.0)
+
+    version = a.version
+    section_version = a.section_version
+
+    l = LoadCase.constant_load(N=1.0)
+
+    a.set_loads(load_case=0, loads=l)
+
+    assert a.loads[0] is l
+    assert a.version > version
+    assert a.section_version == section_version
+
+
+@mark.xfail(strict=True, raises=ElementCaseError)
+def test_Element_set_loads_error():
+    """
+    Test that only existing load cases can be replaced.
+    """
+
+    a = Element.empty_element(length=1.0)
+
+    a.set_loads(load_case=1, loads=LoadCase())
+
+    assert True
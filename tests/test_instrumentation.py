@@ -0,0 +1,67 @@
+"""
+Contains tests for the Instrumentation class.
+"""
+
+from beamdesign.utility.instrumentation import Instrumentation
+
+
+def test_Instrumentation_disabled():
+    """
+    A disabled Instrumentation object should record nothing.
+    """
+
+    i = Instrumentation()
+
+    with i.timer("stage"):
+        pass
+
+    i.count("counter")
+    i.cache("cache", hit=True)
+
+    assert i.report() == {"timers": {}, "counters": {}, "caches": {}}
+
+
+def test_Instrumentation_report():
+    """
+    Test the report of an enabled Instrumentation object.
+    """
+
+    i = Instrumentation(enabled=True)
+
+    for _ in range(3):
+        with i.timer("stage"):
+            pass
+
+    i.count("counter")
+    i.count("counter", 4)
+    i.cache("cache", hit=False)
+    i.cache("cache", hit=True)
+    i.cache("cache", hit=True)
+    i.cache("cache", hit=True)
+
+    report = i.report()
+
+    assert report["timers"]["stage"]["calls"] == 3
+    assert report["timers"]["stage"]["total"] >= 0.0
+    assert report["counters"] == {"counter": 5}
+    assert report["caches"] == {"cache": {"hits": 3, "misses": 1, "hit_rate": 0.75}}
+
+    i.reset()
+
+    assert i.report() == {"timers": {}, "counters": {}, "caches": {}}
+
+
+def test_Instrumentation_timer_error():
+    """
+    A stage that raises an error should still be timed.
+    """
+
+    i = Instrumentation(enabled=True)
+
+    try:
+        with i.timer("stage"):
+            raise ValueError()
+    except ValueError:
+        pass
+
+    assert i.report()["timers"]["stage"]["calls"] == 1
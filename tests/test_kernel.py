@@ -0,0 +1,232 @@
+"""
+Tests for the CheckKernel class and the generic utilisation driver in CodeCheck.
+"""
+
+from math import isclose, pi
+
+from pytest import approx, mark
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.codecheck.as4100.as4100 import AS4100
+from beamdesign.codecheck.kernel import (
+    CheckKernel,
+    iterative_utilisation,
+    ratio_utilisation,
+)
+from beamdesign.const import LoadComponents
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+from beamdesign.materials.material import Material
+from beamdesign.sections.circle import Circle
+from beamdesign.utility.exceptions import SectionOnlyError
+
+as3678_250 = Material.load_material(name="AS3678-2016-250")
+
+
+def make_check():
+    """
+    Helper function to build an AS4100 object over a beam of 2x elements, with 2x load
+    cases.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    e1 = Element(
+        loads={
+            1: LoadCase.constant_load(N=100000, MX=1000),
+            2: LoadCase.constant_load(N=-50000, MX=-4000),
+        },
+        length=1.0,
+        section=s,
+    )
+    e2 = Element(
+        loads={
+            1: LoadCase.constant_load(N=-20000, MX=2000),
+            2: LoadCase.constant_load(N=60000, MX=3000),
+        },
+        length=1.0,
+        section=s,
+    )
+
+    return AS4100(beam=Beam(elements=[e1, e2]), φ_steel=0.9, αu=0.85, kt=1.0)
+
+
+def test_ratio_utilisation():
+    """
+    Test the ratio_utilisation function, including that demands <= 0 have 0
+    utilisation.
+    """
+
+    demand = np.array([[1.0, 2.0, -1.0], [0.0, 4.0, 6.0]])
+    capacity = np.array([2.0, 4.0, 3.0])
+
+    expected = np.array([[0.5, 0.5, 0.0], [0.0, 1.0, 2.0]])
+
+    assert np.allclose(ratio_utilisation(demand, capacity), expected)
+
+
+def test_iterative_utilisation():
+    """
+    With a constant capacity the iterative solution should match the direct ratio.
+    """
+
+    demand = np.array([[1.0, 2.0, -1.0], [0.0, 4.0, 6.0]])
+    capacity = np.array([2.0, 4.0, 3.0])
+
+    assert np.allclose(
+        iterative_utilisation(demand, capacity), ratio_utilisation(demand, capacity)
+    )
+
+
+def test_CheckKernel_components():
+    """
+    Test that a single component is stored as a list.
+    """
+
+    k = CheckKernel(
+        name="test",
+        component=LoadComponents.N,
+        demand=lambda loads: loads[..., 0],
+        capacity=lambda: np.ones(1),
+    )
+
+    assert k.components == [LoadComponents.N]
+    assert k.utilisation is ratio_utilisation
+
+
+def test_kernel_utilisation_tension():
+    """
+    The tension kernel run through the generic driver should match the tension check.
+    """
+
+    a = make_check()
+
+    capacity = 0.9 * 250e6 * pi * 0.02 ** 2
+
+    u = a.kernel_utilisation(kernel=a.tension_kernel)
+
+    assert isclose(u, 100000 / capacity)
+    assert u.governing_load_case == 1
+    assert np.allclose(u.utilisation, a.tension_utilisation().utilisation)
+
+
+def test_kernel_utilisation_custom():
+    """
+    Test a new check made from a custom kernel, using multiple load components.
+    """
+
+    a = make_check()
+
+    def demand(loads):
+        # a simple compression + bending interaction.
+        return np.maximum(-loads[..., 0], 0.0) / 100000 + np.abs(loads[..., 1]) / 10000
+
+    k = CheckKernel(
+        name="interaction",
+        component=[LoadComponents.N, LoadComponents.MX],
+        demand=demand,
+        capacity=lambda: np.array([1.0, 0.5]),
+    )
+
+    u = a.kernel_utilisation(kernel=k)
+
+    # load case 1: element 1 has 0.1 / 1.0, element 2 has 0.4 / 0.5.
+    # load case 2: element 1 has 0.9 / 1.0, element 2 has 0.3 / 0.5.
+    # at the element boundary the capacity of element 2 governs both rows, so load
+    # case 2 reaches 0.9 / 0.5.
+    assert isclose(u, 1.8)
+    assert u.case_max == approx({1: 0.8, 2: 1.8})
+    assert u.governing_load_case == 2
+    assert isclose(u.governing_position, 1.0)
+
+    positions, utilisation = a.kernel_utilisation_matrix(
+        kernel=k, load_case=1, position=[0.5, 1.0, 1.5]
+    )
+
+    # at the element boundary the minimum capacity of both elements is used.
+    assert np.allclose(positions, [0.5, 1.0, 1.0, 1.5])
+    assert np.allclose(utilisation, [[0.1, 0.2, 0.8, 0.8]])
+
+
+def test_kernel_utilisation_stations_only():
+    """
+    Convex checks should only be assessed at the load stations if stations_only is
+    set, and give the same maximum as the default grid.
+    """
+
+    a = make_check()
+    a.stations_only = True
+
+    capacity = 0.9 * 250e6 * pi * 0.02 ** 2
+
+    u = a.kernel_utilisation(kernel=a.tension_kernel)
+
+    assert isclose(u, 100000 / capacity)
+    assert np.allclose(u.positions, [0.0, 1.0, 1.0, 2.0])
+
+
+def test_kernel_utilisation_stations_only_not_convex():
+    """
+    Checks that are not convex should still be assessed at the equally spaced points,
+    as their maximum may be between the stations.
+    """
+
+    a = make_check()
+    a.stations_only = True
+
+    k = CheckKernel(
+        name="not_convex",
+        component=LoadComponents.N,
+        demand=lambda loads: np.ones(loads.shape[:-1]),
+        capacity=lambda: np.ones(2),
+    )
+
+    u = a.kernel_utilisation(kernel=k)
+
+    assert u.positions.shape[0] > 4
+    assert np.allclose(u.positions, a.kernel_utilisation_matrix(kernel=k)[0])
+
+
+def test_kernel_utilisation_stations_only_discontinuity():
+    """
+    Assessing the stations only should find the load approaching a discontinuity on an
+    element with a length that is not exactly representable in binary.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+    l = LoadCase(
+        loads=[
+            [0.0, 0, 0, 0, 0, 0, 0],
+            [0.2, 0, 0, 100000, 0, 0, 0],
+            [0.2, 0, 0, 0, 0, 0, 0],
+            [1.0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+
+    b = Beam(elements=Element(loads={1: l}, length=1.5, section=s))
+    a = AS4100(beam=b, φ_steel=0.9, αu=0.85, kt=1.0)
+
+    expected = a.tension_utilisation()
+
+    a.stations_only = True
+
+    actual = a.tension_utilisation()
+
+    assert isclose(actual, 100000 / (0.9 * 250e6 * pi * 0.02 ** 2))
+    assert isclose(actual, expected)
+    assert isclose(actual.governing_position, 0.3)
+
+
+@mark.xfail(strict=True, raises=SectionOnlyError)
+def test_kernel_utilisation_matrix_section_only():
+    """
+    Section based CodeCheck objects cannot run the utilisation driver.
+    """
+
+    a = AS4100(
+        section=Circle(radius=0.02, material=as3678_250), φ_steel=0.9, αu=0.85, kt=1.0
+    )
+
+    a.kernel_utilisation_matrix(kernel=a.tension_kernel)
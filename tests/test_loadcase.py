@@ -758,3 +758,66 @@ def test_constant_load():
     actual = a.get_load(position=pos)
 
     assert np.allclose(expected, actual)
+
+
+def test_get_load_rows():
+    """
+    Test the vectorised get_load_rows method, including the occurrence parameter at
+    a load discontinuity.
+    """
+
+    a = LoadCase(
+        loads=[
+            [0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+            [0.5, 2.0, 2.0, 2.0, 2.0, 2.0, 2.0],
+            [0.5, 3.0, 3.0, 3.0, 3.0, 3.0, 3.0],
+            [1.0, 4.0, 4.0, 4.0, 4.0, 4.0, 4.0],
+        ]
+    )
+
+    position = np.array([0.25, 0.5, 0.5, 0.5, 0.75, 0.0])
+    occurrence = np.array([0, 0, 1, 2, 0, 0])
+
+    expected = np.repeat([[1.5], [2.0], [3.0], [3.0], [3.5], [1.0]], 6, axis=1)
+    actual = a.get_load_rows(position=position, occurrence=occurrence)
+
+    assert np.allclose(expected, actual)
+
+    assert np.array_equal(a.position_counts(position=position), [0, 2, 2, 2, 0, 1])
+
+
+def test_get_load_rows_empty():
+    """
+    Test that get_load_rows returns 0.0 loads on an empty load case.
+    """
+
+    a = LoadCase()
+
+    assert np.allclose(a.get_load_rows(position=np.array([0.0, 0.5])), 0.0)
+
+
+@pytest.mark.xfail(strict=True, raises=ValueError)
+def test_LoadCase_loads_read_only():
+    """
+    Test that the loads stored in a LoadCase cannot be modified in place.
+    """
+
+    a = LoadCase.constant_load(N=1.0)
+
+    a.loads[0, 3] = 2.0
+
+    assert True
+
+
+def test_LoadCase_content_hash():
+    """
+    Test that LoadCases with identical loads have identical hashes.
+    """
+
+    a = LoadCase.constant_load(N=1.0)
+    b = LoadCase.constant_load(N=1.0)
+    c = LoadCase.constant_load(N=2.0)
+
+    assert a.content_hash == b.content_hash
+    assert a.content_hash != c.content_hash
+    assert LoadCase().content_hash == LoadCase().content_hash
@@ -0,0 +1,81 @@
+"""
+Contains tests for the range query data structures.
+"""
+
+from pytest import mark
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+from beamdesign.segment import LoadRangeIndex
+from beamdesign.utility.rangequery import SparseTable
+
+
+@mark.parametrize("size", [1, 2, 3, 7, 8, 33])
+def test_SparseTable_max(size):
+    """
+    Test the SparseTable max query against a brute force max over every range.
+    """
+
+    rng = np.random.default_rng(seed=size)
+    values = rng.normal(size=(2, size))
+
+    table = SparseTable(values=values, ufunc=np.maximum)
+
+    starts, stops = np.triu_indices(size + 1, k=1)
+
+    expected = np.array(
+        [[row[s:e].max() for s, e in zip(starts, stops)] for row in values]
+    )
+    actual = table.query(start=starts, stop=stops)
+
+    assert np.allclose(actual, expected)
+
+
+def test_SparseTable_min():
+    """
+    Test the SparseTable min query.
+    """
+
+    table = SparseTable(values=[3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0], ufunc=np.minimum)
+
+    assert np.allclose(table.query(start=[0, 2, 4, 6], stop=[7, 3, 6, 7]), [1, 4, 5, 2])
+
+
+def test_SparseTable_empty_range():
+    """
+    Test that an empty range returns the identity of the ufunc.
+    """
+
+    table = SparseTable(values=[3.0, 1.0, 4.0], ufunc=np.maximum)
+
+    assert np.all(table.query(start=[1, 2], stop=[1, 0]) == -np.inf)
+
+
+def test_LoadRangeIndex_non_dyadic_length():
+    """
+    Range queries should include the loads approaching a discontinuity when the
+    element length is not exactly representable in binary.
+    """
+
+    l = LoadCase(
+        loads=[
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.2, 0.0, 0.0, 0.0, 13.63, 0.0, 0.0],
+            [0.2, 0.0, 0.0, 0.0, -5.0, 0.0, 0.0],
+            [0.7, 0.0, 0.0, 0.0, 10.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    e1 = Element(loads={0: LoadCase.constant_load(MX=1.0)}, length=0.3)
+    e2 = Element(loads={0: l}, length=1.5)
+
+    i = LoadRangeIndex(beam=Beam(elements=[e1, e2]), component="MX")
+
+    # the discontinuity is at 0.3 + 0.2 * 1.5 = 0.6
+    assert np.allclose(i.max(start=0.0, end=1.8), [[13.63]])
+    assert np.allclose(i.max(start=0.5, end=0.6), [[13.63]])
+    assert np.allclose(i.min(start=0.6, end=1.8), [[-5.0]])
@@ -0,0 +1,186 @@
+"""
+Contains tests for the ResultCache class.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from math import isclose
+
+from beamdesign.beam import Beam
+from beamdesign.codecheck.as4100.as4100 import AS4100
+from beamdesign.codecheck.batch import check_all
+from beamdesign.codecheck.resultcache import ResultCache
+from beamdesign.element import Element
+from beamdesign.materials.material import Material
+from beamdesign.sections.circle import Circle
+
+as3678_250 = Material.load_material(name="AS3678-2016-250")
+
+
+def make_beam(N):
+    """
+    Helper function to make a beam with a constant tension load.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    return Beam(elements=Element.constant_load_element(length=1.0, section=s, N=N))
+
+
+def test_ResultCache_put_get(tmp_path):
+    """
+    Test storing & retrieving results, including from a new ResultCache object.
+    """
+
+    cache = ResultCache(path=tmp_path)
+
+    assert cache.get("a") is None
+    assert cache.get("a", default=1) == 1
+
+    cache.put("a", {"u": 0.5})
+
+    assert "a" in cache
+    assert len(cache) == 1
+    assert cache.size > 0
+    assert cache.get("a") == {"u": 0.5}
+
+    cache = ResultCache(path=tmp_path)
+
+    assert cache.get("a") == {"u": 0.5}
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_ResultCache_eviction(tmp_path):
+    """
+    Test that the least recently used results are evicted when the cache is full.
+    """
+
+    cache = ResultCache(path=tmp_path)
+    cache.put("a", 0.0)
+
+    size = cache.size
+
+    cache = ResultCache(path=tmp_path, max_bytes=2 * size)
+
+    cache.put("b", 1.0)
+
+    # make "a" the oldest result, but then use it so that "b" is evicted instead.
+    os.utime(tmp_path / "a.pkl", (0, 0))
+    os.utime(tmp_path / "b.pkl", (1, 1))
+    cache.get("a")
+
+    cache.put("c", 2.0)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.size <= cache.max_bytes
+
+
+def test_ResultCache_key(tmp_path):
+    """
+    Test that the key depends on the beam, the code parameters and the check.
+    """
+
+    cache = ResultCache(path=tmp_path)
+
+    def key(beam, check="tension_utilisation", **kwargs):
+        a = AS4100.default_AS4100(beam=beam)
+
+        for k, v in kwargs.items():
+            setattr(a, k, v)
+
+        return cache.key(code_check=a, check=check)
+
+    base = key(make_beam(1000))
+
+    assert key(make_beam(1000)) == base
+    assert key(make_beam(2000)) != base
+    assert key(make_beam(1000), φ_steel=0.8) != base
+    assert key(make_beam(1000), kt=0.85) != base
+    assert key(make_beam(1000), assessment_points=11) != base
+    assert key(make_beam(1000), check="tension_capacity") != base
+
+    # sections are mutable, so the key must reflect in-place changes.
+    b = make_beam(1000)
+    b.elements[0].section.radius = 0.03
+
+    assert key(b) != base
+
+
+def test_ResultCache_check(tmp_path):
+    """
+    Test that check only calculates a result that is not already stored.
+    """
+
+    cache = ResultCache(path=tmp_path)
+
+    a = AS4100.default_AS4100(beam=make_beam(1000))
+
+    u = cache.check(code_check=a, check="tension_utilisation")
+
+    assert len(cache) == 1
+    assert isclose(u, a.tension_utilisation())
+
+    a.tension_utilisation = None  # any further call would fail.
+
+    assert isclose(cache.check(code_check=a, check="tension_utilisation"), u)
+
+
+def test_check_all_cache(tmp_path):
+    """
+    Test that re-running check_all with a cache only re-checks the changed beams.
+    """
+
+    cache = ResultCache(path=tmp_path)
+
+    beams = [make_beam(1000 * (i + 1)) for i in range(4)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = list(check_all(beams, executor=executor, chunk_cost=1, cache=cache))
+
+    assert len(cache) == 4
+
+    checked = []
+
+    def code(*, beam, **kwargs):
+        a = AS4100(beam=beam, **kwargs)
+        original = a.tension_utilisation
+
+        def tension_utilisation(**check_kwargs):
+            checked.append(beam.elements[0].loads[0].loads[0, 3])
+            return original(**check_kwargs)
+
+        a.tension_utilisation = tension_utilisation
+
+        return a
+
+    beams[2] = make_beam(9000)
+
+    code_kwargs = AS4100.get_defaults()["defaults"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        second = list(
+            check_all(
+                beams,
+                code=code,
+                code_kwargs=code_kwargs,
+                executor=executor,
+                chunk_cost=1,
+                cache=cache,
+            )
+        )
+
+    assert checked == [9000]
+    assert [r.index for r in second] == [0, 1, 2, 3]
+    assert [isclose(a.result, b.result) for a, b in zip(first, second)] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert len(cache) == 5
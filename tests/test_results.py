@@ -0,0 +1,138 @@
+"""
+Contains tests for the ResultStore class.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from math import isclose
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.codecheck.batch import check_all
+from beamdesign.codecheck.results import ResultStore
+from beamdesign.codecheck.utilisation import Utilisation
+from beamdesign.element import Element
+from beamdesign.materials.material import Material
+from beamdesign.sections.circle import Circle
+
+as3678_250 = Material.load_material(name="AS3678-2016-250")
+
+
+def make_utilisation(scale):
+    """
+    Helper function to make a Utilisation object with 2x load cases.
+    """
+
+    return Utilisation(
+        load_cases=[1, 2],
+        positions=np.array([0.0, 0.5, 1.0]),
+        utilisation=scale * np.array([[0.1, 0.3, 0.2], [0.4, 0.0, 0.1]]),
+    )
+
+
+def test_ResultStore_add():
+    """
+    Test that a Utilisation is stored as 1x row per load case.
+    """
+
+    with ResultStore(path=":memory:") as store:
+
+        store.add(beam="B1", check="tension", result=make_utilisation(1.0))
+
+        results = store.beam_results(beam="B1")
+
+        assert len(results) == 2
+        assert results[0][:3] == ("tension", 2, 0.0)
+        assert isclose(results[0][3], 0.4)
+        assert results[1][:3] == ("tension", 1, 0.5)
+        assert isclose(results[1][3], 0.3)
+
+
+def test_ResultStore_batching(tmp_path):
+    """
+    Test that rows are written in batches, and that the results persist in the
+    database file.
+    """
+
+    path = tmp_path / "results.db"
+
+    store = ResultStore(path=path, batch_size=4)
+
+    store.add(beam=1, check="tension", result=make_utilisation(1.0))
+
+    assert len(store._buffer) == 2
+
+    store.add(beam=2, check="tension", result=make_utilisation(2.0))
+
+    assert len(store._buffer) == 0
+
+    store.add(beam=3, check="shear", result=0.5)
+    store.close()
+
+    with ResultStore(path=path) as store:
+
+        assert len(store.beam_results(beam=1)) == 2
+        assert store.beam_results(beam=3) == [("shear", None, None, 0.5)]
+
+
+def test_ResultStore_worst():
+    """
+    Test the query for the N worst members.
+    """
+
+    with ResultStore(path=":memory:", batch_size=3) as store:
+
+        for i, scale in enumerate([1.0, 3.0, 2.0, 0.5]):
+            store.add(beam=f"B{i}", check="tension", result=make_utilisation(scale))
+
+        store.add(beam="B3", check="shear", result=5.0)
+
+        worst = store.worst(n=2, check="tension")
+
+        assert [w[0] for w in worst] == ["B1", "B2"]
+        assert worst[0][1:4] == ("tension", 2, 0.0)
+        assert isclose(worst[0][4], 1.2)
+
+        worst = store.worst(n=1)
+
+        assert worst[0][:2] == ("B3", "shear")
+        assert isclose(worst[0][4], 5.0)
+
+
+def test_ResultStore_batch_results():
+    """
+    Test streaming the results of check_all into the store, including a failed check.
+    """
+
+    s = Circle(radius=0.02, material=as3678_250)
+
+    beams = [
+        Beam(elements=Element.constant_load_element(length=1.0, section=s, N=1000 * i))
+        for i in range(4)
+    ]
+    beams[2] = Beam(elements=Element.constant_load_element(length=1.0, N=1000))
+
+    with ResultStore(path=":memory:") as store:
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            failed = store.add_batch_results(
+                check_all(beams, executor=executor, chunk_cost=1), check="tension"
+            )
+
+        assert [f.key for f in failed] == [2]
+        assert [e[0] for e in store.errors()] == [2]
+        assert [w[0] for w in store.worst(n=4)] == [3, 1, 0]
+        assert store.beam_results(beam=2) == []
+
+
+def test_ResultStore_numpy_keys():
+    """
+    numpy scalar keys should be stored as python values.
+    """
+
+    with ResultStore(path=":memory:") as store:
+
+        store.add(beam=np.int64(7), check="tension", result=make_utilisation(1.0))
+
+        assert store.worst(n=1)[0][0] == 7
+        assert isinstance(store.worst(n=1)[0][0], int)
@@ -0,0 +1,281 @@
+"""
+Contains tests for the BeamSegments and LoadRangeIndex classes.
+"""
+
+from pytest import mark
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.const import LoadComponents
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+from beamdesign.segment import BeamSegments, LoadRangeIndex
+from beamdesign.utility.exceptions import InvalidPositionError, PositionNotInBeamError
+
+
+def make_beam():
+    """
+    Helper function to build a 3m long beam of 2x elements, with 2x load cases.
+
+    Load case 1 has a linearly varying moment with a discontinuity at 1.0m. Load case 2
+    has constant loads.
+    """
+
+    l1_1 = LoadCase(
+        loads=[
+            [0.0, 0.0, 0.0, -10.0, 0.0, 0.0, 0.0],
+            [0.5, 0.0, 0.0, -10.0, 10.0, 0.0, 0.0],
+            [0.5, 0.0, 0.0, -10.0, -20.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, -10.0, 0.0, 0.0, 0.0],
+        ]
+    )
+    l1_2 = LoadCase(
+        loads=[
+            [0.0, 0.0, 0.0, 5.0, 0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 5.0, 40.0, 0.0, 0.0],
+        ]
+    )
+    l2_1 = LoadCase.constant_load(N=20.0, MX=1.0)
+    l2_2 = LoadCase.constant_load(N=30.0, MX=2.0)
+
+    e1 = Element(loads={1: l1_1, 2: l2_1}, length=2.0)
+    e2 = Element(loads={1: l1_2, 2: l2_2}, length=1.0)
+
+    return Beam(elements=[e1, e2])
+
+
+def test_BeamSegments_no_restraints():
+    """
+    Test a BeamSegments object without intermediate restraints.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b)
+
+    assert s.no_segments == 1
+    assert np.allclose(s.segment_ends, [[0.0, 3.0]])
+    assert np.allclose(s.lengths, [3.0])
+    assert np.array_equal(s.element_ranges, [[0, 1]])
+    assert s.load_cases == [1, 2]
+
+
+def test_BeamSegments_ranges():
+    """
+    Test the element ranges of a BeamSegments object with intermediate restraints.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[1.0, 2.0])
+
+    assert s.no_segments == 3
+    assert np.allclose(s.restraints, [0.0, 1.0, 2.0, 3.0])
+    assert np.array_equal(s.element_ranges, [[0, 0], [0, 0], [1, 1]])
+
+    s = BeamSegments(beam=b, restraints=1.5)
+
+    assert np.array_equal(s.element_ranges, [[0, 0], [0, 1]])
+
+
+def test_BeamSegments_max_moment():
+    """
+    Test the max moment in each segment.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[1.0, 2.0])
+
+    expected = np.array([[20.0, 20.0, 40.0], [1.0, 1.0, 2.0]])
+
+    assert np.allclose(s.max_moment(), expected)
+
+    # note that both sides of the discontinuity at the restraint are included in the
+    # segments either side of it.
+    expected = np.array([[10.0, 10.0, 40.0], [1.0, 1.0, 2.0]])
+
+    assert np.allclose(s.max_load(component="MX", absolute=False), expected)
+
+    expected = np.array([[-20.0, -20.0, 0.0], [1.0, 1.0, 2.0]])
+
+    assert np.allclose(s.min_load(component="MX"), expected)
+
+
+def test_BeamSegments_quarter_point_moments():
+    """
+    Test the quarter point moments in each segment.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[2.0])
+
+    assert np.allclose(s.quarter_points, [[0.5, 1.0, 1.5], [2.25, 2.5, 2.75]])
+
+    expected = np.array(
+        [
+            [[5.0, 20.0, 10.0], [10.0, 20.0, 30.0]],
+            [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]],
+        ]
+    )
+
+    assert np.allclose(s.quarter_point_moments(), expected)
+
+
+def test_BeamSegments_max_axial():
+    """
+    Test the max axial load in each segment.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[2.0])
+
+    assert np.allclose(s.max_axial(), [[10.0, 5.0], [20.0, 30.0]])
+    assert np.allclose(s.max_axial(absolute=False), [[-10.0, 5.0], [20.0, 30.0]])
+
+
+def make_non_dyadic_beam():
+    """
+    Helper function to build a beam of 2x elements with lengths that are not exactly
+    representable in binary, so that converting real positions back to local positions
+    introduces rounding errors. The 2nd element has a spike in the axial load & moment
+    approaching a discontinuity at a local position of 0.2.
+    """
+
+    l2 = LoadCase(
+        loads=[
+            [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [0.2, 0.0, 0.0, 1e5, 30.0, 0.0, 0.0],
+            [0.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    e1 = Element(loads={0: LoadCase.constant_load(N=10.0, MX=5.0)}, length=0.7)
+    e2 = Element(loads={0: l2}, length=1.5)
+
+    return Beam(elements=[e1, e2])
+
+
+def test_BeamSegments_non_dyadic_length():
+    """
+    Loads at a discontinuity should not be lost when the element length is not exactly
+    representable in binary.
+    """
+
+    b = make_non_dyadic_beam()
+
+    s = BeamSegments(beam=b)
+
+    assert np.allclose(s.max_axial(), [[1e5]])
+    assert np.allclose(s.max_moment(), [[30.0]])
+
+    # the discontinuity is at 0.7 + 0.2 * 1.5 = 1.0, so the restraint at 0.85 is
+    # halfway up the spike.
+    s = BeamSegments(beam=b, restraints=[0.85])
+
+    assert np.allclose(s.max_axial(), [[5e4, 1e5]])
+
+
+def test_BeamSegments_load_cases():
+    """
+    Test that only the requested load cases are returned.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[2.0], load_cases=[2])
+
+    assert np.allclose(s.max_axial(), [[20.0, 30.0]])
+
+
+def test_BeamSegments_zero_length_element():
+    """
+    Test that a zero length element at a restraint is included in the segments either
+    side of the restraint.
+    """
+
+    e1 = Element.constant_load_element(length=1.0, N=1.0)
+    e2 = Element.constant_load_element(length=0.0, N=5.0)
+    e3 = Element.constant_load_element(length=1.0, N=2.0)
+
+    b = Beam(elements=[e1, e2, e3])
+    s = BeamSegments(beam=b, restraints=[1.0])
+
+    assert np.array_equal(s.element_ranges, [[0, 1], [1, 2]])
+    assert np.allclose(s.max_axial(), [[5.0, 5.0]])
+
+
+@mark.parametrize(
+    "position, expected", [(0.0, 0), (0.5, 0), (1.0, 1), (2.5, 2), (3.0, 2)]
+)
+def test_BeamSegments_segment_at(position, expected):
+    """
+    Test the segment_at method.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[1.0, 2.0])
+
+    assert s.segment_at(position=position) == expected
+
+
+@mark.xfail(strict=True, raises=PositionNotInBeamError)
+def test_BeamSegments_restraint_error():
+    """
+    Test that restraints outside the beam raise an error.
+    """
+
+    b = make_beam()
+    s = BeamSegments(beam=b, restraints=[4.0])
+
+    assert True
+
+
+def test_LoadRangeIndex_max():
+    """
+    Test the LoadRangeIndex max, min & max_abs queries, including interpolated ends.
+    """
+
+    b = make_beam()
+    i = LoadRangeIndex(beam=b, component="MX")
+
+    start = [0.0, 0.5, 0.0, 2.5, 1.0]
+    end = [0.5, 1.5, 3.0, 2.75, 1.0]
+
+    expected = np.array([[5.0, 10.0, 40.0, 30.0, 10.0], [1.0, 1.0, 2.0, 2.0, 1.0]])
+
+    assert np.allclose(i.max(start=start, end=end), expected)
+
+    expected = np.array([[0.0, -20.0, -20.0, 20.0, -20.0], [1.0, 1.0, 1.0, 2.0, 1.0]])
+
+    assert np.allclose(i.min(start=start, end=end), expected)
+
+    expected = np.array([[5.0, 20.0, 40.0, 30.0, 20.0], [1.0, 1.0, 2.0, 2.0, 1.0]])
+
+    assert np.allclose(i.max_abs(start=start, end=end), expected)
+
+
+def test_LoadRangeIndex_against_BeamSegments():
+    """
+    The max absolute moment over each segment should match the BeamSegments object.
+    """
+
+    b = make_beam()
+    i = LoadRangeIndex(beam=b, component=LoadComponents.MX)
+    s = BeamSegments(beam=b, restraints=[0.3, 1.7, 2.2])
+
+    ends = s.segment_ends
+
+    assert np.allclose(i.max_abs(start=ends[:, 0], end=ends[:, 1]), s.max_moment())
+
+
+@mark.xfail(strict=True, raises=InvalidPositionError)
+def test_LoadRangeIndex_range_error():
+    """
+    Test that a range with the start after the end raises an error.
+    """
+
+    b = make_beam()
+    i = LoadRangeIndex(beam=b, component="N")
+
+    i.max(start=2.0, end=1.0)
+
+    assert True
@@ -0,0 +1,191 @@
+"""
+Contains tests for the SharedBeams class.
+"""
+
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from beamdesign.beam import Beam
+from beamdesign.element import Element
+from beamdesign.loadcase import LoadCase
+from beamdesign import sharedmemory
+from beamdesign.sharedmemory import SharedBeams, acquire, release
+from tests.test_segment import make_beam
+
+
+def max_moment(handle):
+    """
+    Helper function to be run in a worker process.
+    """
+
+    beam = handle.beam()
+
+    try:
+        return beam.get_loads(load_case=1, position=1.0, component="MX")[:, 1].tolist()
+    finally:
+        release(name=handle.name)
+
+
+def test_SharedBeams():
+    """
+    Test that a ``Beam`` rebuilt from a handle has the same loads as the original.
+    """
+
+    beams = {"a": make_beam(), "b": make_beam()}
+
+    with SharedBeams(beams=beams) as shared:
+
+        assert set(shared.handles) == {"a", "b"}
+
+        original = beams["b"]
+        rebuilt = shared.handles["b"].beam()
+
+        assert rebuilt.length == original.length
+        assert rebuilt.load_cases == original.load_cases
+
+        for e_orig, e_new in zip(original.elements, rebuilt.elements):
+            for case in original.load_cases:
+                assert np.array_equal(e_new.loads[case].loads, e_orig.loads[case].loads)
+                assert not e_new.loads[case].loads.flags.writeable
+
+
+def test_SharedBeams_empty_loads():
+    """
+    Test sharing a ``Beam`` with an empty ``LoadCase``.
+    """
+
+    e1 = Element(loads={0: LoadCase(), 1: LoadCase.constant_load(N=2.0)}, length=1.0)
+
+    with SharedBeams(beams=Beam(elements=e1)) as shared:
+
+        rebuilt = shared.handles[0].beam()
+
+        assert rebuilt.elements[0].loads[0].loads is None
+        assert np.array_equal(rebuilt.elements[0].loads[1].loads, e1.loads[1].loads)
+
+
+def test_SharedBeams_handle_size():
+    """
+    The pickled handle should not contain the load arrays.
+    """
+
+    loads = np.zeros((1000, 7))
+    loads[:, 0] = np.linspace(0.0, 1.0, 1000)
+
+    b = Beam(elements=Element(loads={0: LoadCase(loads=loads)}, length=1.0))
+
+    with SharedBeams(beams=b) as shared:
+
+        assert len(pickle.dumps(shared.handles[0])) < len(pickle.dumps(b)) / 10
+
+
+def test_SharedBeams_process_pool():
+    """
+    Test rebuilding ``Beam`` objects in worker processes.
+    """
+
+    beams = [make_beam() for _ in range(3)]
+
+    with SharedBeams(beams=beams) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(max_moment, shared.handles.values()))
+
+    assert results == [[10.0, -20.0]] * 3
+
+
+def test_acquire_release():
+    """
+    A block should stay attached until every task using it has released it.
+    """
+
+    with SharedBeams(beams=make_beam()) as shared:
+
+        handle = shared.handles[0]
+
+        acquire(name=handle.name)
+        acquire(name=handle.name)
+
+        beam = handle.beam()
+
+        release(name=handle.name)
+        release(name=handle.name)
+
+        # the block is still used by the rebuilt beam.
+        assert handle.name in sharedmemory._attached
+        assert np.array_equal(
+            beam.elements[0].loads[1].loads, make_beam().elements[0].loads[1].loads
+        )
+
+        del beam
+
+        release(name=handle.name)
+
+        assert handle.name not in sharedmemory._attached
+        assert handle.name not in sharedmemory._users
+
+
+def test_acquire_release_threads():
+    """
+    A block released by one thread should not be detached while another thread is
+    using a beam rebuilt from it, however acquire, beam & release interleave.
+    """
+
+    expected = make_beam().elements[0].loads[1].loads
+
+    with SharedBeams(beams=make_beam()) as shared:
+
+        handle = shared.handles[0]
+
+        # a fixed interleaving: thread 1 releases its last use of the block while
+        # thread 2 is using a beam rebuilt from it.
+        rebuilt = threading.Event()
+        released = threading.Event()
+
+        def first():
+            acquire(name=handle.name)
+            rebuilt.wait()
+            release(name=handle.name)
+            released.set()
+
+        def second():
+            beam = handle.beam()
+            rebuilt.set()
+            released.wait()
+
+            try:
+                return np.array_equal(beam.elements[0].loads[1].loads, expected)
+            finally:
+                release(name=handle.name)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            f1 = executor.submit(first)
+            f2 = executor.submit(second)
+
+            f1.result()
+            assert f2.result()
+
+        assert handle.name not in sharedmemory._attached
+
+        # many unordered interleavings.
+        def use(_):
+            acquire(name=handle.name)
+
+            try:
+                beam = handle.beam()
+
+                try:
+                    return np.array_equal(beam.elements[0].loads[1].loads, expected)
+                finally:
+                    release(name=handle.name)
+
+            finally:
+                release(name=handle.name)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert all(executor.map(use, range(200)))
+
+        assert handle.name not in sharedmemory._attached
+        assert handle.name not in sharedmemory._users
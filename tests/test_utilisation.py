@@ -0,0 +1,76 @@
+"""
+Contains tests for the Utilisation class.
+"""
+
+import pickle
+
+from pytest import mark
+
+import numpy as np
+
+from beamdesign.codecheck.utilisation import Utilisation
+
+
+def make_utilisation():
+    """
+    Helper function to build a Utilisation object with 2x load cases.
+    """
+
+    return Utilisation(
+        load_cases=[10, 20],
+        positions=[0.0, 0.5, 0.5, 1.0],
+        utilisation=[[0.1, 0.5, 0.7, 0.2], [0.3, 0.2, 0.9, 0.4]],
+    )
+
+
+def test_Utilisation_float():
+    """
+    Test that a Utilisation object behaves as a float equal to the max utilisation.
+    """
+
+    u = make_utilisation()
+
+    assert isinstance(u, float)
+    assert u == 0.9
+    assert u.max == 0.9
+    assert u < 1.0
+    assert u * 2 == 1.8
+
+
+def test_Utilisation_governing():
+    """
+    Test the governing load case & position.
+    """
+
+    u = make_utilisation()
+
+    assert u.governing_index == (1, 2)
+    assert u.governing_load_case == 20
+    assert u.governing_position == 0.5
+    assert u.case_max == {10: 0.7, 20: 0.9}
+    assert np.allclose(u.envelope, [0.3, 0.5, 0.9, 0.4])
+
+
+def test_Utilisation_pickle():
+    """
+    Test that a Utilisation object can be pickled (i.e. to return from a worker
+    process).
+    """
+
+    u = make_utilisation()
+    v = pickle.loads(pickle.dumps(u))
+
+    assert v == u
+    assert v.load_cases == u.load_cases
+    assert np.array_equal(v.utilisation, u.utilisation)
+
+
+@mark.xfail(strict=True, raises=ValueError)
+def test_Utilisation_shape_error():
+    """
+    Test that a utilisation array of the wrong shape raises an error.
+    """
+
+    Utilisation(load_cases=[1], positions=[0.0, 1.0], utilisation=[[1.0, 2.0, 3.0]])
+
+    assert True